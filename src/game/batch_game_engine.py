@@ -0,0 +1,439 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Type
+
+import numpy as np
+
+from src.game.bulk_card_dealer import BulkDeal
+from src.game.mission_rules import (
+    MissionRule,
+    NeverWinWithNumberRule,
+    PlayerHasToWinCardRule,
+    PlayerShouldNeverWinRule,
+    WinOnceWithNumberRule,
+    WinWithAllTheseCardsRule,
+)
+from src.model.card import ALL_CARDS, COLOR_TYPES, CardsOperation, CardType
+from src.model.level_definition import MissionType
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import Player
+
+PENDING = 0
+SATISFIED = 1
+BROKEN = 2
+NO_MISSION = 0
+
+_CARD_COUNT = len(ALL_CARDS)
+_ROCKET = len(COLOR_TYPES)
+_CARD_BITS = np.array([card.bit for card in ALL_CARDS], dtype=np.uint64)
+_CARD_NUMBERS = np.array([card.number for card in ALL_CARDS], dtype=np.int8)
+_CARD_TYPES = np.array([card.id // 9 for card in ALL_CARDS], dtype=np.int8)
+_TYPE_MASKS = np.array([
+    CardsOperation.get_card_set_by_type(card_type).mask
+    for card_type in COLOR_TYPES + (CardType.ROCKET,)
+], dtype=np.uint64)
+_ZERO = np.uint64(0)
+_MISSION_TYPES: Dict[Type[MissionRule], MissionType] = {
+    PlayerHasToWinCardRule: MissionType.PLAYER_HAS_TO_WIN_CARD,
+    NeverWinWithNumberRule: MissionType.NEVER_WIN_WITH_NUMBER,
+    WinOnceWithNumberRule: MissionType.WIN_ONCE_WITH_NUMBER,
+    WinWithAllTheseCardsRule: MissionType.WIN_WITH_ALL_THESE_CARDS,
+    PlayerShouldNeverWinRule: MissionType.PLAYER_SHOULD_NEVER_WIN,
+}
+
+@dataclass(frozen=True, slots=True)
+class BatchMissions:
+    """
+    The missions of a batch of games, one column per mission slot.
+
+    Slot s of a game holds its s-th mission; games with fewer missions are padded
+    with NO_MISSION. The order constraints of each game are translated to slots:
+    a prerequisite mask has bit s for the mission of slot s.
+
+    Attributes:
+        kinds (np.ndarray): The MissionType value of each mission, or NO_MISSION (games x slots).
+        players (np.ndarray): The player index of player missions.
+        card_masks (np.ndarray): The cards of card missions, and the cards of the number
+            for NeverWinWithNumberRule (uint64).
+        numbers (np.ndarray): The number of number missions.
+        prerequisite_masks (np.ndarray): The slots that must be satisfied before each mission.
+        fixed_positions (np.ndarray): The 1-based position of each mission, or 0.
+        ranks (np.ndarray): The topological rank of each mission in its order constraints.
+    """
+    kinds: np.ndarray
+    players: np.ndarray
+    card_masks: np.ndarray
+    numbers: np.ndarray
+    prerequisite_masks: np.ndarray
+    fixed_positions: np.ndarray
+    ranks: np.ndarray
+
+    @classmethod
+    def of(
+            cls,
+            players: List[Player],
+            missions_by_game: Sequence[List[MissionRule]],
+            orders_by_game: Sequence[MissionsOrderData] | None = None) -> "BatchMissions":
+        """
+        Encodes the mission rules of each game.
+
+        Args:
+            players (List[Player]): The players, in the order of the deal.
+            missions_by_game (Sequence[List[MissionRule]]): The missions of each game.
+            orders_by_game (Sequence[MissionsOrderData] | None): The order constraints
+                of each game, or None if there are none.
+
+        Returns:
+            BatchMissions: The encoded missions.
+
+        Raises:
+            ValueError: If a mission rule cannot be simulated in batch.
+        """
+        games = len(missions_by_game)
+        slots = max((len(missions) for missions in missions_by_game), default=0)
+        shape = (games, slots)
+        encoded = cls(
+            kinds=np.zeros(shape, dtype=np.int8),
+            players=np.full(shape, -1, dtype=np.int8),
+            card_masks=np.zeros(shape, dtype=np.uint64),
+            numbers=np.zeros(shape, dtype=np.int8),
+            prerequisite_masks=np.zeros(shape, dtype=np.int64),
+            fixed_positions=np.zeros(shape, dtype=np.int8),
+            ranks=np.zeros(shape, dtype=np.int16),
+        )
+        player_indexes = {player: index for index, player in enumerate(players)}
+        for game_index, missions in enumerate(missions_by_game):
+            for slot, mission in enumerate(missions):
+                encoded.__encode_mission__(game_index, slot, mission, player_indexes)
+            if orders_by_game is not None:
+                encoded.__encode_order__(game_index, missions, orders_by_game[game_index])
+        return encoded
+
+    @property
+    def slot_count(self) -> int:
+        """The number of mission slots."""
+        return self.kinds.shape[1]
+
+    def __encode_mission__(
+            self,
+            game_index: int,
+            slot: int,
+            mission: MissionRule,
+            player_indexes: Dict[Player, int]):
+        if type(mission) not in _MISSION_TYPES:
+            raise ValueError(f"Unsupported mission rule: {type(mission).__name__}")
+        self.kinds[game_index, slot] = _MISSION_TYPES[type(mission)].value
+        if isinstance(mission, PlayerHasToWinCardRule):
+            self.players[game_index, slot] = player_indexes[mission.player]
+            self.card_masks[game_index, slot] = mission.card.bit
+        elif isinstance(mission, PlayerShouldNeverWinRule):
+            self.players[game_index, slot] = player_indexes[mission.player_that_should_never_win]
+        elif isinstance(mission, WinWithAllTheseCardsRule):
+            self.card_masks[game_index, slot] = mission.card_set_that_need_to_win.mask
+        else:
+            self.numbers[game_index, slot] = mission.number
+            self.card_masks[game_index, slot] = \
+                CardsOperation.get_card_set_by_number(mission.number).mask
+
+    def __encode_order__(
+            self,
+            game_index: int,
+            missions: List[MissionRule],
+            order: MissionsOrderData):
+        slots = {mission: slot for slot, mission in enumerate(missions)}
+        for slot, mission in enumerate(missions):
+            self.prerequisite_masks[game_index, slot] = sum(
+                1 << slots[before] for before in order.prerequisites.get(mission, ())
+            )
+            self.fixed_positions[game_index, slot] = order.fixed_positions.get(mission, 0)
+            self.ranks[game_index, slot] = order.ranks.get(mission, 0)
+
+@dataclass(frozen=True, slots=True)
+class BatchTurn:
+    """
+    What a policy sees when the next player of every running game must play.
+
+    Attributes:
+        game_indexes (np.ndarray): The games that are still running.
+        seats (np.ndarray): The index of the player to play, in each of those games.
+        hand_masks (np.ndarray): The hands of every player of those games (uint64).
+        legal_masks (np.ndarray): The cards the player is allowed to play (uint64).
+        trick_masks (np.ndarray): The cards already played on the trick (uint64).
+        winning_cards (np.ndarray): The card winning the trick so far, or -1.
+        round_index (int): The index of the round being played.
+    """
+    game_indexes: np.ndarray
+    seats: np.ndarray
+    hand_masks: np.ndarray
+    legal_masks: np.ndarray
+    trick_masks: np.ndarray
+    winning_cards: np.ndarray
+    round_index: int
+
+BatchPolicy = Callable[[BatchTurn], np.ndarray]
+
+def _legal_card_matrix(legal_masks: np.ndarray) -> np.ndarray:
+    # One row per game, one column per card id, True for the legal cards
+    shifts = np.arange(_CARD_COUNT, dtype=np.uint64)
+    return (legal_masks[:, None] >> shifts) & np.uint64(1) == 1
+
+class RandomBatchPolicy:
+    """Plays a uniformly random legal card in every game."""
+
+    def __init__(self, rng: np.random.Generator | None = None):
+        self.rng = rng or np.random.default_rng()
+
+    def __call__(self, turn: BatchTurn) -> np.ndarray:
+        legal = _legal_card_matrix(turn.legal_masks)
+        picks = self.rng.integers(0, legal.sum(axis=1))
+        return np.argmax(np.cumsum(legal, axis=1) > picks[:, None], axis=1)
+
+class LowestCardBatchPolicy:
+    """Plays the lowest legal card, keeping rockets for last, like LowestCardBotPlayerInterface."""
+
+    _KEYS = (
+        (_CARD_TYPES == _ROCKET) * 1024 + _CARD_NUMBERS.astype(np.int64) * 64
+        + np.arange(_CARD_COUNT)
+    )
+
+    def __call__(self, turn: BatchTurn) -> np.ndarray:
+        keys = np.where(_legal_card_matrix(turn.legal_masks), self._KEYS, np.iinfo(np.int64).max)
+        return np.argmin(keys, axis=1)
+
+@dataclass(frozen=True, slots=True)
+class BatchGameResult:
+    """
+    The outcome of a batch of games.
+
+    Attributes:
+        success (np.ndarray): True for the games where every mission was completed.
+        failed_slots (np.ndarray): The slot of the mission that failed each game, or -1.
+        rounds_played (np.ndarray): How many rounds each game lasted.
+        statuses (np.ndarray): The final status of every mission slot (PENDING, SATISFIED
+            or BROKEN; empty slots are SATISFIED).
+        moves (np.ndarray): The card ids played in each game, in playing order, -1 after the end.
+    """
+    success: np.ndarray
+    failed_slots: np.ndarray
+    rounds_played: np.ndarray
+    statuses: np.ndarray
+    moves: np.ndarray
+
+class BatchGameEngine:
+    """
+    Plays many games in lockstep on NumPy arrays, with the rules of GameEngine.
+
+    Every running game plays the same turn of the same round at each step: the
+    hands are bitmask columns, the trick winner follows RoundData (highest card of
+    the round type, any rocket beats a colour) and the winner leads the next round.
+    After each trick the missions are updated like their MissionTrackers, then
+    validated against the order constraints like GameEngine does, and the games
+    that are over drop out of the batch.
+
+    Attributes:
+        policy (BatchPolicy): Chooses the card of the player to play in every running game.
+    """
+    def __init__(self, policy: BatchPolicy):
+        self.policy = policy
+
+    def play(self, deal: BulkDeal, missions: BatchMissions) -> BatchGameResult:
+        """
+        Plays every game of a batch until its missions are complete or one fails.
+
+        Args:
+            deal (BulkDeal): The deal of each game; the captain leads the first round.
+            missions (BatchMissions): The missions of each game.
+
+        Returns:
+            BatchGameResult: The outcome of every game.
+
+        Raises:
+            ValueError: If the batch sizes differ or the policy plays an illegal card.
+        """
+        if missions.kinds.shape[0] != deal.game_count:
+            raise ValueError("Missions and deals must have the same number of games")
+        batch = _Batch(deal, missions)
+        round_count = _CARD_COUNT // deal.player_count
+        for round_index in range(round_count):
+            running = np.flatnonzero(batch.running)
+            if running.size == 0:
+                break
+            self.__play_round__(batch, running, round_index)
+            batch.complete_trick(running, round_index == round_count - 1)
+        return batch.to_result()
+
+    def __play_round__(self, batch: "_Batch", games: np.ndarray, round_index: int):
+        batch.start_trick(games)
+        player_count = batch.hands.shape[1]
+        leaders = batch.leaders[games]
+        for position in range(player_count):
+            seats = (leaders + position) % player_count
+            hands = batch.hands[games, seats]
+            following = hands & batch.type_masks[games]
+            legal_masks = np.where(following != _ZERO, following, hands)
+            cards = np.asarray(self.policy(BatchTurn(
+                games, seats, batch.hands[games], legal_masks, batch.trick_masks[games],
+                batch.winning_cards[games], round_index
+            )), dtype=np.int64)
+            if np.any(_CARD_BITS[cards] & legal_masks == _ZERO):
+                raise ValueError("Policy played an illegal card")
+            batch.play_cards(games, seats, cards, round_index * player_count + position)
+
+class _Batch: # pylint: disable=too-many-instance-attributes
+    # The state of every game of a batch, as arrays indexed by game
+    def __init__(self, deal: BulkDeal, missions: BatchMissions):
+        games = deal.game_count
+        self.missions = missions
+        self.hands = deal.hand_masks.copy()
+        self.leaders = deal.captain_indexes.astype(np.int64)
+        self.winners = np.zeros(games, dtype=np.int64)
+        self.winning_cards = np.full(games, -1, dtype=np.int64)
+        self.trick_masks = np.zeros(games, dtype=np.uint64)
+        self.type_masks = np.zeros(games, dtype=np.uint64)
+        self.statuses = np.where(missions.kinds == NO_MISSION, SATISFIED, PENDING).astype(np.int8)
+        self.tracked_masks = missions.card_masks.copy()
+        self.satisfied_masks = np.zeros(games, dtype=np.int64)
+        self.satisfied_counts = np.zeros(games, dtype=np.int64)
+        self.running = np.ones(games, dtype=bool)
+        self.failed_slots = np.full(games, -1, dtype=np.int64)
+        self.rounds_played = np.zeros(games, dtype=np.int64)
+        self.moves = np.full((games, _CARD_COUNT), -1, dtype=np.int8)
+
+    def start_trick(self, games: np.ndarray):
+        """Clears the trick of the given games."""
+        self.trick_masks[games] = _ZERO
+        self.type_masks[games] = _ZERO
+        self.winning_cards[games] = -1
+
+    def play_cards(self, games: np.ndarray, seats: np.ndarray, cards: np.ndarray, move: int):
+        """Plays one card in each game and updates the trick winner, like RoundData."""
+        bits = _CARD_BITS[cards]
+        self.hands[games, seats] &= ~bits
+        self.moves[games, move] = cards
+        self.trick_masks[games] |= bits
+
+        winning_cards = self.winning_cards[games]
+        card_types = _CARD_TYPES[cards]
+        winning_types = _CARD_TYPES[winning_cards]
+        beats = (winning_cards < 0) | np.where(
+            card_types == winning_types, cards > winning_cards, card_types == _ROCKET
+        )
+        self.type_masks[games] = np.where(
+            winning_cards < 0, _TYPE_MASKS[card_types], self.type_masks[games]
+        )
+        self.winning_cards[games] = np.where(beats, cards, winning_cards)
+        self.winners[games] = np.where(beats, seats, self.winners[games])
+
+    def complete_trick(self, games: np.ndarray, is_last_round: bool):
+        """Updates the missions of the given games after their trick, then validates them."""
+        self.rounds_played[games] += 1
+        self.leaders[games] = self.winners[games]
+        new_statuses = self.__update_missions__(games, is_last_round)
+
+        broken = (new_statuses == BROKEN).any(axis=1)
+        self.failed_slots[games[broken]] = np.argmax(new_statuses[broken] == BROKEN, axis=1)
+        self.statuses[games[broken]] = np.where(
+            new_statuses[broken] == BROKEN, BROKEN, self.statuses[games[broken]]
+        )
+        self.running[games[broken]] = False
+
+        validated = ~broken & (new_statuses == SATISFIED).any(axis=1)
+        self.__validate__(games[validated], new_statuses[validated] == SATISFIED)
+
+    def to_result(self) -> BatchGameResult:
+        """Builds the outcome of every game."""
+        success = (self.statuses == SATISFIED).all(axis=1) & (self.failed_slots < 0)
+        return BatchGameResult(
+            success, self.failed_slots, self.rounds_played, self.statuses, self.moves
+        )
+
+    def __update_tracked_masks__(self, games: np.ndarray, pending: np.ndarray) -> np.ndarray:
+        # The cards of the number not played yet, or the cards not won yet
+        kinds = self.missions.kinds[games]
+        tracked = self.tracked_masks[games]
+        tracked = np.where(
+            kinds == MissionType.NEVER_WIN_WITH_NUMBER.value,
+            tracked & ~self.trick_masks[games, None],
+            tracked
+        )
+        tracked = np.where(
+            kinds == MissionType.WIN_WITH_ALL_THESE_CARDS.value,
+            tracked & ~_CARD_BITS[self.winning_cards[games]][:, None],
+            tracked
+        )
+        self.tracked_masks[games] = np.where(pending, tracked, self.tracked_masks[games])
+        return tracked
+
+    def __update_missions__(self, games: np.ndarray, is_last_round: bool) -> np.ndarray:
+        # Same decisions as the MissionTracker of each rule, for every pending slot
+        missions = self.missions
+        pending = self.statuses[games] == PENDING
+        tracked = self.__update_tracked_masks__(games, pending)
+        kinds = missions.kinds[games]
+        is_own_player = missions.players[games] == self.winners[games, None]
+        number_won = _CARD_NUMBERS[self.winning_cards[games]][:, None] == missions.numbers[games]
+        card_played = missions.card_masks[games] & self.trick_masks[games, None] != _ZERO
+        conditions = [
+            kinds == MissionType.PLAYER_HAS_TO_WIN_CARD.value,
+            kinds == MissionType.NEVER_WIN_WITH_NUMBER.value,
+            kinds == MissionType.WIN_ONCE_WITH_NUMBER.value,
+            kinds == MissionType.WIN_WITH_ALL_THESE_CARDS.value,
+            kinds == MissionType.PLAYER_SHOULD_NEVER_WIN.value,
+        ]
+        satisfied = np.select(conditions, [
+            card_played & is_own_player,
+            ~number_won & (is_last_round | (tracked == _ZERO)),
+            number_won,
+            tracked == _ZERO,
+            ~is_own_player & is_last_round,
+        ], False)
+        broken = np.select(conditions, [
+            card_played & ~is_own_player,
+            number_won,
+            ~number_won & is_last_round,
+            (tracked != _ZERO) & is_last_round,
+            is_own_player,
+        ], False)
+        return np.where(
+            pending, np.where(broken, BROKEN, np.where(satisfied, SATISFIED, PENDING)), PENDING
+        )
+
+    def __validate__(self, games: np.ndarray, pending: np.ndarray):
+        # Validates the missions satisfied on the trick one at a time, like GameEngine
+        slot_bits = np.left_shift(1, np.arange(self.missions.slot_count))
+        rows = np.arange(games.size)
+        for _ in range(self.missions.slot_count):
+            live = pending.any(axis=1) & self.running[games]
+            if not live.any():
+                return
+            chosen, accepted = self.__choose_next__(games, pending)
+            live_games = games[live]
+            chosen, accepted = chosen[live], accepted[live]
+            pending[rows[live], chosen] = False
+            self.statuses[live_games, chosen] = np.where(accepted, SATISFIED, BROKEN)
+            self.satisfied_masks[live_games] |= np.where(accepted, slot_bits[chosen], 0)
+            self.satisfied_counts[live_games] += accepted
+            self.failed_slots[live_games] = np.where(
+                accepted, self.failed_slots[live_games], chosen
+            )
+            complete = (self.statuses[live_games] == SATISFIED).all(axis=1)
+            self.running[live_games] &= accepted & ~complete
+
+    def __choose_next__(self, games: np.ndarray, pending: np.ndarray):
+        # Same choice as MissionsOrderData.sort_simultaneous_missions: a mission fixed
+        # to the next position first, then any mission respecting the order, by rank
+        missions = self.missions
+        prerequisites = missions.prerequisite_masks[games]
+        fixed_positions = missions.fixed_positions[games]
+        is_next_position = fixed_positions == self.satisfied_counts[games, None] + 1
+        respects = (prerequisites & self.satisfied_masks[games, None] == prerequisites) & (
+            (fixed_positions == 0) | is_next_position
+        )
+        candidates = pending & respects
+        candidates = np.where(candidates.any(axis=1)[:, None], candidates, pending)
+        priorities = (
+            ~is_next_position * (1 << 20)
+            + missions.ranks[games].astype(np.int64) * missions.slot_count
+            + np.arange(missions.slot_count)
+        )
+        chosen = np.argmin(np.where(candidates, priorities, np.iinfo(np.int64).max), axis=1)
+        return chosen, respects[np.arange(games.size), chosen]
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from src.model.card import ALL_CARDS, ROCKET_4, CardSet
+from src.model.player_hand import Player
+
+_CARD_COUNT = len(ALL_CARDS)
+_CARD_BITS = np.array([card.bit for card in ALL_CARDS], dtype=np.uint64)
+
+@dataclass(frozen=True, slots=True)
+class BulkDeal:
+    """
+    Many deals at once, as NumPy arrays.
+
+    The card at position k of a deck goes to the player k % player_count, so a
+    player's hand is the card ids of every player_count-th position.
+
+    Attributes:
+        decks (np.ndarray): The shuffled card ids, one row of 40 per game (int8).
+        hand_masks (np.ndarray): The CardSet mask of each player, one row per game (uint64).
+        captain_indexes (np.ndarray): The index of the player holding ROCKET 4 in each game.
+    """
+    decks: np.ndarray
+    hand_masks: np.ndarray
+    captain_indexes: np.ndarray
+
+    @property
+    def game_count(self) -> int:
+        """The number of deals."""
+        return self.decks.shape[0]
+
+    @property
+    def player_count(self) -> int:
+        """The number of players of every deal."""
+        return self.hand_masks.shape[1]
+
+    def get_hands(self, game_index: int) -> List[CardSet]:
+        """
+        Returns the hands of one deal.
+
+        Args:
+            game_index (int): The index of the deal.
+
+        Returns:
+            List[CardSet]: The hand of each player.
+        """
+        return [CardSet(int(mask)) for mask in self.hand_masks[game_index]]
+
+    def deal_to(self, game_index: int, players: List[Player]) -> Tuple[List[Player], Player]:
+        """
+        Gives the cards of one deal to players, the same way CardDealer.deal_cards does.
+
+        Args:
+            game_index (int): The index of the deal.
+            players (List[Player]): The players, with empty hands.
+
+        Returns:
+            Tuple[List[Player], Player]: The players and the captain.
+
+        Raises:
+            ValueError: If the number of players does not match the deal.
+        """
+        if len(players) != self.player_count:
+            raise ValueError("Number of players does not match the deal")
+        for position, card_id in enumerate(self.decks[game_index]):
+            players[position % self.player_count].deal_card(ALL_CARDS[card_id])
+        return players, players[int(self.captain_indexes[game_index])]
+
+class BulkCardDealer:
+    """
+    Generates deals in bulk with NumPy, for statistics and batch simulations.
+
+    A batch of decks is a single call permuting every row of a (games x 40)
+    array; the hands are then OR-reduced into CardSet masks and the captain is
+    found from the ROCKET 4 bit, without creating any Player.
+
+    Attributes:
+        player_count (int): The number of players of every deal.
+        rng (np.random.Generator): The random generator used to shuffle the decks.
+    """
+    def __init__(self, player_count: int, rng: np.random.Generator | None = None):
+        """
+        Args:
+            player_count (int): The number of players of every deal.
+            rng (np.random.Generator | None): The random generator used to shuffle
+                the decks. Giving a seeded one makes the deals reproducible.
+
+        Raises:
+            ValueError: If the number of players is not positive.
+        """
+        if player_count < 1:
+            raise ValueError("Player count must be positive")
+        self.player_count = player_count
+        self.rng = rng or np.random.default_rng()
+
+    def deal(self, games: int) -> BulkDeal:
+        """
+        Deals the cards of many games.
+
+        Args:
+            games (int): How many deals to generate.
+
+        Returns:
+            BulkDeal: The deals.
+        """
+        decks = np.broadcast_to(np.arange(_CARD_COUNT, dtype=np.int8), (games, _CARD_COUNT))
+        decks = self.rng.permuted(decks, axis=1)
+
+        bits = _CARD_BITS[decks]
+        hand_masks = np.empty((games, self.player_count), dtype=np.uint64)
+        for player_index in range(self.player_count):
+            hand_masks[:, player_index] = np.bitwise_or.reduce(
+                bits[:, player_index::self.player_count], axis=1
+            )
+        captain_indexes = np.argmax(hand_masks & np.uint64(ROCKET_4.bit) != 0, axis=1)
+        return BulkDeal(decks, hand_masks, captain_indexes)
+
+    def iterate(self, games: int, batch_size: int = 65536) -> Iterator[BulkDeal]:
+        """
+        Deals the cards of many games in batches, to bound memory.
+
+        Args:
+            games (int): How many deals to generate.
+            batch_size (int): The maximum number of deals of each batch.
+
+        Returns:
+            Iterator[BulkDeal]: The batches of deals.
+        """
+        for start in range(0, games, batch_size):
+            yield self.deal(min(batch_size, games - start))
@@ -8,14 +8,25 @@ class CardDealer:
     Class responsible for dealing cards to players in a round-robin manner.
     It shuffles a copy of the deck and assigns cards to each player, then
     determines the captain of the round based on the presence of the 'ROCKET 4' card.
+
+    Attributes:
+        rng (random.Random): The random generator used to shuffle the deck.
     """
 
+    def __init__(self, rng: random.Random | None = None):
+        """
+        Args:
+            rng (random.Random | None): The random generator used to shuffle the deck.
+                Giving a seeded one makes the deals reproducible.
+        """
+        self.rng = rng or random.Random()
+
     def deal_cards(self, players: list[Player]):
         """Deals cards to players in a round-robin fashion without modifying self.deck.
         Returns the players and the player who is the captain.
         """
         shuffled_deck = ALL_CARDS[:]  # Create a copy of the deck
-        random.shuffle(shuffled_deck)  # Shuffle the copy
+        self.rng.shuffle(shuffled_deck)  # Shuffle the copy
 
         player_count = len(players)
         index = 0
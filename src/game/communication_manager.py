@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import Set, List
 from src.model.player_hand import Player
+from src.game.interface.async_player_interface import AsyncPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
 from src.model.level_definition import LevelDefinition, CommunicationType
 
@@ -64,6 +65,28 @@ class CommunicationManagerFactory:
         level_definition: LevelDefinition
     ) -> CommunicationManager:
         """Builds the appropriate CommunicationManager."""
+        blocked_players: List[Player] = []
+        if level_definition.communication_type == CommunicationType.BLOCKED_FOR_NUMBER_OF_PLAYER:
+            count = level_definition.communication_metadata["number_of_player"]
+            blocked_players = self.player_interface.select_blocked_players(players, count)
+        return self.create_manager(level_definition, blocked_players)
+
+    @staticmethod
+    def create_manager(
+        level_definition: LevelDefinition,
+        blocked_players: List[Player]
+    ) -> CommunicationManager:
+        """
+        Builds the CommunicationManager once the players have made their choices.
+
+        Args:
+            level_definition (LevelDefinition): contains the communication type and metadata.
+            blocked_players (List[Player]): the players selected as blocked,
+                for BLOCKED_FOR_NUMBER_OF_PLAYER.
+
+        Returns:
+            CommunicationManager: The manager of the level.
+        """
         comm_type = level_definition.communication_type
         metadata = level_definition.communication_metadata
 
@@ -74,10 +97,26 @@ class CommunicationManagerFactory:
             return LimitedCommunicationManager()
 
         if comm_type == CommunicationType.BLOCKED_FOR_NUMBER_OF_PLAYER:
-            count = metadata["number_of_player"]
-            blocked_players = self.player_interface.select_blocked_players(players, count)
             blocked_ids = {player.id for player in blocked_players}
             return BlockedForNumberOfPlayerManager(blocked_ids)
 
         round_num = metadata["starting_round"]
         return BlockedUntilRoundManager(round_num)
+
+class AsyncCommunicationManagerFactory:
+    """Coroutine version of CommunicationManagerFactory."""
+
+    def __init__(self, player_interface: AsyncPlayerInterface):
+        self.player_interface = player_interface
+
+    async def create(
+        self,
+        players: List[Player],
+        level_definition: LevelDefinition
+    ) -> CommunicationManager:
+        """Builds the appropriate CommunicationManager."""
+        blocked_players: List[Player] = []
+        if level_definition.communication_type == CommunicationType.BLOCKED_FOR_NUMBER_OF_PLAYER:
+            count = level_definition.communication_metadata["number_of_player"]
+            blocked_players = await self.player_interface.select_blocked_players(players, count)
+        return CommunicationManagerFactory.create_manager(level_definition, blocked_players)
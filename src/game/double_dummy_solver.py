@@ -0,0 +1,305 @@
+from typing import Dict, List
+from src.game.mission_rules import (
+    MissionRule,
+    NeverWinWithNumberRule,
+    PlayerHasToWinCardRule,
+    PlayerShouldNeverWinRule,
+    WinOnceWithNumberRule,
+    WinWithAllTheseCardsRule,
+)
+from src.game.shared_transposition_table import SharedTranspositionTable
+from src.model.card import ALL_CARDS, ALL_ROCKETS, Card, CardSet
+from src.model.game_data import GameData
+from src.model.game_state import GameState
+from src.model.player_hand import Player
+from src.model.zobrist import Zobrist
+
+_KNOWN_RULE_TYPES = (
+    PlayerHasToWinCardRule,
+    NeverWinWithNumberRule,
+    WinOnceWithNumberRule,
+    WinWithAllTheseCardsRule,
+    PlayerShouldNeverWinRule,
+)
+
+_ROCKETS_FROM_HIGHEST = sorted(ALL_ROCKETS, key=lambda rocket: rocket.number, reverse=True)
+
+_BROKEN = -1
+_FAILED = 1
+
+class DoubleDummySolver: # pylint: disable=too-many-instance-attributes
+    """
+    Decides if a set of missions can be completed when every hand is known.
+
+    All players cooperate, so every node of the search is an OR node: the
+    missions are achievable if any sequence of legal plays completes them.
+    Missions are evaluated with the MissionRule semantics after each trick, so
+    a broken mission cuts the line immediately. The search uses:
+    - move ordering that favours winning when the player to act must win a
+      mission card of the trick, ducking otherwise, and giving mission cards to
+      the player who must win them when that player is winning the trick;
+    - equivalent-card pruning: adjacent cards of the same type in a hand, with
+      every card between them already played, lead to the same outcome, unless
+      a mission watches them (see MissionTrigger);
+    - a transposition table of failed positions;
+    - a static cut at the start of each trick: a rocket only loses to a higher
+      rocket of another player, so missions that need a rocket to lose (or to
+      be captured by someone else) without such a rocket are already lost.
+
+    Attributes:
+        missions (List[MissionRule]): The missions to complete.
+        max_nodes (int | None): How many positions a solve may visit, or None for no limit.
+        transposition_table (SharedTranspositionTable | None): A table shared with other
+            processes solving the same deal and missions, used along the local one.
+        nodes (int): How many positions were visited on the last solve.
+    """
+    def __init__(
+            self,
+            missions: List[MissionRule],
+            max_nodes: int | None = None,
+            transposition_table: SharedTranspositionTable | None = None):
+        self.missions = missions
+        self.max_nodes = max_nodes
+        self.transposition_table = transposition_table
+        self.nodes = 0
+        self._all_missions_mask = (1 << len(missions)) - 1
+        self._sensitive_mask = self.__get_sensitive_mask__(missions)
+        self._history_mask = CardSet.of(
+            card
+            for mission in missions if isinstance(mission, WinWithAllTheseCardsRule)
+            for card in mission.card_set_that_need_to_win
+        ).mask
+        self._uses_full_history = not all(
+            isinstance(mission, _KNOWN_RULE_TYPES) for mission in missions
+        )
+        self._failed_positions: set[int] = set()
+        self._line: List[Card] = []
+
+    def is_achievable(self, players: List[Player], leader: Player) -> bool:
+        """
+        Checks if the missions can be completed from the given hands.
+
+        Args:
+            players (List[Player]): The players, in playing order, with their current hands.
+            leader (Player): The player who starts the first round.
+
+        Returns:
+            bool: True if some sequence of plays completes every mission.
+
+        Raises:
+            ValueError: If the search visits more than max_nodes positions.
+        """
+        return self.find_line(players, leader) is not None
+
+    def find_line(self, players: List[Player], leader: Player) -> List[Card] | None:
+        """
+        Searches for a sequence of plays that completes every mission.
+        The hands are used for the search and are restored before returning.
+
+        Args:
+            players (List[Player]): The players, in playing order, with their current hands.
+            leader (Player): The player who starts the first round.
+
+        Returns:
+            List[Card] | None: The cards to play, in order, or None if the missions
+                cannot be completed.
+
+        Raises:
+            ValueError: If the search visits more than max_nodes positions.
+        """
+        self.nodes = 0
+        self._failed_positions.clear()
+        self._line = []
+        if not self.missions:
+            return []
+
+        state = GameState(players, leader)
+        try:
+            found = self.__search__(state, 0)
+        finally:
+            while state.current_round.card_by_player or state.game_data.rounds:
+                state.undo_card()
+        if not found:
+            return None
+        return list(reversed(self._line))
+
+    def __search__(self, state: GameState, satisfied_mask: int) -> bool:
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise ValueError("Search node limit exceeded")
+        position_key = self.__get_position_key__(state, satisfied_mask)
+        if self.__is_known_failure__(position_key):
+            return False
+        if not state.current_round.card_by_player and self.__is_doomed__(state, satisfied_mask):
+            self.__record_failure__(position_key, state)
+            return False
+
+        for card in self.__get_ordered_moves__(state, satisfied_mask):
+            completed_round = state.play_card(card)
+            if completed_round is None:
+                found = self.__search__(state, satisfied_mask)
+            else:
+                new_mask = self.__update_missions__(state.game_data, satisfied_mask)
+                if new_mask == _BROKEN:
+                    found = False
+                elif new_mask == self._all_missions_mask:
+                    found = True
+                else:
+                    found = not state.is_finished() and self.__search__(state, new_mask)
+            state.undo_card()
+
+            if found:
+                self._line.append(card)
+                return True
+
+        self.__record_failure__(position_key, state)
+        return False
+
+    def __is_known_failure__(self, position_key: int) -> bool:
+        if position_key in self._failed_positions:
+            return True
+        if self.transposition_table is None:
+            return False
+        if self.transposition_table.probe(position_key) is None:
+            return False
+        self._failed_positions.add(position_key)
+        return True
+
+    def __record_failure__(self, position_key: int, state: GameState):
+        self._failed_positions.add(position_key)
+        if self.transposition_table is not None:
+            cards_left = sum(len(player.card_hand.card_set) for player in state.players)
+            self.transposition_table.store(position_key, _FAILED, cards_left)
+
+    def __update_missions__(self, game_data: GameData, satisfied_mask: int) -> int:
+        for index, mission in enumerate(self.missions):
+            bit = 1 << index
+            if satisfied_mask & bit:
+                continue
+            if mission.is_rule_broken(game_data):
+                return _BROKEN
+            if mission.is_rule_satisfied(game_data):
+                satisfied_mask |= bit
+        return satisfied_mask
+
+    def __is_doomed__(self, state: GameState, satisfied_mask: int) -> bool:
+        # A rocket only loses to a higher rocket played by someone else on the same trick.
+        owner_by_rocket = {
+            rocket: player
+            for rocket in _ROCKETS_FROM_HIGHEST
+            for player in state.players
+            if player.card_hand.card_set.mask & rocket.bit
+        }
+        if not owner_by_rocket:
+            return False
+
+        for index, mission in enumerate(self.missions):
+            if satisfied_mask & (1 << index):
+                continue
+            if isinstance(mission, PlayerShouldNeverWinRule):
+                if not self.__can_lose_all_rockets__(
+                    mission.player_that_should_never_win, owner_by_rocket
+                ):
+                    return True
+            elif isinstance(mission, NeverWinWithNumberRule):
+                rocket = next(
+                    (rocket for rocket in owner_by_rocket if rocket.number == mission.number),
+                    None,
+                )
+                if rocket is not None and not any(
+                    other.number > rocket.number and owner != owner_by_rocket[rocket]
+                    for other, owner in owner_by_rocket.items()
+                ):
+                    return True
+            elif isinstance(mission, PlayerHasToWinCardRule) and mission.card in owner_by_rocket:
+                if owner_by_rocket[mission.card] != mission.player and not any(
+                    other.number > mission.card.number and owner == mission.player
+                    for other, owner in owner_by_rocket.items()
+                ):
+                    return True
+        return False
+
+    def __can_lose_all_rockets__(self, player: Player, owner_by_rocket: Dict[Card, Player]) -> bool:
+        # Each rocket of the player needs its own higher rocket from another player.
+        own_rockets = [rocket for rocket, owner in owner_by_rocket.items() if owner == player]
+        other_rockets = [rocket for rocket, owner in owner_by_rocket.items() if owner != player]
+        if len(own_rockets) > len(other_rockets):
+            return False
+        return all(
+            other.number > own.number for own, other in zip(own_rockets, other_rockets)
+        )
+
+    def __get_position_key__(self, state: GameState, satisfied_mask: int) -> int:
+        # 64-bit key of the hands, trick and leader, with the mission progress mixed in.
+        game_data = state.game_data
+        if self._uses_full_history:
+            history = game_data.get_progress_hash()
+        else:
+            history = game_data.get_winning_card_set().mask & self._history_mask
+        mission_key = Zobrist.mix(Zobrist.mix(history) ^ satisfied_mask)
+        return state.current_round.get_state_hash() ^ mission_key
+
+    def __get_ordered_moves__(self, state: GameState, satisfied_mask: int) -> List[Card]:
+        legal_card_set = state.get_legal_card_set()
+        current_round = state.current_round
+        remaining_mask = current_round.played_card_set.mask
+        for player in state.players:
+            remaining_mask |= player.card_hand.card_set.mask
+
+        moves: List[Card] = []
+        previous: Card | None = None
+        for card in legal_card_set:
+            if previous is not None and self.__are_equivalent__(previous, card, remaining_mask):
+                previous = card
+                continue
+            moves.append(card)
+            previous = card
+
+        player = state.get_current_player()
+        if self.__wants_to_win__(player, state, satisfied_mask):
+            moves.reverse()
+        if current_round.winner is not None:
+            gift_mask = self.__get_gift_mask__(current_round.winner, satisfied_mask)
+            moves.sort(key=lambda card: not card.bit & gift_mask)
+        return moves
+
+    def __get_gift_mask__(self, winner: Player, satisfied_mask: int) -> int:
+        gift_mask = 0
+        for index, mission in enumerate(self.missions):
+            if satisfied_mask & (1 << index) or not isinstance(mission, PlayerHasToWinCardRule):
+                continue
+            if mission.player == winner:
+                gift_mask |= mission.card.bit
+        return gift_mask
+
+    def __are_equivalent__(self, lower: Card, higher: Card, remaining_mask: int) -> bool:
+        if lower.type != higher.type:
+            return False
+        if (lower.bit | higher.bit) & self._sensitive_mask:
+            return False
+        between_mask = (higher.bit - 1) & ~((lower.bit << 1) - 1)
+        return between_mask & remaining_mask == 0
+
+    def __wants_to_win__(self, player: Player, state: GameState, satisfied_mask: int) -> bool:
+        trick_and_hand = state.current_round.played_card_set.mask | player.card_hand.card_set.mask
+        for index, mission in enumerate(self.missions):
+            if satisfied_mask & (1 << index) or not isinstance(mission, PlayerHasToWinCardRule):
+                continue
+            if mission.player == player and mission.card.bit & trick_and_hand:
+                return True
+        return False
+
+    def __get_sensitive_mask__(self, missions: List[MissionRule]) -> int:
+        sensitive_mask = 0
+        numbers_by_card: Dict[int, List[Card]] = {}
+        for card in ALL_CARDS:
+            numbers_by_card.setdefault(card.number, []).append(card)
+
+        for mission in missions:
+            trigger = mission.get_trigger()
+            if trigger.every_trick:
+                return CardSet.of(ALL_CARDS).mask
+            sensitive_mask |= trigger.cards.mask
+            for number in trigger.numbers:
+                sensitive_mask |= CardSet.of(numbers_by_card.get(number, [])).mask
+        return sensitive_mask
@@ -0,0 +1,305 @@
+import mmap
+import struct
+from itertools import combinations, product
+from typing import Dict, FrozenSet, List, Set, Tuple
+from src.game.mission_rules import (
+    MissionRule,
+    MissionStatus,
+    MissionTracker,
+    NeverWinWithNumberRule,
+    NeverWinWithNumberTracker,
+    WinWithAllTheseCardsRule,
+)
+from src.model.card import CardSet, CardType, CardsOperation
+from src.model.player_hand import CardHand, Player
+from src.model.round_data import RoundData
+
+_HEADER = struct.Struct("<QQQQ")
+_SLOT = struct.Struct("<QQ")
+_MAGIC = 0x4542_5445_4741_4E45
+_USED = 1 << 63
+_MAX_MISSIONS = 5
+_TYPE_MASKS = {
+    card_type: CardsOperation.get_card_set_by_type(card_type).mask for card_type in CardType
+}
+
+class EndgameTablebase:
+    """
+    Read-only, memory-mapped table of endgame results written by EndgameTablebaseGenerator.
+
+    Each position is a trick start, keyed by the Zobrist hash of the hands and the leader.
+    Its value has one bit per subset of the tablebase missions (bit i for the missions in
+    mask i): the bit is set when those missions, if still pending, can all be met.
+    Positions are stored in an open addressing table, so a lookup reads a few slots.
+
+    Attributes:
+        mission_count (int): How many missions the tablebase was generated for.
+        tricks_left (int): How many tricks are left in every position.
+    """
+    def __init__(self, path: str):
+        """
+        Maps a tablebase file.
+
+        Args:
+            path (str): The file written by the generator.
+
+        Raises:
+            ValueError: If the file is not a tablebase.
+        """
+        with open(path, "rb") as file:
+            self._memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._slot_count, self.mission_count, self.tricks_left = _HEADER.unpack_from(
+            self._memory, 0
+        )
+        if magic != _MAGIC:
+            self._memory.close()
+            raise ValueError("File is not an endgame tablebase")
+
+    def lookup(self, players: List[Player], leader: Player) -> int | None:
+        """
+        Reads the results of a position.
+
+        Args:
+            players (List[Player]): The players, in playing order, with their current hands.
+            leader (Player): The player who starts the next round.
+
+        Returns:
+            int | None: One bit per subset of missions that can still be met, or None
+                if the position is not in the tablebase.
+        """
+        key = RoundData(players, leader).get_state_hash()
+        index = key & (self._slot_count - 1)
+        while True:
+            slot_key, value = _SLOT.unpack_from(self._memory, _HEADER.size + index * _SLOT.size)
+            if not value & _USED:
+                return None
+            if slot_key == key:
+                return value & ~_USED
+            index = (index + 1) & (self._slot_count - 1)
+
+    def can_meet(self, players: List[Player], leader: Player, pending_mask: int) -> bool:
+        """
+        Checks if the pending missions can still be met from a position.
+
+        Args:
+            players (List[Player]): The players, in playing order, with their current hands.
+            leader (Player): The player who starts the next round.
+            pending_mask (int): The missions still pending, one bit per mission index.
+
+        Returns:
+            bool: True if every pending mission can still be met.
+
+        Raises:
+            ValueError: If the position is not in the tablebase.
+        """
+        results = self.lookup(players, leader)
+        if results is None:
+            raise ValueError("Position not in tablebase")
+        return bool(results >> pending_mask & 1)
+
+    def close(self):
+        """Unmaps the tablebase file."""
+        self._memory.close()
+
+    def __enter__(self) -> "EndgameTablebase":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+class EndgameTablebaseGenerator:
+    """
+    Generates the endgame tablebase of a deal for a list of missions.
+
+    Every position where each player holds `tricks_left` cards of their current hand
+    is enumerated, with every player as leader. A position is solved one trick at a
+    time, on hand bitmasks: each legal way of playing its first trick is decided by
+    RoundData, evaluated with MissionTrackers resumed at that position and combined
+    with the solved position that follows, which is cached. Each position
+    keeps the sets of missions its lines can meet, which answers every subset of
+    pending missions at once.
+
+    The state of a pending mission is a function of the cards left, so the hands
+    of a position, which make its key, are enough to resume its tracker:
+    - WinWithAllTheseCardsRule: its cards that are gone were won, so each position
+      only requires the cards still in the hands, and a card of it lost on a trick
+      breaks it;
+    - NeverWinWithNumberRule: its cards that are gone were played without winning,
+      so its tracker only waits for the cards of the number still in the hands.
+
+    Attributes:
+        missions (List[MissionRule]): The missions, at most five.
+        tricks_left (int): How many tricks are left in the generated positions.
+    """
+    def __init__(self, missions: List[MissionRule], tricks_left: int):
+        """
+        Args:
+            missions (List[MissionRule]): The missions, at most five.
+            tricks_left (int): How many tricks are left in the generated positions.
+
+        Raises:
+            ValueError: If there are too many missions or tricks_left is not positive.
+        """
+        if len(missions) > _MAX_MISSIONS:
+            raise ValueError(f"Tablebases support at most {_MAX_MISSIONS} missions")
+        if tricks_left < 1:
+            raise ValueError("Tricks left must be positive")
+        self.missions = missions
+        self.tricks_left = tricks_left
+        self._players: List[Player] = []
+        self._player_indexes: Dict[int, int] = {}
+        self._outcomes_by_position: Dict[Tuple[Tuple[int, ...], int], FrozenSet[int]] = {}
+
+    def generate(self, players: List[Player], path: str) -> int:
+        """
+        Solves every endgame position reachable from the current hands and writes the file.
+
+        Args:
+            players (List[Player]): The players, in playing order, with their current hands.
+            path (str): Where to write the tablebase.
+
+        Returns:
+            int: The number of positions written.
+        """
+        self._players = players
+        self._player_indexes = {player.id: index for index, player in enumerate(players)}
+        self._outcomes_by_position.clear()
+        results_by_key: Dict[int, int] = {}
+        hands_by_player = [
+            combinations(player.card_hand.cards, self.tricks_left) for player in players
+        ]
+        for hands in product(*hands_by_player):
+            endgame_players = [
+                Player(player.id, player.name, CardHand(list(hand)))
+                for player, hand in zip(players, hands)
+            ]
+            hand_masks = tuple(player.card_hand.card_set.mask for player in endgame_players)
+            for leader_index, leader in enumerate(endgame_players):
+                key = RoundData(endgame_players, leader).get_state_hash()
+                outcomes = self.__get_outcomes__(hand_masks, leader_index, self.tricks_left)
+                results_by_key[key] = self.__to_results__(outcomes)
+
+        self.__write__(results_by_key, path)
+        return len(results_by_key)
+
+    def __get_outcomes__(
+            self, hand_masks: Tuple[int, ...], leader_index: int, tricks_left: int
+    ) -> FrozenSet[int]:
+        position = (hand_masks, leader_index)
+        if position not in self._outcomes_by_position:
+            remaining_mask = 0
+            for hand_mask in hand_masks:
+                remaining_mask |= hand_mask
+            missions = self.__restrict_missions__(CardSet(remaining_mask))
+            round_data = RoundData(self._players, self._players[leader_index])
+            outcomes: Set[int] = set()
+            self.__play_trick__(round_data, hand_masks, missions, tricks_left, outcomes)
+            self._outcomes_by_position[position] = frozenset(outcomes)
+        return self._outcomes_by_position[position]
+
+    def __play_trick__(
+            self,
+            round_data: RoundData,
+            hand_masks: Tuple[int, ...],
+            missions: List[MissionRule],
+            tricks_left: int,
+            outcomes: Set[int]):
+        player_count = len(self._players)
+        played_count = len(round_data.card_by_player)
+        if played_count == player_count:
+            self.__complete_trick__(round_data, hand_masks, missions, tricks_left, outcomes)
+            return
+
+        leader_index = self._player_indexes[round_data.leader.id]
+        player_index = (leader_index + played_count) % player_count
+        legal_mask = hand_masks[player_index]
+        if round_data.round_type is not None:
+            legal_mask = legal_mask & _TYPE_MASKS[round_data.round_type] or legal_mask
+        player = self._players[player_index]
+        for card in CardSet(legal_mask):
+            round_data.add_played_card(player, card)
+            self.__play_trick__(round_data, hand_masks, missions, tricks_left, outcomes)
+            round_data.remove_last_played_card()
+
+    def __complete_trick__(
+            self,
+            round_data: RoundData,
+            hand_masks: Tuple[int, ...],
+            missions: List[MissionRule],
+            tricks_left: int,
+            outcomes: Set[int]):
+        remaining_mask = 0
+        for hand_mask in hand_masks:
+            remaining_mask |= hand_mask
+        met_mask, broken_mask = self.__evaluate_trick__(
+            missions, round_data, CardSet(remaining_mask), tricks_left == 1
+        )
+        if tricks_left == 1:
+            outcomes.add(met_mask)
+            return
+        played_mask = round_data.played_card_set.mask
+        next_hand_masks = tuple(hand_mask & ~played_mask for hand_mask in hand_masks)
+        next_leader_index = self._player_indexes[round_data.winner.id]
+        decided_mask = met_mask | broken_mask
+        for next_met_mask in self.__get_outcomes__(
+                next_hand_masks, next_leader_index, tricks_left - 1):
+            outcomes.add(met_mask | (next_met_mask & ~decided_mask))
+
+    def __evaluate_trick__(
+            self,
+            missions: List[MissionRule],
+            round_data: RoundData,
+            remaining: CardSet,
+            is_last_round: bool) -> Tuple[int, int]:
+        met_mask = broken_mask = 0
+        for index, mission in enumerate(missions):
+            tracker = self.__create_tracker__(mission, remaining)
+            status = tracker.on_trick_completed(round_data, is_last_round)
+            lost_cards = CardSet()
+            if isinstance(mission, WinWithAllTheseCardsRule):
+                lost_cards = (mission.card_set_that_need_to_win & round_data.played_card_set) \
+                    .without_card(round_data.winning_card)
+            if status == MissionStatus.BROKEN or lost_cards:
+                broken_mask |= 1 << index
+            elif status == MissionStatus.SATISFIED:
+                met_mask |= 1 << index
+        return met_mask, broken_mask
+
+    def __create_tracker__(self, mission: MissionRule, remaining: CardSet) -> MissionTracker:
+        if isinstance(mission, NeverWinWithNumberRule):
+            cards_not_played = CardsOperation.get_card_set_by_number(mission.number) & remaining
+            return NeverWinWithNumberTracker(mission, cards_not_played)
+        return mission.create_tracker()
+
+    def __restrict_missions__(self, remaining: CardSet) -> List[MissionRule]:
+        return [
+            WinWithAllTheseCardsRule(set(mission.card_set_that_need_to_win & remaining))
+            if isinstance(mission, WinWithAllTheseCardsRule) else mission
+            for mission in self.missions
+        ]
+
+    def __to_results__(self, outcomes: Set[int]) -> int:
+        results = 0
+        for met_mask in outcomes:
+            pending_mask = met_mask
+            while True:
+                results |= 1 << pending_mask
+                if pending_mask == 0:
+                    break
+                pending_mask = (pending_mask - 1) & met_mask
+        return results
+
+    def __write__(self, results_by_key: Dict[int, int], path: str):
+        slot_count = 1
+        while slot_count < 2 * len(results_by_key):
+            slot_count *= 2
+        slots = bytearray(slot_count * _SLOT.size)
+        for key, results in results_by_key.items():
+            index = key & (slot_count - 1)
+            while _SLOT.unpack_from(slots, index * _SLOT.size)[1] & _USED:
+                index = (index + 1) & (slot_count - 1)
+            _SLOT.pack_into(slots, index * _SLOT.size, key, results | _USED)
+
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, slot_count, len(self.missions), self.tricks_left))
+            file.write(slots)
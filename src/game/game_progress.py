@@ -0,0 +1,111 @@
+from src.model.player_hand import Player
+from src.game.mission_rules import MissionRule, MissionStatus, MissionTracker
+from src.game.mission_trigger_index import MissionTriggerIndex
+from src.model.card import ALL_CARDS
+from src.model.game_data import GameData
+from src.model.game_missions_data import GameMissionsData
+from src.model.round_data import RoundData
+from src.model.missions_order_data import MissionsOrderData
+
+class GameProgress:
+    """
+    The state of a game between its rounds: the rounds played, the status of
+    the missions and who starts the next round.
+
+    It holds every rule applied after a round, so that the engines only have
+    to play the rounds, however they get the cards of the players.
+
+    Attributes:
+        game_data (GameData): the rounds played
+        missions_data (GameMissionsData): the status of the missions
+        mission_order_data (MissionsOrderData): the missions order data
+        starter_player (Player): the player who starts the next round
+        is_over (bool): whether the game ended
+    """
+
+    def __init__(
+            self,
+            players: list[Player],
+            captain: Player,
+            missions: list[MissionRule],
+            mission_order_data: MissionsOrderData
+        ):
+        """
+        Args:
+            players (list[Player]): players on the game, with their cards dealt
+            captain (Player): the player who starts the first round
+            missions (list[MissionRule]): the missions that need to be completed
+            mission_order_data (MissionsOrderData): the missions order data
+        """
+        self.game_data = GameData(len(ALL_CARDS) // len(players))
+        self.missions_data = GameMissionsData.make(set(missions))
+        self.mission_order_data = mission_order_data
+        self.starter_player = captain
+        self.is_over = False
+        self.trackers: dict[MissionRule, MissionTracker] = {
+            mission: mission.create_tracker() for mission in missions
+        }
+        self.trigger_index = MissionTriggerIndex(missions)
+
+    def add_round(self, round_data: RoundData) -> bool:
+        """
+        Adds a finished round: its winner starts the next one, and the missions are validated.
+
+        Args:
+            round_data (RoundData): the round that was just played
+
+        Returns:
+            bool: True if the game is over
+        """
+        self.game_data.add_round(round_data)
+        self.starter_player, _ = round_data.get_winner()
+        self.is_over = self.__validate_missions__() or self.game_data.is_finished()
+        return self.is_over
+
+    def __validate_missions__(self) -> bool:
+        missions_data = self.missions_data
+        mission_order_data = self.mission_order_data
+        round_data = self.game_data.get_last_round()
+        is_last_round = self.game_data.is_finished()
+
+        # Only missing missions triggered by this trick can change status
+        status_by_mission = {
+            mission_rule: self.trackers[mission_rule].on_trick_completed(round_data, is_last_round)
+            for mission_rule in self.trigger_index.get_triggered_missions(round_data, is_last_round)
+            if mission_rule in missions_data.missing_missions
+        }
+
+        # Check if any mission rule was broken before checking ordering
+        for mission_rule, status in status_by_mission.items():
+            if status == MissionStatus.BROKEN:
+                missions_data.add_failed_mission(mission_rule)
+                return True
+
+        # First, check all successul missions on this round
+        # This is to cover the scenario where two ordered missions
+        #   are completed at once (which is okay)
+        succesful_missions_on_this_round = [
+            mission_rule for mission_rule, status in status_by_mission.items()
+            if status == MissionStatus.SATISFIED
+        ]
+        if not succesful_missions_on_this_round:
+            return False
+
+        # Validate them one by one, in the order that best respects the constraints,
+        #   each one seeing the ones validated before it as already satisfied
+        satisfied_mask = mission_order_data.get_mask(missions_data.successful_missions)
+        satisfied_count = len(missions_data.successful_missions)
+        for mission_rule in mission_order_data.sort_simultaneous_missions(
+                satisfied_mask, satisfied_count, succesful_missions_on_this_round):
+            if mission_order_data.is_order_respected_by_mask(
+                    satisfied_mask, satisfied_count, mission_rule):
+                missions_data.add_sucessfull_mission(mission_rule)
+                satisfied_mask |= mission_order_data.mission_bits.get(mission_rule, 0)
+                satisfied_count += 1
+            else:
+                missions_data.add_failed_mission(mission_rule)
+
+            if missions_data.are_missions_complete() or missions_data.has_any_failed_mission():
+                return True
+
+        return False
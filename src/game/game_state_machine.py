@@ -0,0 +1,247 @@
+from dataclasses import dataclass
+from typing import List, Union
+
+from src.game.card_dealer import CardDealer
+from src.game.game_progress import GameProgress
+from src.game.mission_rules import MissionRule
+from src.model.card import Card
+from src.model.game_data import GameData
+from src.model.game_missions_data import GameMissionsData
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import Player
+from src.model.round_data import RoundData
+
+@dataclass(frozen=True, slots=True)
+class PendingDecision:
+    """
+    The decision a game is waiting for.
+
+    Attributes:
+        player (Player): The player who must play a card.
+        legal_cards (List[Card]): The cards the player is allowed to play.
+        round_number (int): The number of the round being played, starting at 1.
+    """
+    player: Player
+    legal_cards: List[Card]
+    round_number: int
+
+@dataclass(frozen=True, slots=True)
+class Move:
+    """
+    A card played by a player.
+
+    Attributes:
+        player_id (int): The id of the player playing the card.
+        card (Card): The card played.
+    """
+    player_id: int
+    card: Card
+
+@dataclass(frozen=True, slots=True)
+class CardPlayed:
+    """
+    Event: a player played a card.
+
+    Attributes:
+        player (Player): The player who played the card.
+        card (Card): The card played.
+    """
+    player: Player
+    card: Card
+
+@dataclass(frozen=True, slots=True)
+class RoundCompleted:
+    """
+    Event: every player played a card on the round.
+
+    Attributes:
+        round_number (int): The number of the round, starting at 1.
+        winner (Player): The player who won the round, and starts the next one.
+        winning_card (Card): The card that won the round.
+    """
+    round_number: int
+    winner: Player
+    winning_card: Card
+
+@dataclass(frozen=True, slots=True)
+class MissionCompleted:
+    """
+    Event: a mission was completed.
+
+    Attributes:
+        mission (MissionRule): The completed mission.
+    """
+    mission: MissionRule
+
+@dataclass(frozen=True, slots=True)
+class MissionFailed:
+    """
+    Event: a mission was broken or completed out of order.
+
+    Attributes:
+        mission (MissionRule): The failed mission.
+    """
+    mission: MissionRule
+
+@dataclass(frozen=True, slots=True)
+class GameOver:
+    """
+    Event: the game ended.
+
+    Attributes:
+        success (bool): True if every mission was completed.
+    """
+    success: bool
+
+GameEvent = Union[CardPlayed, RoundCompleted, MissionCompleted, MissionFailed, GameOver]
+
+class GameStateMachine:
+    """
+    A game played one move at a time, for callers that push the moves instead
+    of being asked for them.
+
+    GameEngine plays a whole game in one call, pulling every card from a
+    PlayerInterface. Here the caller reads the pending decision, applies the
+    move it receives and gets back what happened. Nothing runs between two
+    moves, so a waiting game is only this object, and a single thread can hold
+    any number of them. The rules are the same as GameEngine's: both feed the
+    rounds to a GameProgress.
+
+    Attributes:
+        players (list[Player]): players on the game, with their cards
+        missions (list[MissionRule]): the missions that need to be completed
+        progress (GameProgress): the rounds played and the status of the missions
+        current_round (RoundData | None): the round being played, None once the game is over
+    """
+
+    def __init__(
+            self,
+            players: list[Player],
+            captain: Player,
+            missions: list[MissionRule],
+            mission_order_data: MissionsOrderData
+        ):
+        """
+        Args:
+            players (list[Player]): players on the game, with their cards dealt
+            captain (Player): the player who starts the first round
+            missions (list[MissionRule]): the missions that need to be completed
+            mission_order_data (MissionsOrderData): the missions order data
+        """
+        self.players = players
+        self.missions = missions
+        self.progress = GameProgress(players, captain, missions, mission_order_data)
+        self.current_round: RoundData | None = RoundData(players, captain)
+
+    @classmethod
+    def start(
+            cls,
+            card_dealer: CardDealer,
+            players: list[Player],
+            missions: list[MissionRule],
+            mission_order_data: MissionsOrderData
+        ) -> "GameStateMachine":
+        """
+        Deals the cards and starts a game, like GameEngine.play_game does.
+
+        Args:
+            card_dealer (CardDealer): deals cards to players
+            players (list[Player]): players on the game
+            missions (list[MissionRule]): the missions that need to be completed
+            mission_order_data (MissionsOrderData): the missions order data
+
+        Returns:
+            GameStateMachine: The game, waiting for the captain to play.
+        """
+        players, captain = card_dealer.deal_cards(players)
+        return cls(players, captain, missions, mission_order_data)
+
+    @property
+    def is_over(self) -> bool:
+        """Whether the game ended."""
+        return self.progress.is_over
+
+    @property
+    def game_data(self) -> GameData:
+        """The rounds played so far."""
+        return self.progress.game_data
+
+    @property
+    def missions_data(self) -> GameMissionsData:
+        """The status of the missions."""
+        return self.progress.missions_data
+
+    def get_pending_decision(self) -> PendingDecision | None:
+        """
+        Returns the decision the game is waiting for.
+
+        Returns:
+            PendingDecision | None: Who must play and which cards are allowed,
+                or None if the game is over.
+        """
+        if self.current_round is None:
+            return None
+        player = self.__get_current_player__()
+        return PendingDecision(
+            player=player,
+            legal_cards=player.card_hand.get_playable_cards(self.current_round.round_type),
+            round_number=len(self.game_data.rounds) + 1,
+        )
+
+    def apply(self, move: Move) -> List[GameEvent]:
+        """
+        Plays a card for the player whose turn it is.
+
+        Args:
+            move (Move): The card played and who plays it.
+
+        Returns:
+            List[GameEvent]: What happened, in order: the card played, then, if it
+                ended the round, the round result, the missions completed or failed
+                and the end of the game.
+
+        Raises:
+            ValueError: If the game is over, it is not the player's turn,
+                or the card is not allowed.
+        """
+        decision = self.get_pending_decision()
+        if decision is None:
+            raise ValueError("The game is over")
+        player = decision.player
+        if move.player_id != player.id:
+            raise ValueError(f"It is not the turn of player {move.player_id}")
+        if move.card not in decision.legal_cards:
+            raise ValueError(f"Card {move.card} cannot be played")
+
+        round_data = self.current_round
+        player.play_card(move.card)
+        round_data.add_played_card(player, move.card)
+        events: List[GameEvent] = [CardPlayed(player, move.card)]
+        if len(round_data.card_by_player) < len(self.players):
+            return events
+
+        missions_data = self.missions_data
+        missing_missions = set(missions_data.missing_missions)
+        self.progress.add_round(round_data)
+
+        winner, winning_card = round_data.get_winner()
+        events.append(RoundCompleted(decision.round_number, winner, winning_card))
+        for mission in self.missions:
+            if mission not in missing_missions or mission in missions_data.missing_missions:
+                continue
+            if mission in missions_data.successful_missions:
+                events.append(MissionCompleted(mission))
+            else:
+                events.append(MissionFailed(mission))
+
+        if self.is_over:
+            self.current_round = None
+            events.append(GameOver(missions_data.are_missions_complete()))
+        else:
+            self.current_round = RoundData(self.players, self.progress.starter_player)
+        return events
+
+    def __get_current_player__(self) -> Player:
+        starter_index = self.players.index(self.progress.starter_player)
+        cards_count = len(self.current_round.card_by_player)
+        return self.players[(starter_index + cards_count) % len(self.players)]
@@ -0,0 +1,208 @@
+import random
+from dataclasses import dataclass
+from math import factorial
+from typing import Dict, Iterable, List, Tuple
+from src.model.card import ALL_CARDS, ROCKET_4, Card, CardSet, CardsOperation
+from src.model.game_data import GameData
+from src.model.player_hand import Player
+from src.model.round_data import RoundData
+
+Composition = Tuple[int, ...]
+
+@dataclass(frozen=True, slots=True)
+class ObservedGame:
+    """
+    What every player at the table has seen of a game.
+
+    Attributes:
+        players (List[Player]): All players, in playing order.
+        captain (Player): The player who received ROCKET_4.
+        game_data (GameData): The rounds finished so far.
+        current_round (RoundData | None): The round being played, if any.
+    """
+    players: List[Player]
+    captain: Player
+    game_data: GameData
+    current_round: RoundData | None = None
+
+class HandSampler:
+    """
+    Samples the hidden hands of the other players, as seen by one player.
+
+    The observer only knows its own hand, the cards played so far and the hand
+    sizes. Every sampled deal is consistent with that: the unseen cards are split
+    with the exact hand sizes, a player who did not follow the type of a round
+    gets no card of that type, and ROCKET_4 stays with the captain until played.
+
+    The unseen cards are grouped by the players that may hold them. The number of
+    deals for every way of splitting the groups is counted once, so each sample
+    is drawn uniformly among all consistent deals, without rejection.
+
+    Attributes:
+        observer (Player): The player whose knowledge is used.
+        hidden_players (List[Player]): The other players, in playing order.
+        hand_sizes (List[int]): The number of cards of each hidden player.
+        allowed_masks (List[int]): The cards each hidden player may hold, as bitmasks.
+    """
+    def __init__(
+            self,
+            observer: Player,
+            game: ObservedGame,
+            *,
+            rng: random.Random | None = None):
+        """
+        Infers what the observer knows and prepares the deal counts.
+
+        Args:
+            observer (Player): The player whose knowledge is used.
+            game (ObservedGame): The players and the rounds played so far.
+            rng (random.Random | None): The random generator to use.
+
+        Raises:
+            ValueError: If no deal is consistent with what was observed.
+        """
+        self.observer = observer
+        self.hidden_players = [player for player in game.players if player != observer]
+        self.hand_sizes = [len(player.card_hand.card_set) for player in self.hidden_players]
+        self.rng = rng or random.Random()
+
+        rounds = list(game.game_data.rounds)
+        if game.current_round is not None:
+            rounds.append(game.current_round)
+        seen_mask = observer.card_hand.card_set.mask
+        void_masks = {player.id: 0 for player in self.hidden_players}
+        for round_data in rounds:
+            seen_mask |= round_data.played_card_set.mask
+            for player, card in round_data.card_by_player.items():
+                if player.id in void_masks and card.type != round_data.round_type:
+                    void_masks[player.id] |= CardsOperation.get_card_set_by_type(
+                        round_data.round_type
+                    ).mask
+
+        unseen_mask = CardSet.of(ALL_CARDS).mask & ~seen_mask
+        self.allowed_masks = [
+            unseen_mask & ~void_masks[player.id] for player in self.hidden_players
+        ]
+        if ROCKET_4.bit & unseen_mask:
+            for index, player in enumerate(self.hidden_players):
+                if player != game.captain:
+                    self.allowed_masks[index] &= ~ROCKET_4.bit
+
+        self._groups = self.__group_cards__(CardSet(unseen_mask))
+        # The deal count and the weighted compositions of every (group, capacities) reached
+        self._counts: Dict[
+            Tuple[int, Composition], Tuple[int, List[Tuple[Composition, int]]]
+        ] = {}
+        if sum(self.hand_sizes) != len(CardSet(unseen_mask)) or self.count_deals() == 0:
+            raise ValueError("No deal is consistent with the observed game")
+
+    def count_deals(self) -> int:
+        """
+        Counts the deals of the unseen cards consistent with what was observed.
+
+        Returns:
+            int: The number of consistent deals.
+        """
+        return self.__count__(0, tuple(self.hand_sizes))
+
+    def sample(self) -> Dict[int, CardSet]:
+        """
+        Draws one consistent deal of the unseen cards.
+
+        Returns:
+            Dict[int, CardSet]: The sampled hand of each hidden player, by player id.
+        """
+        masks = [0] * len(self.hidden_players)
+        capacities = tuple(self.hand_sizes)
+        for group_index, (players, cards) in enumerate(self._groups):
+            composition = self.__pick_composition__(group_index, capacities)
+            shuffled = cards[:]
+            self.rng.shuffle(shuffled)
+            start = 0
+            for player_index, count in zip(players, composition):
+                for card in shuffled[start:start + count]:
+                    masks[player_index] |= card.bit
+                start += count
+            capacities = self.__take__(capacities, players, composition)
+
+        return {
+            player.id: CardSet(mask) for player, mask in zip(self.hidden_players, masks)
+        }
+
+    def sample_batch(self, count: int) -> List[Dict[int, CardSet]]:
+        """
+        Draws several independent consistent deals.
+
+        Args:
+            count (int): How many deals to draw.
+
+        Returns:
+            List[Dict[int, CardSet]]: The sampled deals.
+        """
+        return [self.sample() for _ in range(count)]
+
+    def __group_cards__(
+            self, unseen_cards: CardSet) -> List[Tuple[Tuple[int, ...], List[Card]]]:
+        cards_by_players: Dict[Tuple[int, ...], List[Card]] = {}
+        for card in unseen_cards:
+            players = tuple(
+                index for index, mask in enumerate(self.allowed_masks) if mask & card.bit
+            )
+            if not players:
+                raise ValueError("No deal is consistent with the observed game")
+            cards_by_players.setdefault(players, []).append(card)
+        return list(cards_by_players.items())
+
+    def __count__(self, group_index: int, capacities: Composition) -> int:
+        if group_index == len(self._groups):
+            return 0 if any(capacities) else 1
+        key = (group_index, capacities)
+        if key not in self._counts:
+            players, cards = self._groups[group_index]
+            options = []
+            for composition in self.__compositions__(len(cards), players, capacities):
+                ways = self.__multinomial__(len(cards), composition) * self.__count__(
+                    group_index + 1, self.__take__(capacities, players, composition)
+                )
+                if ways:
+                    options.append((composition, ways))
+            self._counts[key] = (sum(ways for _, ways in options), options)
+        return self._counts[key][0]
+
+    def __pick_composition__(self, group_index: int, capacities: Composition) -> Composition:
+        total = self.__count__(group_index, capacities)
+        target = self.rng.randrange(total)
+        for composition, ways in self._counts[(group_index, capacities)][1]:
+            if target < ways:
+                return composition
+            target -= ways
+        raise ValueError("No deal is consistent with the observed game") # pragma: no cover
+
+    def __compositions__(
+            self,
+            card_count: int,
+            players: Tuple[int, ...],
+            capacities: Composition) -> Iterable[Composition]:
+        if len(players) == 1:
+            if card_count <= capacities[players[0]]:
+                yield (card_count,)
+            return
+        for count in range(min(card_count, capacities[players[0]]) + 1):
+            for rest in self.__compositions__(card_count - count, players[1:], capacities):
+                yield (count,) + rest
+
+    def __take__(
+            self,
+            capacities: Composition,
+            players: Tuple[int, ...],
+            composition: Composition) -> Composition:
+        remaining = list(capacities)
+        for player_index, count in zip(players, composition):
+            remaining[player_index] -= count
+        return tuple(remaining)
+
+    def __multinomial__(self, total: int, composition: Composition) -> int:
+        ways = factorial(total)
+        for count in composition:
+            ways //= factorial(count)
+        return ways
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.game.interface.player_interface import PlayerInterface
+from src.model.player_hand import Player
+from src.model.card import Card
+from src.model.round_data import RoundData
+
+class AsyncPlayerInterface(ABC):
+    """
+    Coroutine version of PlayerInterface, for players answering over the network:
+    while a player thinks, the event loop keeps running the other tables.
+    """
+
+    @abstractmethod
+    async def select_card(self, player: Player, round_data: RoundData) -> Card:
+        """Chooses the card the player plays on the round, which holds the cards already played."""
+
+    @abstractmethod
+    async def select_mission(
+            self,
+            player_id: int,
+            missions: List[Card],
+            can_skip: bool) -> Card | None:
+        """Chooses the mission the player takes, or None to skip when allowed."""
+
+    @abstractmethod
+    async def select_blocked_players(
+            self,
+            player: List[Player],
+            number_of_player: int) -> List[Player]:
+        """Chooses the players that cannot communicate."""
+
+    @abstractmethod
+    async def select_player_that_should_not_win(self, player: List[Player]) -> Player:
+        """Chooses the player that should never win a round."""
+
+class SyncPlayerInterfaceAdapter(AsyncPlayerInterface):
+    """
+    Exposes a PlayerInterface that answers immediately, such as a bot, as an AsyncPlayerInterface.
+
+    Attributes:
+        player_interface (PlayerInterface): the interface answering every call
+    """
+
+    def __init__(self, player_interface: PlayerInterface):
+        self.player_interface = player_interface
+
+    async def select_card(self, player: Player, round_data: RoundData) -> Card:
+        return self.player_interface.select_card(player, round_data)
+
+    async def select_mission(
+            self,
+            player_id: int,
+            missions: List[Card],
+            can_skip: bool) -> Card | None:
+        return self.player_interface.select_mission(player_id, missions, can_skip)
+
+    async def select_blocked_players(
+            self,
+            player: List[Player],
+            number_of_player: int) -> List[Player]:
+        return self.player_interface.select_blocked_players(player, number_of_player)
+
+    async def select_player_that_should_not_win(self, player: List[Player]) -> Player:
+        return self.player_interface.select_player_that_should_not_win(player)
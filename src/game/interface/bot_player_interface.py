@@ -0,0 +1,72 @@
+import random
+from abc import abstractmethod
+from typing import Dict, List, Type
+
+from src.game.interface.player_interface import PlayerInterface
+from src.model.card import Card, CardType
+from src.model.player_hand import Player
+from src.model.round_data import RoundData
+
+class BotPlayerInterface(PlayerInterface):
+    """
+    Base class for the automatic players used to play games without humans.
+    A bot keeps no state about the game: everything it needs comes with each call,
+    so the same bot can play any number of games at once.
+
+    Attributes:
+        rng (random.Random): The random generator used for every choice.
+    """
+    def __init__(self, rng: random.Random | None = None):
+        self.rng = rng or random.Random()
+
+    @abstractmethod
+    def select_card(self, player: Player, round_data: RoundData) -> Card:
+        """Chooses one of the legal cards of the player."""
+
+    def get_legal_cards(self, player: Player, round_data: RoundData) -> List[Card]:
+        """
+        Returns the cards the player is allowed to play on a round.
+
+        Args:
+            player (Player): The player about to play.
+            round_data (RoundData): The round being played.
+
+        Returns:
+            List[Card]: The playable cards, following the round type when possible.
+        """
+        return player.card_hand.get_playable_cards(round_data.round_type)
+
+    def select_mission(self, player_id: int, missions: List[Card], can_skip: bool) -> Card:
+        """Takes a random mission, never skipping."""
+        del player_id, can_skip
+        return self.rng.choice(missions)
+
+    def select_blocked_players(self, player: List[Player], number_of_player: int) -> List[Player]:
+        """Blocks random players."""
+        return self.rng.sample(player, number_of_player)
+
+    def select_player_that_should_not_win(self, player: List[Player]) -> Player:
+        """Picks a random player."""
+        return self.rng.choice(player)
+
+class RandomBotPlayerInterface(BotPlayerInterface):
+    """Bot that plays a random legal card."""
+
+    def select_card(self, player: Player, round_data: RoundData) -> Card:
+        """Plays a random legal card."""
+        return self.rng.choice(self.get_legal_cards(player, round_data))
+
+class LowestCardBotPlayerInterface(BotPlayerInterface):
+    """Bot that always plays its lowest legal card, keeping rockets for last."""
+
+    def select_card(self, player: Player, round_data: RoundData) -> Card:
+        """Plays the lowest legal card."""
+        return min(
+            self.get_legal_cards(player, round_data),
+            key=lambda card: (card.type == CardType.ROCKET, card.number, card.id)
+        )
+
+BOTS: Dict[str, Type[BotPlayerInterface]] = {
+    "random": RandomBotPlayerInterface,
+    "lowest": LowestCardBotPlayerInterface,
+}
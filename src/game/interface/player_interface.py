@@ -3,21 +3,29 @@ from typing import List
 
 from src.model.player_hand import Player
 from src.model.card import Card
+from src.model.round_data import RoundData
 
 class PlayerInterface(ABC):
-    @abstractmethod
-    def select_card(player: Player) -> Card:
-        pass # pragma: no cover
+    """
+    Asks the players for their decisions during a game.
+    """
 
     @abstractmethod
-    def select_mission(player_id: int, missions: List[Card], can_skip: bool) -> Card:
-        pass # pragma: no cover
-    
+    def select_card(self, player: Player, round_data: RoundData) -> Card:
+        """Chooses the card the player plays on the round, which holds the cards already played."""
+
     @abstractmethod
-    def select_blocked_players(player: List[Player], number_of_player: int) ->  List[Player]:
-        pass # pragma: no cover
-    
+    def select_mission(
+            self,
+            player_id: int,
+            missions: List[Card],
+            can_skip: bool) -> Card | None:
+        """Chooses the mission the player takes, or None to skip when allowed."""
+
     @abstractmethod
-    def select_player_that_should_not_win(player: List[Player]) ->  Player:
-        pass # pragma: no cover
+    def select_blocked_players(self, player: List[Player], number_of_player: int) -> List[Player]:
+        """Chooses the players that cannot communicate."""
 
+    @abstractmethod
+    def select_player_that_should_not_win(self, player: List[Player]) -> Player:
+        """Chooses the player that should never win a round."""
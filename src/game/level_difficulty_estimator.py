@@ -0,0 +1,232 @@
+import argparse
+from collections import Counter
+from dataclasses import dataclass, field
+from math import sqrt
+from statistics import NormalDist
+from typing import Dict, Sequence, Tuple
+
+from src.game.interface.bot_player_interface import BOTS
+from src.game.simulation_runner import LEVELS, SimulationResult, SimulationRunner
+from src.model.level_definition import LevelDefinition
+
+UNFINISHED = "Unfinished"
+
+def wilson_interval(successes: int, games: int, confidence: float) -> Tuple[float, float]:
+    """
+    Computes the Wilson score interval of a success rate.
+
+    Args:
+        successes (int): How many games were won.
+        games (int): How many games were played.
+        confidence (float): The confidence level of the interval.
+
+    Returns:
+        Tuple[float, float]: The lower and upper bounds of the interval.
+    """
+    if games == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = successes / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    margin = z * sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+@dataclass(frozen=True, slots=True)
+class LevelDifficulty:
+    """
+    The measured difficulty of a level, for a given bot.
+
+    Attributes:
+        games (int): How many games were played.
+        successes (int): How many games completed every mission.
+        confidence_interval (Tuple[float, float]): The Wilson interval of the success rate.
+        failures_by_mission (Dict[str, int]): How many games each type of mission made fail;
+            UNFINISHED counts the games that ended with missions still pending.
+        average_tricks_until_failure (float | None): The mean number of rounds played
+            by the failed games, or None if no game failed.
+    """
+    games: int
+    successes: int
+    confidence_interval: Tuple[float, float]
+    failures_by_mission: Dict[str, int] = field(default_factory=dict)
+    average_tricks_until_failure: float | None = None
+
+    @property
+    def success_rate(self) -> float:
+        """The fraction of games that completed every mission."""
+        return self.successes / self.games if self.games else 0.0
+
+class LevelDifficultyEstimator:
+    """
+    Estimates how often bots complete a level, with Monte Carlo simulations.
+
+    Games are played in batches through a SimulationRunner, which spreads them over
+    a pool of processes. After each batch, the Wilson score interval of the success
+    rate is computed, and the estimation stops as soon as it is narrower than the
+    target width, or when the maximum number of games is reached.
+
+    Attributes:
+        bot_name (str): The key of the bot in BOTS that plays for every player.
+        player_count (int): The number of players.
+        processes (int): The number of worker processes, 1 to play in this process.
+        confidence (float): The confidence level of the intervals.
+        target_width (float): The interval width at which to stop.
+        batch_size (int): How many games are played between two checks of the interval.
+        max_games (int): The maximum number of games played for a level.
+    """
+    def __init__( # pylint: disable=too-many-arguments
+            self,
+            bot_name: str = "random",
+            player_count: int = 4,
+            processes: int = 1,
+            *,
+            confidence: float = 0.95,
+            target_width: float = 0.02,
+            batch_size: int = 1000,
+            max_games: int = 100_000):
+        """
+        Args:
+            bot_name (str): The key of the bot in BOTS that plays for every player.
+            player_count (int): The number of players.
+            processes (int): The number of worker processes, 1 to play in this process.
+            confidence (float): The confidence level of the intervals.
+            target_width (float): The interval width at which to stop.
+            batch_size (int): How many games are played between two checks of the interval.
+            max_games (int): The maximum number of games played for a level.
+
+        Raises:
+            ValueError: If the confidence is not between 0 and 1 or a count is not positive.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1")
+        if batch_size < 1 or max_games < 1:
+            raise ValueError("Batch size and maximum games must be positive")
+        self.bot_name = bot_name
+        self.player_count = player_count
+        self.processes = processes
+        self.confidence = confidence
+        self.target_width = target_width
+        self.batch_size = batch_size
+        self.max_games = max_games
+
+    def estimate(self, level_definition: LevelDefinition, seed: int = 0) -> LevelDifficulty:
+        """
+        Plays games of a level until its success rate is known precisely enough.
+
+        Args:
+            level_definition (LevelDefinition): The level to measure.
+            seed (int): The seed of the simulated games.
+
+        Returns:
+            LevelDifficulty: The measured difficulty.
+        """
+        games = successes = failed_rounds = 0
+        failures: Counter = Counter()
+        interval = (0.0, 1.0)
+        runner = SimulationRunner(
+            level_definition, self.bot_name, self.player_count, self.processes
+        )
+        with runner:
+            while games < self.max_games and interval[1] - interval[0] > self.target_width:
+                batch_games = min(self.batch_size, self.max_games - games)
+                for result in runner.iterate(batch_games, seed, first_game=games):
+                    successes += result.success
+                    if not result.success:
+                        failures[self.__get_failure__(result)] += 1
+                        failed_rounds += result.rounds_played
+                games += batch_games
+                interval = self.get_interval(successes, games)
+
+        failed_games = games - successes
+        return LevelDifficulty(
+            games=games,
+            successes=successes,
+            confidence_interval=interval,
+            failures_by_mission=dict(failures),
+            average_tricks_until_failure=failed_rounds / failed_games if failed_games else None,
+        )
+
+    def estimate_all(
+            self,
+            level_definitions: Dict[str, LevelDefinition],
+            seed: int = 0) -> Dict[str, LevelDifficulty]:
+        """
+        Measures several levels, with the same seed so they are played on the same deals.
+
+        Args:
+            level_definitions (Dict[str, LevelDefinition]): The levels to measure, by name.
+            seed (int): The seed of the simulated games.
+
+        Returns:
+            Dict[str, LevelDifficulty]: The difficulty of each level, by name.
+        """
+        return {
+            name: self.estimate(level_definition, seed)
+            for name, level_definition in level_definitions.items()
+        }
+
+    def get_interval(self, successes: int, games: int) -> Tuple[float, float]:
+        """
+        Computes the Wilson score interval of a success rate.
+
+        Args:
+            successes (int): How many games were won.
+            games (int): How many games were played.
+
+        Returns:
+            Tuple[float, float]: The lower and upper bounds of the interval.
+        """
+        return wilson_interval(successes, games, self.confidence)
+
+    def __get_failure__(self, result: SimulationResult) -> str:
+        return result.failed_mission or UNFINISHED
+
+def main(argv: Sequence[str] | None = None) -> Dict[str, LevelDifficulty]:
+    """
+    Command line entry point: measures levels and prints their difficulty.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        Dict[str, LevelDifficulty]: The difficulty of each level, by name.
+    """
+    parser = argparse.ArgumentParser(description="Measure the difficulty of levels with bots.")
+    parser.add_argument("--levels", nargs="+", choices=sorted(LEVELS), default=sorted(LEVELS))
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--target-width", type=float, default=0.02)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-games", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args(argv)
+
+    estimator = LevelDifficultyEstimator(
+        arguments.bot,
+        arguments.players,
+        arguments.processes,
+        confidence=arguments.confidence,
+        target_width=arguments.target_width,
+        batch_size=arguments.batch_size,
+        max_games=arguments.max_games,
+    )
+    difficulties = estimator.estimate_all(
+        {name: LEVELS[name] for name in arguments.levels}, arguments.seed
+    )
+    for name, difficulty in difficulties.items():
+        low, high = difficulty.confidence_interval
+        print(
+            f"{name}: {difficulty.success_rate:.2%} [{low:.2%}, {high:.2%}] "
+            f"over {difficulty.games} games"
+        )
+        if difficulty.average_tricks_until_failure is not None:
+            print(f"  average tricks until failure: {difficulty.average_tricks_until_failure:.2f}")
+        for mission, count in sorted(difficulty.failures_by_mission.items()):
+            print(f"  {mission}: {count}")
+    return difficulties
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import argparse
+from dataclasses import dataclass, field
+from itertools import product
+from math import ceil
+from multiprocessing.pool import Pool
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.game.interface.bot_player_interface import BOTS
+from src.game.level_difficulty_estimator import wilson_interval
+from src.game.simulation_runner import SimulationRunner
+from src.model.level_definition import (
+    CommunicationType,
+    LevelDefinition,
+    MissionType,
+    OrderToken,
+)
+
+@dataclass(frozen=True, slots=True)
+class LevelParameterSpace:
+    """
+    The LevelDefinition parameters a tuner can choose from.
+
+    MissionRuleListBuilder creates one mission per mission card, and at most one
+    mission of every other type, so only the number of mission cards is a count.
+    A set of order tokens is only used with at least as many mission cards.
+    The bots never communicate, so the communication type is not a parameter:
+    every candidate uses regular communication.
+
+    Attributes:
+        mission_card_counts (Sequence[int]): The numbers of PLAYER_HAS_TO_WIN_CARD missions.
+        extra_mission_types (Sequence[Tuple[MissionType, ...]]): The combinations of other
+            mission types to add.
+        order_token_options (Sequence[Tuple[OrderToken, ...]]): The sets of order tokens.
+        missions_metadata (Dict[MissionType, Any]): The metadata of the static missions.
+    """
+    mission_card_counts: Sequence[int] = (1, 2, 3, 4, 5)
+    extra_mission_types: Sequence[Tuple[MissionType, ...]] = ((),)
+    order_token_options: Sequence[Tuple[OrderToken, ...]] = ((),)
+    missions_metadata: Dict[MissionType, Any] = field(default_factory=dict)
+
+    def get_candidates(self) -> List[LevelDefinition]:
+        """
+        Lists every valid combination of the parameters.
+
+        Returns:
+            List[LevelDefinition]: The candidate levels.
+        """
+        candidates = []
+        for count, extra_types, order_tokens in product(
+                self.mission_card_counts,
+                self.extra_mission_types,
+                self.order_token_options):
+            if len(order_tokens) > count:
+                continue
+            mission_types = {MissionType.PLAYER_HAS_TO_WIN_CARD: count} if count else {}
+            mission_types.update(dict.fromkeys(extra_types, 1))
+            if not mission_types:
+                continue
+            candidates.append(LevelDefinition(
+                order_tokens=list(order_tokens),
+                mission_types=mission_types,
+                communication_type=CommunicationType.REGULAR,
+                missions_metadata=dict(self.missions_metadata),
+            ))
+        return candidates
+
+@dataclass(frozen=True, slots=True)
+class TunedLevel:
+    """
+    A candidate level with the games it was measured on.
+
+    Attributes:
+        level_definition (LevelDefinition): The candidate level.
+        games (int): How many games were played with it.
+        successes (int): How many games completed every mission.
+        confidence_interval (Tuple[float, float]): The Wilson interval of the success rate.
+    """
+    level_definition: LevelDefinition
+    games: int
+    successes: int
+    confidence_interval: Tuple[float, float]
+
+    @property
+    def success_rate(self) -> float:
+        """The fraction of games that completed every mission."""
+        return self.successes / self.games if self.games else 0.0
+
+def _play_games(task: Tuple[int, LevelDefinition, str, int, int, int, int]) -> Tuple[int, int]:
+    candidate_index, level_definition, bot_name, player_count, seed, first_game, games = task
+    runner = SimulationRunner(level_definition, bot_name, player_count)
+    successes = sum(result.success for result in runner.iterate(games, seed, first_game))
+    return candidate_index, successes
+
+class LevelTuner: # pylint: disable=too-many-instance-attributes
+    """
+    Searches candidate levels for the ones whose success rate is in a target band.
+
+    Candidates are compared with successive halving: every remaining candidate is
+    played up to the same number of games, the ones furthest from the band are
+    dropped, and the survivors get reduction_factor times more games, until one is
+    left or they reach max_games. Every candidate plays the same games (same seeds,
+    so the same deals and bot choices streams), and the games of a round are kept
+    in the next ones, so differences between candidates come from their parameters
+    rather than from the luck of the deals.
+
+    The games of every candidate are split in chunks and played over a pool of processes.
+
+    Attributes:
+        target_band (Tuple[float, float]): The lowest and highest success rates wanted.
+        bot_name (str): The key of the bot in BOTS that plays for every player.
+        player_count (int): The number of players.
+        processes (int): The number of worker processes, 1 to play in this process.
+        initial_games (int): How many games every candidate plays in the first round.
+        reduction_factor (int): How many times fewer candidates are kept after each round.
+        max_games (int): The maximum number of games played by a candidate.
+        confidence (float): The confidence level of the intervals.
+        chunk_size (int): How many games of a candidate a worker plays at once.
+    """
+    def __init__( # pylint: disable=too-many-arguments
+            self,
+            target_band: Tuple[float, float],
+            bot_name: str = "random",
+            player_count: int = 4,
+            processes: int = 1,
+            *,
+            initial_games: int = 200,
+            reduction_factor: int = 2,
+            max_games: int = 10_000,
+            confidence: float = 0.95,
+            chunk_size: int = 100):
+        """
+        Args:
+            target_band (Tuple[float, float]): The lowest and highest success rates wanted.
+            bot_name (str): The key of the bot in BOTS that plays for every player.
+            player_count (int): The number of players.
+            processes (int): The number of worker processes, 1 to play in this process.
+            initial_games (int): How many games every candidate plays in the first round.
+            reduction_factor (int): How many times fewer candidates are kept after each round.
+            max_games (int): The maximum number of games played by a candidate.
+            confidence (float): The confidence level of the intervals.
+            chunk_size (int): How many games of a candidate a worker plays at once.
+
+        Raises:
+            ValueError: If the band, the bot or a count is invalid.
+        """
+        if not 0 <= target_band[0] <= target_band[1] <= 1:
+            raise ValueError("Target band must be an interval between 0 and 1")
+        if bot_name not in BOTS:
+            raise ValueError(f"Unknown bot: {bot_name}")
+        if initial_games < 1 or reduction_factor < 2 or chunk_size < 1:
+            raise ValueError("Initial games and chunk size must be positive, "
+                             "and the reduction factor at least 2")
+        self.target_band = target_band
+        self.bot_name = bot_name
+        self.player_count = player_count
+        self.processes = processes
+        self.initial_games = initial_games
+        self.reduction_factor = reduction_factor
+        self.max_games = max(max_games, initial_games)
+        self.confidence = confidence
+        self.chunk_size = chunk_size
+
+    def tune(self, candidates: Sequence[LevelDefinition], seed: int = 0) -> List[TunedLevel]:
+        """
+        Measures the candidates with successive halving.
+
+        Args:
+            candidates (Sequence[LevelDefinition]): The levels to choose from.
+            seed (int): The seed of the games every candidate plays.
+
+        Returns:
+            List[TunedLevel]: Every candidate, the best first: the ones that survived
+                the most rounds, then the closest to the band.
+        """
+        games = [0] * len(candidates)
+        successes = [0] * len(candidates)
+        remaining = list(range(len(candidates)))
+        target_games = self.initial_games
+        pool = Pool(self.processes) if self.processes > 1 else None
+        try:
+            while remaining:
+                tasks = self.__get_tasks__(candidates, remaining, games, target_games, seed)
+                results = pool.imap_unordered(_play_games, tasks) if pool else map(
+                    _play_games, tasks
+                )
+                for candidate_index, chunk_successes in results:
+                    successes[candidate_index] += chunk_successes
+                for candidate_index in remaining:
+                    games[candidate_index] = target_games
+                if len(remaining) == 1 or target_games == self.max_games:
+                    break
+                remaining.sort(key=lambda index: self.score(successes[index], games[index]))
+                remaining = remaining[:ceil(len(remaining) / self.reduction_factor)]
+                target_games = min(target_games * self.reduction_factor, self.max_games)
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        tuned = [
+            TunedLevel(
+                candidate, games[index], successes[index],
+                wilson_interval(successes[index], games[index], self.confidence)
+            )
+            for index, candidate in enumerate(candidates)
+        ]
+        return sorted(tuned, key=lambda level: (
+            -level.games, self.score(level.successes, level.games)
+        ))
+
+    def score(self, successes: int, games: int) -> Tuple[float, float]:
+        """
+        Ranks a measured success rate, lower is better.
+
+        Args:
+            successes (int): How many games were won.
+            games (int): How many games were played.
+
+        Returns:
+            Tuple[float, float]: The distance of the rate to the band (0 inside it),
+                then its distance to the middle of the band.
+        """
+        rate = successes / games if games else 0.0
+        low, high = self.target_band
+        return max(low - rate, rate - high, 0.0), abs(rate - (low + high) / 2)
+
+    def __get_tasks__(
+            self,
+            candidates: Sequence[LevelDefinition],
+            remaining: List[int],
+            games: List[int],
+            target_games: int,
+            seed: int) -> List[Tuple[int, LevelDefinition, str, int, int, int, int]]:
+        tasks = []
+        for candidate_index in remaining:
+            for first_game in range(games[candidate_index], target_games, self.chunk_size):
+                count = min(self.chunk_size, target_games - first_game)
+                tasks.append((
+                    candidate_index, candidates[candidate_index], self.bot_name,
+                    self.player_count, seed, first_game, count
+                ))
+        return tasks
+
+DEFAULT_SPACE = LevelParameterSpace(
+    extra_mission_types=((), (MissionType.PLAYER_SHOULD_NEVER_WIN,)),
+    order_token_options=(
+        (),
+        (OrderToken.FIRST_ABSOLUTE,),
+        (OrderToken.FIRST_ABSOLUTE, OrderToken.SECOND_ABSOLUTE),
+        (OrderToken.FIRST_RELATIVE, OrderToken.SECOND_RELATIVE),
+        (OrderToken.LAST_ABSOLUTE,),
+    ),
+)
+
+def main(argv: Sequence[str] | None = None) -> List[TunedLevel]:
+    """
+    Command line entry point: tunes a level from DEFAULT_SPACE and prints the best ones.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        List[TunedLevel]: Every candidate, the best first.
+    """
+    parser = argparse.ArgumentParser(description="Find levels with a target success rate.")
+    parser.add_argument("--target-low", type=float, required=True)
+    parser.add_argument("--target-high", type=float, required=True)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--initial-games", type=int, default=200)
+    parser.add_argument("--max-games", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=5)
+    arguments = parser.parse_args(argv)
+
+    tuner = LevelTuner(
+        (arguments.target_low, arguments.target_high),
+        arguments.bot,
+        arguments.players,
+        arguments.processes,
+        initial_games=arguments.initial_games,
+        max_games=arguments.max_games,
+    )
+    tuned_levels = tuner.tune(DEFAULT_SPACE.get_candidates(), arguments.seed)
+    for tuned in tuned_levels[:arguments.top]:
+        level = tuned.level_definition
+        low, high = tuned.confidence_interval
+        mission_types = ", ".join(
+            f"{mission_type.name} x{count}" for mission_type, count in level.mission_types.items()
+        )
+        order_tokens = ", ".join(token.name for token in level.order_tokens) or "no order tokens"
+        print(
+            f"{tuned.success_rate:.2%} [{low:.2%}, {high:.2%}] over {tuned.games} games: "
+            f"{mission_types}; {order_tokens}"
+        )
+    return tuned_levels
+
+if __name__ == "__main__":
+    main()
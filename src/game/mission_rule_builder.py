@@ -3,9 +3,14 @@ from src.model.level_definition import MissionType
 from src.game.mission_rules import MissionRule
 from src.model.card import Card
 from src.model.player_hand import Player
+from src.game.interface.async_player_interface import AsyncPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
 from src.model.level_definition import LevelDefinition
+from src.model.missions_order_data import MissionsOrderData
 from src.game.mission_rule_factories import (
+    AsyncPlayerHasToWinMissionRuleListFactory,
+    AsyncPlayerShouldNeverWinMissionRuleFactory,
+    OrderTokenMissionsOrderDataFactory,
     PlayerHasToWinMissionRuleListFactory,
     PlayerShouldNeverWinMissionRuleFactory,
     StaticMissionRuleFactory
@@ -67,3 +72,101 @@ class MissionRuleListBuilder:
             mission_rules.append(mission_rule)
 
         return mission_rules
+
+    def build_missions_order_data(
+        self,
+        mission_rules: List[MissionRule],
+        level_definition: LevelDefinition,
+        mission_cards: List[Card],
+    ) -> MissionsOrderData:
+        """
+        Build the MissionsOrderData for the mission rules, based on the level order tokens.
+
+        Args:
+            mission_rules (List[MissionRule]): The rules returned by build.
+            level_definition (LevelDefinition): contains the order tokens.
+            mission_cards (List[Card]): The mission cards, in the order tokens are attached.
+
+        Returns:
+            MissionsOrderData: The compiled order constraints.
+        """
+        return OrderTokenMissionsOrderDataFactory.create(
+            mission_rules,
+            mission_cards,
+            level_definition.order_tokens
+        )
+
+class AsyncMissionRuleListBuilder:
+    """
+    Coroutine version of MissionRuleListBuilder, asking the players
+    through an AsyncPlayerInterface. The missions built are the same.
+    """
+
+    def __init__(self, player_interface: AsyncPlayerInterface):
+        self.player_interface = player_interface
+        self.player_win_factory = AsyncPlayerHasToWinMissionRuleListFactory(player_interface)
+        self.player_never_win_factory = AsyncPlayerShouldNeverWinMissionRuleFactory(
+            player_interface
+        )
+
+    async def build(
+        self,
+        players: List[Player],
+        level_definition: LevelDefinition,
+        mission_cards: List[Card],
+    ) -> List[MissionRule]:
+        """
+        Build a list of mission rules based on the level definition and players.
+
+        Args:
+            players (List[Player]): The list of players participating.
+            level_definition (LevelDefinition): contains the mission types and metadata.
+            mission_cards (List[Card]): List of cards to assign for PLAYER_HAS_TO_WIN_CARD missions.
+
+        Returns:
+            List[MissionRule]: The list of constructed mission rules.
+        """
+        mission_rules: List[MissionRule] = []
+
+        if MissionType.PLAYER_HAS_TO_WIN_CARD in level_definition.mission_types:
+            mission_rules += await self.player_win_factory.create(players, mission_cards)
+
+        for mission_type in level_definition.mission_types:
+            if mission_type == MissionType.PLAYER_HAS_TO_WIN_CARD:
+                continue
+
+            if mission_type == MissionType.PLAYER_SHOULD_NEVER_WIN:
+                mission_rules.append(await self.player_never_win_factory.create(players))
+                continue
+
+            mission_rule = StaticMissionRuleFactory.create(
+                mission_type,
+                level_definition.missions_metadata
+            )
+            mission_rules.append(mission_rule)
+
+        return mission_rules
+
+    def build_missions_order_data(
+        self,
+        mission_rules: List[MissionRule],
+        level_definition: LevelDefinition,
+        mission_cards: List[Card],
+    ) -> MissionsOrderData:
+        """
+        Build the MissionsOrderData for the mission rules, based on the level order tokens.
+        It does not ask the players anything, so it is not a coroutine.
+
+        Args:
+            mission_rules (List[MissionRule]): The rules returned by build.
+            level_definition (LevelDefinition): contains the order tokens.
+            mission_cards (List[Card]): The mission cards, in the order tokens are attached.
+
+        Returns:
+            MissionsOrderData: The compiled order constraints.
+        """
+        return OrderTokenMissionsOrderDataFactory.create(
+            mission_rules,
+            mission_cards,
+            level_definition.order_tokens
+        )
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List
-from src.model.level_definition import MissionType
+from src.model.level_definition import MissionType, OrderToken
+from src.model.missions_order_data import MissionsOrderData
 from src.game.mission_rules import (
     NeverWinWithNumberRule,
     WinOnceWithNumberRule,
@@ -9,6 +10,7 @@ from src.game.mission_rules import (
 )
 from src.model.card import Card
 from src.model.player_hand import Player
+from src.game.interface.async_player_interface import AsyncPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
 from src.game.mission_rules import PlayerHasToWinCardRule
 
@@ -55,6 +57,20 @@ class PlayerShouldNeverWinMissionRuleFactory:
         selected_player = self.player_interface.select_player_that_should_not_win(players)
         return PlayerShouldNeverWinRule(player_that_should_never_win=selected_player)
 
+class AsyncPlayerShouldNeverWinMissionRuleFactory:
+    """Coroutine version of PlayerShouldNeverWinMissionRuleFactory."""
+
+    def __init__(self, player_interface: AsyncPlayerInterface):
+        self.player_interface = player_interface
+
+    async def create(self, players: List[Player]) -> PlayerShouldNeverWinRule:
+        """
+        Selects the player who should never win using AsyncPlayerInterface,
+        and returns the corresponding mission rule.
+        """
+        selected_player = await self.player_interface.select_player_that_should_not_win(players)
+        return PlayerShouldNeverWinRule(player_that_should_never_win=selected_player)
+
 class PlayerHasToWinMissionRuleListFactory:
     """Factory class for missions where a player needs to win a card."""
 
@@ -87,7 +103,7 @@ class PlayerHasToWinMissionRuleListFactory:
 
         while remaining_cards:
             player = players[player_index]
-            can_skip = self.__can_player_skip(remaining_cards, player_count, player_index)
+            can_skip = self.can_player_skip(remaining_cards, player_count, player_index)
 
             selected_card = self.player_interface.select_mission(
                 player.id, remaining_cards, can_skip=can_skip
@@ -103,12 +119,150 @@ class PlayerHasToWinMissionRuleListFactory:
 
         return assigned_rules
 
-    def __can_player_skip(
-        self,
+    @staticmethod
+    def can_player_skip(
         remaining_cards: List[Card],
         number_of_players: int,
         current_player_index: int,
     ) -> bool:
+        """
+        Checks if the players after the current one can still take every remaining mission.
+
+        Args:
+            remaining_cards (List[Card]): The mission cards not assigned yet.
+            number_of_players (int): The number of players.
+            current_player_index (int): The index of the player choosing a mission.
+
+        Returns:
+            bool: True if the player is allowed to skip.
+        """
         number_of_remaining_players = number_of_players - (current_player_index + 1)
         result = number_of_remaining_players >= len(remaining_cards)
         return result
+
+class AsyncPlayerHasToWinMissionRuleListFactory:
+    """
+    Coroutine version of PlayerHasToWinMissionRuleListFactory,
+    with the same distribution and skipping rules.
+    """
+
+    def __init__(self, player_interface: AsyncPlayerInterface):
+        self.player_interface = player_interface
+
+    async def create(
+        self,
+        players: List[Player],
+        mission_cards: List[Card],
+    ) -> List[PlayerHasToWinCardRule]:
+        """
+        Distributes PLAYER_HAS_TO_WIN_CARD missions among players according to the game rules.
+
+        Args:
+            players (List[Player]): List of players participating in the game.
+            mission_cards (List[Card]): List of cards to be assigned as missions.
+
+        Returns:
+            List[PlayerHasToWinCardRule]: The list of assigned mission rules.
+        """
+        player_count = len(players)
+        assigned_rules: List[PlayerHasToWinCardRule] = []
+        player_index = 0
+        remaining_cards = mission_cards.copy()
+
+        while remaining_cards:
+            player = players[player_index]
+            can_skip = PlayerHasToWinMissionRuleListFactory.can_player_skip(
+                remaining_cards, player_count, player_index
+            )
+
+            selected_card = await self.player_interface.select_mission(
+                player.id, remaining_cards, can_skip=can_skip
+            )
+
+            if selected_card:
+                assigned_rules.append(
+                    PlayerHasToWinCardRule(player=player, card=selected_card)
+                )
+                remaining_cards.remove(selected_card)
+
+            player_index = (player_index + 1) % player_count
+
+        return assigned_rules
+
+class OrderTokenMissionsOrderDataFactory:
+    """
+    Factory class that turns the order tokens attached to mission cards
+    into a compiled MissionsOrderData.
+
+    The token at index i is attached to the mission card at index i.
+    Absolute tokens fix the position of the mission, relative tokens chain
+    their missions in token order and the last token makes every other card
+    mission come before its mission.
+    """
+
+    ABSOLUTE_POSITIONS = {
+        OrderToken.FIRST_ABSOLUTE: 1,
+        OrderToken.SECOND_ABSOLUTE: 2,
+        OrderToken.THIRD_ABSOLUTE: 3,
+        OrderToken.FOURTH_ABSOLUTE: 4,
+        OrderToken.FIFTH_ABSOLUTE: 5,
+    }
+
+    RELATIVE_ORDER = (
+        OrderToken.FIRST_RELATIVE,
+        OrderToken.SECOND_RELATIVE,
+        OrderToken.THIRD_RELATIVE,
+        OrderToken.FOURTH_RELATIVE,
+    )
+
+    @classmethod
+    def create(
+        cls,
+        mission_rules: List[MissionRule],
+        mission_cards: List[Card],
+        order_tokens: List[OrderToken],
+    ) -> MissionsOrderData:
+        """
+        Builds the MissionsOrderData for the PLAYER_HAS_TO_WIN_CARD missions.
+
+        Args:
+            mission_rules (List[MissionRule]): The mission rules of the game.
+            mission_cards (List[Card]): The mission cards, in the order tokens are attached.
+            order_tokens (List[OrderToken]): The order tokens of the level.
+
+        Returns:
+            MissionsOrderData: The compiled order constraints.
+
+        Raises:
+            ValueError: If there are more tokens than mission cards, if a card with
+                a token has no mission, or if a token fixes a position past the last mission.
+        """
+        if len(order_tokens) > len(mission_cards):
+            raise ValueError("More order tokens than mission cards")
+
+        card_missions = [rule for rule in mission_rules if isinstance(rule, PlayerHasToWinCardRule)]
+        mission_by_card = {rule.card: rule for rule in card_missions}
+        builder = MissionsOrderData.builder().set_mission_count(len(mission_rules))
+        relative_missions: Dict[OrderToken, MissionRule] = {}
+
+        for token, card in zip(order_tokens, mission_cards):
+            if card not in mission_by_card:
+                raise ValueError(f"No mission for card with order token {token}")
+            mission = mission_by_card[card]
+
+            if token in cls.ABSOLUTE_POSITIONS:
+                builder.set_fixed_position(mission, cls.ABSOLUTE_POSITIONS[token])
+            elif token == OrderToken.LAST_ABSOLUTE:
+                for other_mission in card_missions:
+                    if other_mission != mission:
+                        builder.add_order_constraint(other_mission, mission)
+            else:
+                relative_missions[token] = mission
+
+        chain = [
+            relative_missions[token] for token in cls.RELATIVE_ORDER if token in relative_missions
+        ]
+        for before, after in zip(chain, chain[1:]):
+            builder.add_order_constraint(before, after)
+
+        return builder.build()
@@ -1,8 +1,61 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import Enum, auto
 from src.model.player_hand import Player
-from src.model.card import Card, CardsOperation
+from src.model.card import Card, CardSet, CardsOperation
 from src.model.game_data import GameData
+from src.model.round_data import RoundData
+
+class MissionStatus(Enum):
+    """Status of a mission after a trick is completed."""
+    PENDING = auto()
+    SATISFIED = auto()
+    BROKEN = auto()
+
+class MissionTracker(ABC):
+    """
+    Incrementally evaluates a mission rule for a single game.
+
+    The tracker is notified of completed tricks and keeps only the small
+    state it needs, so evaluating it never re-reads the previous rounds.
+    It only needs to be notified of the tricks matching its rule's MissionTrigger.
+    Once a tracker reports SATISFIED or BROKEN, it should not be notified again.
+    """
+
+    @abstractmethod
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        """
+        Updates the tracker state with a completed trick.
+
+        Args:
+            round_data (RoundData): The trick that was just completed.
+            is_last_round (bool): True if this was the last trick of the game.
+
+        Returns:
+            MissionStatus: The status of the mission after this trick.
+        """
+
+@dataclass(frozen=True)
+class MissionTrigger:
+    """
+    Declares which tricks can change the status of a mission rule.
+
+    A trick triggers the rule if it contains one of the cards, a card with one
+    of the numbers (rockets included), is won by one of the players, or is the
+    last trick of the game and the rule watches the end of the game.
+
+    Attributes:
+        cards (CardSet): Cards whose play may change the rule status.
+        numbers (frozenset[int]): Card numbers whose play may change the rule status.
+        player_ids (frozenset[int]): Players whose trick wins may change the rule status.
+        end_of_game (bool): If the rule must be evaluated on the last trick.
+        every_trick (bool): If the rule must be evaluated after every trick.
+    """
+    cards: CardSet = CardSet()
+    numbers: frozenset[int] = frozenset()
+    player_ids: frozenset[int] = frozenset()
+    end_of_game: bool = False
+    every_trick: bool = False
 
 class MissionRule(ABC):
     """
@@ -34,6 +87,25 @@ class MissionRule(ABC):
             True if the rule is broken, False otherwise.
         """
 
+    @abstractmethod
+    def create_tracker(self) -> MissionTracker:
+        """
+        Create a tracker that evaluates this rule incrementally during a game.
+
+        Returns:
+            A new MissionTracker for this rule.
+        """
+
+    def get_trigger(self) -> MissionTrigger:
+        """
+        Declare which tricks can change the status of this rule.
+        By default, the rule is evaluated after every trick.
+
+        Returns:
+            The MissionTrigger for this rule.
+        """
+        return MissionTrigger(every_trick=True)
+
 @dataclass(frozen=True)
 class PlayerHasToWinCardRule(MissionRule):
     """
@@ -44,18 +116,37 @@ class PlayerHasToWinCardRule(MissionRule):
 
     def is_rule_satisfied(self, game_data: GameData) -> bool:
         last_round = game_data.get_last_round()
-        if self.card not in last_round.get_played_cards():
+        if not last_round.has_played_card(self.card):
             return False
         winner, _ = last_round.get_winner()
         return winner == self.player
 
     def is_rule_broken(self, game_data: GameData) -> bool:
         last_round = game_data.get_last_round()
-        if self.card not in last_round.get_played_cards():
+        if not last_round.has_played_card(self.card):
             return False
         winner, _ = last_round.get_winner()
         return winner != self.player
 
+    def create_tracker(self) -> MissionTracker:
+        return PlayerHasToWinCardTracker(self)
+
+    def get_trigger(self) -> MissionTrigger:
+        return MissionTrigger(cards=CardSet.of([self.card]))
+
+class PlayerHasToWinCardTracker(MissionTracker):
+    """Tracker for PlayerHasToWinCardRule: decided on the trick where the card is played."""
+
+    def __init__(self, rule: PlayerHasToWinCardRule):
+        self.rule = rule
+
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        if not round_data.has_played_card(self.rule.card):
+            return MissionStatus.PENDING
+        if round_data.winner == self.rule.player:
+            return MissionStatus.SATISFIED
+        return MissionStatus.BROKEN
+
 @dataclass(frozen=True)
 class NeverWinWithNumberRule(MissionRule):
     """
@@ -64,21 +155,49 @@ class NeverWinWithNumberRule(MissionRule):
     number: int
 
     def is_rule_satisfied(self, game_data: GameData) -> bool:
-        all_cards_of_number = CardsOperation.get_cards_by_number(self.number)
-        all_cards_played = game_data.get_all_cards_played()
-        all_number_cards_played =  all_cards_of_number.issubset(all_cards_played)
+        all_cards_of_number = CardsOperation.get_card_set_by_number(self.number)
+        all_cards_played = game_data.get_played_card_set()
+        all_number_cards_played = all_cards_of_number.issubset(all_cards_played)
         if not game_data.is_finished() and not all_number_cards_played:
             return False
-        winning_card_numbers = {
-            card.number for _, card in (round_data.get_winner() for round_data in game_data.rounds)
-        }
-        return self.number not in winning_card_numbers
+        return game_data.count_wins_with_number(self.number) == 0
 
     def is_rule_broken(self, game_data: GameData) -> bool:
         last_round = game_data.get_last_round()
         _, winning_card = last_round.get_winner()
         return winning_card.number == self.number
 
+    def create_tracker(self) -> MissionTracker:
+        return NeverWinWithNumberTracker(self)
+
+    def get_trigger(self) -> MissionTrigger:
+        return MissionTrigger(numbers=frozenset({self.number}), end_of_game=True)
+
+class NeverWinWithNumberTracker(MissionTracker):
+    """
+    Tracker for NeverWinWithNumberRule: broken as soon as the number wins,
+    satisfied once every card of the number was played or the game ends.
+    """
+
+    def __init__(self, rule: NeverWinWithNumberRule, cards_not_played: CardSet | None = None):
+        """
+        Args:
+            rule (NeverWinWithNumberRule): The rule to track.
+            cards_not_played (CardSet | None): The cards of the number not played yet,
+                to resume tracking in the middle of a game. Defaults to all of them.
+        """
+        self.number = rule.number
+        self.cards_not_played = CardsOperation.get_card_set_by_number(rule.number) \
+            if cards_not_played is None else cards_not_played
+
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        if round_data.winning_card.number == self.number:
+            return MissionStatus.BROKEN
+        self.cards_not_played = self.cards_not_played - round_data.played_card_set
+        if is_last_round or not self.cards_not_played:
+            return MissionStatus.SATISFIED
+        return MissionStatus.PENDING
+
 @dataclass(frozen=True)
 class WinOnceWithNumberRule(MissionRule):
     """
@@ -94,10 +213,29 @@ class WinOnceWithNumberRule(MissionRule):
     def is_rule_broken(self, game_data: GameData) -> bool:
         if not game_data.is_finished():
             return False
-        winning_card_numbers = {
-            card.number for _, card in (round_data.get_winner() for round_data in game_data.rounds)
-        }
-        return self.number not in winning_card_numbers
+        return game_data.count_wins_with_number(self.number) == 0
+
+    def create_tracker(self) -> MissionTracker:
+        return WinOnceWithNumberTracker(self)
+
+    def get_trigger(self) -> MissionTrigger:
+        return MissionTrigger(numbers=frozenset({self.number}), end_of_game=True)
+
+class WinOnceWithNumberTracker(MissionTracker):
+    """
+    Tracker for WinOnceWithNumberRule: satisfied when the number wins a trick,
+    broken if the game ends before that.
+    """
+
+    def __init__(self, rule: WinOnceWithNumberRule):
+        self.number = rule.number
+
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        if round_data.winning_card.number == self.number:
+            return MissionStatus.SATISFIED
+        if is_last_round:
+            return MissionStatus.BROKEN
+        return MissionStatus.PENDING
 
 @dataclass(frozen=True)
 class WinWithAllTheseCardsRule(MissionRule):
@@ -105,6 +243,16 @@ class WinWithAllTheseCardsRule(MissionRule):
     Rule that specifies a player must win with all of the given cards.
     """
     cards_that_need_to_win: set[Card]
+    card_set_that_need_to_win: CardSet = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "card_set_that_need_to_win", CardSet.of(self.cards_that_need_to_win)
+        )
+
+    def __hash__(self):
+        # The card set field is not hashable, the equivalent CardSet is
+        return hash(self.card_set_that_need_to_win)
 
     def is_rule_satisfied(self, game_data: GameData) -> bool:
         return self.__won_with_all_cards__(game_data)
@@ -115,10 +263,30 @@ class WinWithAllTheseCardsRule(MissionRule):
         return not self.__won_with_all_cards__(game_data)
 
     def __won_with_all_cards__(self, game_data: GameData) -> bool:
-        winning_cards = {
-            card for _, card in (round_data.get_winner() for round_data in game_data.rounds)
-        }
-        return self.cards_that_need_to_win.issubset(winning_cards)
+        return self.card_set_that_need_to_win.issubset(game_data.get_winning_card_set())
+
+    def create_tracker(self) -> MissionTracker:
+        return WinWithAllTheseCardsTracker(self)
+
+    def get_trigger(self) -> MissionTrigger:
+        return MissionTrigger(cards=self.card_set_that_need_to_win, end_of_game=True)
+
+class WinWithAllTheseCardsTracker(MissionTracker):
+    """
+    Tracker for WinWithAllTheseCardsRule: satisfied once every card has won a trick,
+    broken if the game ends before that.
+    """
+
+    def __init__(self, rule: WinWithAllTheseCardsRule):
+        self.cards_not_won = rule.card_set_that_need_to_win
+
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        self.cards_not_won = self.cards_not_won.without_card(round_data.winning_card)
+        if not self.cards_not_won:
+            return MissionStatus.SATISFIED
+        if is_last_round:
+            return MissionStatus.BROKEN
+        return MissionStatus.PENDING
 
 @dataclass(frozen=True)
 class PlayerShouldNeverWinRule(MissionRule):
@@ -134,7 +302,29 @@ class PlayerShouldNeverWinRule(MissionRule):
         return self.__did_player_win__(game_data)
 
     def __did_player_win__(self, game_data: GameData) -> bool:
-        all_winners = {
-            winner for winner, _ in (round_data.get_winner() for round_data in game_data.rounds)
-        }
-        return self.player_that_should_never_win in all_winners
+        return game_data.count_tricks_won(self.player_that_should_never_win) > 0
+
+    def create_tracker(self) -> MissionTracker:
+        return PlayerShouldNeverWinTracker(self)
+
+    def get_trigger(self) -> MissionTrigger:
+        return MissionTrigger(
+            player_ids=frozenset({self.player_that_should_never_win.id}),
+            end_of_game=True
+        )
+
+class PlayerShouldNeverWinTracker(MissionTracker):
+    """
+    Tracker for PlayerShouldNeverWinRule: broken when the player wins a trick,
+    satisfied if the game ends before that.
+    """
+
+    def __init__(self, rule: PlayerShouldNeverWinRule):
+        self.player = rule.player_that_should_never_win
+
+    def on_trick_completed(self, round_data: RoundData, is_last_round: bool) -> MissionStatus:
+        if round_data.winner == self.player:
+            return MissionStatus.BROKEN
+        if is_last_round:
+            return MissionStatus.SATISFIED
+        return MissionStatus.PENDING
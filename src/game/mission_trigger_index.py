@@ -0,0 +1,61 @@
+from typing import Dict, List
+from src.game.mission_rules import MissionRule
+from src.model.card import ALL_CARDS, CardSet
+from src.model.round_data import RoundData
+
+class MissionTriggerIndex:
+    """
+    Index from trick facts (played cards, winner, end of game) to the mission rules
+    they can affect, built from each rule's MissionTrigger.
+
+    Attributes:
+        missions_by_card_id (List[List[MissionRule]]): Rules triggered by each card, by card id.
+        missions_by_player_id (Dict[int, List[MissionRule]]): Rules triggered by each trick winner.
+        end_of_game_missions (List[MissionRule]): Rules triggered by the last trick.
+        every_trick_missions (List[MissionRule]): Rules triggered by every trick.
+    """
+    def __init__(self, missions: List[MissionRule]):
+        self.missions_by_card_id: List[List[MissionRule]] = [[] for _ in ALL_CARDS]
+        self.missions_by_player_id: Dict[int, List[MissionRule]] = {}
+        self.end_of_game_missions: List[MissionRule] = []
+        self.every_trick_missions: List[MissionRule] = []
+
+        for mission in missions:
+            trigger = mission.get_trigger()
+            if trigger.every_trick:
+                self.every_trick_missions.append(mission)
+                continue
+
+            cards = trigger.cards | CardSet.of(
+                card for card in ALL_CARDS if card.number in trigger.numbers
+            )
+            for card in cards:
+                self.missions_by_card_id[card.id].append(mission)
+            for player_id in trigger.player_ids:
+                self.missions_by_player_id.setdefault(player_id, []).append(mission)
+            if trigger.end_of_game:
+                self.end_of_game_missions.append(mission)
+
+    def get_triggered_missions(
+            self,
+            round_data: RoundData,
+            is_last_round: bool) -> List[MissionRule]:
+        """
+        Retrieves the rules whose status may have changed with a completed trick.
+
+        Args:
+            round_data (RoundData): The trick that was just completed.
+            is_last_round (bool): True if this was the last trick of the game.
+
+        Returns:
+            List[MissionRule]: The triggered rules, without duplicates.
+        """
+        triggered: Dict[MissionRule, None] = dict.fromkeys(self.every_trick_missions)
+        for card in round_data.played_card_set:
+            triggered.update(dict.fromkeys(self.missions_by_card_id[card.id]))
+        if round_data.winner is not None:
+            winner_missions = self.missions_by_player_id.get(round_data.winner.id, [])
+            triggered.update(dict.fromkeys(winner_missions))
+        if is_last_round:
+            triggered.update(dict.fromkeys(self.end_of_game_missions))
+        return list(triggered)
@@ -1,5 +1,6 @@
 from src.model.player_hand import Player
 from src.model.round_data import RoundData
+from src.game.interface.async_player_interface import AsyncPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
 
 class RoundEngine:
@@ -7,6 +8,10 @@ class RoundEngine:
     Class responsible for managing a round of the game.
     This engine handles the logic for playing a round,]
     including card selection and round data tracking.
+
+    Attributes:
+        player_interface (PlayerInterface): chooses the card of each player,
+            seeing the cards already played on the round
     """
 
     def __init__(self, player_interface: PlayerInterface):
@@ -24,11 +29,11 @@ class RoundEngine:
         Returns:
             RoundData: The data of the played round, including played cards.
         """
-        round_data = RoundData(players)
+        round_data = RoundData(players, starter_player)
         cards_played_count = 0
         while cards_played_count < len(players):
             current_player = self.__define_player__(players, starter_player, cards_played_count)
-            card = self.player_interface.select_card(current_player)
+            card = self.player_interface.select_card(current_player, round_data)
             current_player.play_card(card)
             round_data.add_played_card(current_player, card)
             cards_played_count += 1
@@ -41,3 +46,38 @@ class RoundEngine:
             cards_count: int) -> Player:
         starter_index = players.index(starter_player)
         return players[(starter_index + cards_count) % len(players)]
+
+class AsyncRoundEngine:
+    """
+    Coroutine version of RoundEngine, to play many rounds on a single event loop.
+    The round is played the same way, only the cards are awaited.
+    It keeps nothing between two calls, so concurrent tables can share an engine.
+
+    Attributes:
+        player_interface (AsyncPlayerInterface): chooses the card of each player,
+            seeing the cards already played on the round
+    """
+
+    def __init__(self, player_interface: AsyncPlayerInterface):
+        self.player_interface = player_interface
+
+    async def play_round(self, players: list[Player], starter_player: Player) -> RoundData:
+        """
+        Executes a round of the game, allowing players to play cards in turn order,
+        and returns the round data (played cards, player actions, etc.).
+
+        Args:
+            players (list[Player]): List of players participating in the round.
+            starter_player (Player): The player who starts the round.
+
+        Returns:
+            RoundData: The data of the played round, including played cards.
+        """
+        round_data = RoundData(players, starter_player)
+        starter_index = players.index(starter_player)
+        for cards_played_count in range(len(players)):
+            current_player = players[(starter_index + cards_played_count) % len(players)]
+            card = await self.player_interface.select_card(current_player, round_data)
+            current_player.play_card(card)
+            round_data.add_played_card(current_player, card)
+        return round_data
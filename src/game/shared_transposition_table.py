@@ -0,0 +1,157 @@
+import struct
+from multiprocessing import shared_memory
+from typing import Tuple
+
+_ENTRY = struct.Struct("<QQ")
+_HEADER = struct.Struct("<QQ")
+_MAGIC = 0x5443_5245_5754_5431
+_MASK_64 = (1 << 64) - 1
+_USED = 1 << 63
+_DEPTH_SHIFT = 32
+_DEPTH_MASK = 0x7FFF_FFFF
+_VALUE_MASK = 0xFFFF_FFFF
+
+class SharedTranspositionTable:
+    """
+    Fixed-size transposition table stored in shared memory, so several processes
+    searching the same deal can reuse each other's results.
+
+    The table is split in buckets of ENTRIES_PER_BUCKET entries. A position goes to
+    the bucket given by its 64-bit key and replaces the entry with the same key,
+    an empty entry, or the entry searched with the smallest depth, as long as that
+    depth is not greater than its own.
+
+    Entries are written without locks. Each one keeps its data and its key XOR its
+    data, so an entry torn by two concurrent writes no longer matches its key and
+    is read as a miss.
+
+    Attributes:
+        name (str): The name of the shared memory block, used to attach to the table.
+        bucket_count (int): The number of buckets.
+    """
+    ENTRIES_PER_BUCKET = 4
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory = memory
+        self._owner = owner
+        magic, self.bucket_count = _HEADER.unpack_from(memory.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError("Shared memory does not hold a transposition table")
+        self.name = memory.name
+
+    @classmethod
+    def create(cls, bucket_count: int, name: str | None = None) -> "SharedTranspositionTable":
+        """
+        Allocates a new empty table.
+
+        Args:
+            bucket_count (int): The number of buckets.
+            name (str | None): The name of the shared memory block, or None for a random one.
+
+        Returns:
+            SharedTranspositionTable: The table, owned by the calling process.
+
+        Raises:
+            ValueError: If the bucket count is not positive.
+        """
+        if bucket_count < 1:
+            raise ValueError("Bucket count must be positive")
+        size = _HEADER.size + bucket_count * cls.ENTRIES_PER_BUCKET * _ENTRY.size
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, bucket_count)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTranspositionTable":
+        """
+        Attaches to a table created by another process.
+        Meant for worker processes started by the owner through multiprocessing,
+        which share its resource tracker, so the block outlives them.
+
+        Args:
+            name (str): The name of the table's shared memory block.
+
+        Returns:
+            SharedTranspositionTable: The table, which the calling process does not own.
+        """
+        memory = shared_memory.SharedMemory(name=name)
+        return cls(memory, owner=False)
+
+    def probe(self, key: int) -> Tuple[int, int] | None:
+        """
+        Looks up a position.
+
+        Args:
+            key (int): The 64-bit key of the position.
+
+        Returns:
+            Tuple[int, int] | None: The value and depth stored for the position, or None.
+        """
+        key &= _MASK_64
+        buffer = self._memory.buf
+        offset = self.__bucket_offset__(key)
+        for _ in range(self.ENTRIES_PER_BUCKET):
+            checked_key, data = _ENTRY.unpack_from(buffer, offset)
+            if data & _USED and checked_key ^ data == key:
+                return data & _VALUE_MASK, (data >> _DEPTH_SHIFT) & _DEPTH_MASK
+            offset += _ENTRY.size
+        return None
+
+    def store(self, key: int, value: int, depth: int) -> bool:
+        """
+        Stores the result of a position.
+
+        Args:
+            key (int): The 64-bit key of the position.
+            value (int): The result, between 0 and 2**32 - 1.
+            depth (int): How much search the result is worth (e.g. the number of cards left).
+
+        Returns:
+            bool: True if the result was stored, False if the bucket only holds deeper results.
+        """
+        key &= _MASK_64
+        buffer = self._memory.buf
+        bucket_offset = self.__bucket_offset__(key)
+        target_offset = None
+        target_depth = None
+        offset = bucket_offset
+        for _ in range(self.ENTRIES_PER_BUCKET):
+            checked_key, data = _ENTRY.unpack_from(buffer, offset)
+            if not data & _USED or checked_key ^ data == key:
+                target_offset, target_depth = offset, -1
+                break
+            entry_depth = (data >> _DEPTH_SHIFT) & _DEPTH_MASK
+            if target_depth is None or entry_depth < target_depth:
+                target_offset, target_depth = offset, entry_depth
+            offset += _ENTRY.size
+
+        if target_depth > depth:
+            return False
+        data = _USED | (depth & _DEPTH_MASK) << _DEPTH_SHIFT | (value & _VALUE_MASK)
+        _ENTRY.pack_into(buffer, target_offset, key ^ data, data)
+        return True
+
+    def clear(self):
+        """Empties every entry of the table."""
+        start = _HEADER.size
+        self._memory.buf[start:] = bytes(len(self._memory.buf) - start)
+
+    def close(self):
+        """
+        Detaches the calling process from the table.
+        The owner also frees the shared memory block.
+        """
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self) -> "SharedTranspositionTable":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __bucket_offset__(self, key: int) -> int:
+        bucket = key % self.bucket_count
+        return _HEADER.size + bucket * self.ENTRIES_PER_BUCKET * _ENTRY.size
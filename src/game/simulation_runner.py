@@ -0,0 +1,289 @@
+import argparse
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing.pool import Pool
+from typing import Iterator, List, Sequence, TextIO, Tuple
+
+from src.game.card_dealer import CardDealer
+from src.game.game_engine import GameEngine
+from src.game.interface.bot_player_interface import BOTS, BotPlayerInterface
+from src.game.mission_rule_builder import MissionRuleListBuilder
+from src.game.mission_rules import MissionRule
+from src.game.round_engine import RoundEngine
+from src.model import level_definition as levels
+from src.model.card import ALL_CARDS, CardType
+from src.model.level_definition import LevelDefinition, MissionType
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import CardHand, Player
+from src.model.zobrist import Zobrist
+
+LEVELS = {
+    "LEVEL_1": levels.LEVEL_1,
+    "LEVEL_2": levels.LEVEL_2,
+    "LEVEL_3": levels.LEVEL_3,
+    "LEVEL_4": levels.LEVEL_4,
+    "LEVEL_5": levels.LEVEL_5,
+}
+MISSION_CARDS = [card for card in ALL_CARDS if card.type != CardType.ROCKET]
+
+@dataclass(frozen=True, slots=True)
+class SimulationResult:
+    """
+    The outcome of one simulated game.
+
+    Attributes:
+        game_index (int): The index of the game in the batch.
+        seed (int): The seed the game was played with, which run_game replays.
+        success (bool): True if every mission was completed.
+        failed_mission (str | None): The type of the mission that failed, if any.
+        rounds_played (int): How many rounds were played before the game ended.
+    """
+    game_index: int
+    seed: int
+    success: bool
+    failed_mission: str | None
+    rounds_played: int
+
+@dataclass(frozen=True, slots=True)
+class SimulationSummary:
+    """
+    The totals of a batch of simulated games.
+
+    Attributes:
+        games (int): How many games were played.
+        successes (int): How many games completed every mission.
+        elapsed_seconds (float): The wall clock time of the batch.
+    """
+    games: int
+    successes: int
+    elapsed_seconds: float
+
+    @property
+    def success_rate(self) -> float:
+        """The fraction of games that completed every mission."""
+        return self.successes / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """How many games were played per second of wall clock time."""
+        return self.games / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+def derive_game_seed(master_seed: int, game_index: int) -> int:
+    """
+    Derives the seed of one game of a batch from the seed of the batch.
+
+    Args:
+        master_seed (int): The seed of the batch.
+        game_index (int): The index of the game in the batch.
+
+    Returns:
+        int: A 64-bit seed, unrelated to the seeds of the other games.
+    """
+    return Zobrist.mix(Zobrist.mix(master_seed) ^ game_index)
+
+def run_game(
+        level_definition: LevelDefinition,
+        bot_name: str,
+        player_count: int,
+        seed: int,
+        game_index: int = 0) -> SimulationResult:
+    """
+    Plays one complete game with bots, from the deal to the end of the missions.
+
+    Args:
+        level_definition (LevelDefinition): The level to play.
+        bot_name (str): The key of the bot in BOTS that plays for every player.
+        player_count (int): The number of players.
+        seed (int): The seed of the game. The deal and the bot choices use separate
+            streams derived from it.
+        game_index (int): The index of the game in its batch.
+
+    Returns:
+        SimulationResult: The outcome of the game.
+
+    Raises:
+        ValueError: If the bot is unknown.
+    """
+    if bot_name not in BOTS:
+        raise ValueError(f"Unknown bot: {bot_name}")
+    rng = random.Random(seed)
+    bot = BOTS[bot_name](rng)
+    round_engine = RoundEngine(bot)
+    players = [
+        Player(index + 1, f"Bot {index + 1}", CardHand()) for index in range(player_count)
+    ]
+
+    missions, mission_order_data = _build_missions(level_definition, bot, players)
+
+    engine = GameEngine(round_engine, CardDealer(random.Random(Zobrist.mix(seed))))
+    game_data, missions_data = engine.play_game(players, missions, mission_order_data)
+    failed_mission = next(iter(missions_data.failed_missions), None)
+    return SimulationResult(
+        game_index=game_index,
+        seed=seed,
+        success=missions_data.are_missions_complete(),
+        failed_mission=type(failed_mission).__name__ if failed_mission else None,
+        rounds_played=len(game_data.rounds),
+    )
+
+def _build_missions(
+        level_definition: LevelDefinition,
+        bot: BotPlayerInterface,
+        players: List[Player]) -> Tuple[List[MissionRule], MissionsOrderData]:
+    mission_count = level_definition.mission_types.get(MissionType.PLAYER_HAS_TO_WIN_CARD, 0)
+    mission_cards = bot.rng.sample(MISSION_CARDS, mission_count)
+    builder = MissionRuleListBuilder(bot)
+    missions = builder.build(players, level_definition, mission_cards)
+    return missions, builder.build_missions_order_data(missions, level_definition, mission_cards)
+
+def _run_game_task(task: Tuple[LevelDefinition, str, int, int, int]) -> SimulationResult:
+    level_definition, bot_name, player_count, seed, game_index = task
+    return run_game(level_definition, bot_name, player_count, seed, game_index)
+
+class SimulationRunner:
+    """
+    Plays batches of games with bots, spread over a pool of processes.
+
+    Each game gets its own random generators, seeded by derive_game_seed from the
+    seed of the batch and the game index, so workers share no random state, a batch
+    can be replayed, and any single game can be replayed with run_game.
+
+    Used as a context manager, the runner keeps its pool of processes open between
+    calls, so a batch can be played in several parts without restarting workers.
+
+    Attributes:
+        level_definition (LevelDefinition): The level to play.
+        bot_name (str): The key of the bot in BOTS that plays for every player.
+        player_count (int): The number of players.
+        processes (int): The number of worker processes, 1 to play in this process.
+    """
+    def __init__(
+            self,
+            level_definition: LevelDefinition,
+            bot_name: str = "random",
+            player_count: int = 4,
+            processes: int = 1):
+        """
+        Args:
+            level_definition (LevelDefinition): The level to play.
+            bot_name (str): The key of the bot in BOTS that plays for every player.
+            player_count (int): The number of players.
+            processes (int): The number of worker processes, 1 to play in this process.
+
+        Raises:
+            ValueError: If the bot is unknown or the counts are not positive.
+        """
+        if bot_name not in BOTS:
+            raise ValueError(f"Unknown bot: {bot_name}")
+        if player_count < 1 or processes < 1:
+            raise ValueError("Player and process counts must be positive")
+        self.level_definition = level_definition
+        self.bot_name = bot_name
+        self.player_count = player_count
+        self.processes = processes
+        self._pool: Pool | None = None
+
+    def __enter__(self) -> "SimulationRunner":
+        if self.processes > 1:
+            self._pool = Pool(self.processes)
+        return self
+
+    def __exit__(self, *_):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def iterate(
+            self,
+            games: int,
+            seed: int = 0,
+            first_game: int = 0) -> Iterator[SimulationResult]:
+        """
+        Plays a batch of games, yielding each result as soon as it is ready.
+
+        Args:
+            games (int): How many games to play.
+            seed (int): The seed of the batch.
+            first_game (int): The index of the first game, to continue a batch.
+
+        Returns:
+            Iterator[SimulationResult]: The results, in completion order.
+        """
+        tasks = (
+            (
+                self.level_definition,
+                self.bot_name,
+                self.player_count,
+                derive_game_seed(seed, index),
+                index,
+            )
+            for index in range(first_game, first_game + games)
+        )
+        if self.processes == 1:
+            yield from map(_run_game_task, tasks)
+            return
+        chunk_size = max(1, games // (self.processes * 16))
+        if self._pool is not None:
+            yield from self._pool.imap_unordered(_run_game_task, tasks, chunk_size)
+            return
+        with Pool(self.processes) as pool:
+            yield from pool.imap_unordered(_run_game_task, tasks, chunk_size)
+
+    def run(self, games: int, seed: int = 0, output: TextIO | None = None) -> SimulationSummary:
+        """
+        Plays a batch of games, streaming each result as a JSON line.
+
+        Args:
+            games (int): How many games to play.
+            seed (int): The seed of the batch.
+            output (TextIO | None): Where to write the results, if anywhere.
+
+        Returns:
+            SimulationSummary: The totals of the batch.
+        """
+        start = time.perf_counter()
+        successes = 0
+        for result in self.iterate(games, seed):
+            successes += result.success
+            if output is not None:
+                output.write(json.dumps(asdict(result)) + "\n")
+        return SimulationSummary(games, successes, time.perf_counter() - start)
+
+def main(argv: Sequence[str] | None = None) -> SimulationSummary:
+    """
+    Command line entry point: plays a batch of games and prints its totals.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, or None to read them from sys.argv.
+
+    Returns:
+        SimulationSummary: The totals of the batch.
+    """
+    parser = argparse.ArgumentParser(description="Play games of The Crew with bots.")
+    parser.add_argument("--level", choices=sorted(LEVELS), default="LEVEL_1")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON lines file for the results of each game")
+    arguments = parser.parse_args(argv)
+
+    runner = SimulationRunner(
+        LEVELS[arguments.level], arguments.bot, arguments.players, arguments.processes
+    )
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            summary = runner.run(arguments.games, arguments.seed, output)
+    else:
+        summary = runner.run(arguments.games, arguments.seed)
+
+    print(f"games: {summary.games}")
+    print(f"success rate: {summary.success_rate:.2%}")
+    print(f"games/second: {summary.games_per_second:.1f}")
+    return summary
+
+if __name__ == "__main__":
+    main()
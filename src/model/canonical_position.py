@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+from src.model.card import ALL_CARDS, COLOR_TYPES, Card, CardSet, CardType
+from src.model.round_data import RoundData
+
+_SUIT_SIZE = 9
+_SUIT_BITS = (1 << _SUIT_SIZE) - 1
+_ROCKET_SHIFT = len(COLOR_TYPES) * _SUIT_SIZE
+_ROCKET_BITS = 0xF
+_ALL_CARDS_MASK = CardSet.of(ALL_CARDS).mask
+
+@dataclass(frozen=True, slots=True)
+class CanonicalPosition:
+    """
+    Canonical form of a position under the symmetries of the colour suits.
+
+    The four colour types behave the same way in the rules, so positions that only
+    differ by a permutation of them have the same outcome, as long as the mission
+    cards are permuted with them (they are part of the position). With rank
+    compression, the cards no longer in play are dropped and the remaining cards of
+    each type are renumbered from 1, keeping their order; this is only valid when no
+    mission depends on card numbers (e.g. NeverWinWithNumberRule).
+
+    The colour types are sorted by their content on every card set of the position,
+    so equivalent positions share the same key. Up to 24 positions share a key from
+    the suit permutations alone.
+
+    Attributes:
+        key (Tuple[int, ...]): The hashable canonical form (extra values, then card set masks).
+        suit_order (Tuple[CardType, ...]): The original colour type moved to each canonical one,
+            in COLOR_TYPES order.
+        alive_mask (int): The cards kept by the rank compression, or every card without it.
+    """
+    key: Tuple[int, ...]
+    suit_order: Tuple[CardType, ...]
+    alive_mask: int
+
+    @classmethod
+    def of(
+            cls,
+            card_sets: Sequence[CardSet],
+            extra: Tuple[int, ...] = (),
+            compress_ranks: bool = True) -> "CanonicalPosition":
+        """
+        Canonicalizes a position given as card sets (hands, trick, mission cards...).
+
+        Args:
+            card_sets (Sequence[CardSet]): The card sets of the position, in a fixed layout.
+            extra (Tuple[int, ...]): Values that suit permutations do not change (e.g. the leader).
+            compress_ranks (bool): Whether to drop the cards that are in no card set.
+
+        Returns:
+            CanonicalPosition: The canonical form of the position.
+        """
+        alive_mask = _ALL_CARDS_MASK
+        if compress_ranks:
+            alive_mask = 0
+            for card_set in card_sets:
+                alive_mask |= card_set.mask
+
+        chunks_by_suit = [
+            cls.__get_suit_chunks__(card_sets, alive_mask, index * _SUIT_SIZE)
+            for index in range(len(COLOR_TYPES))
+        ]
+        order = sorted(range(len(COLOR_TYPES)), key=lambda index: chunks_by_suit[index])
+
+        alive_rockets = alive_mask >> _ROCKET_SHIFT
+        masks = []
+        for position, card_set in enumerate(card_sets):
+            mask = cls.__compress__(card_set.mask >> _ROCKET_SHIFT, alive_rockets) << _ROCKET_SHIFT
+            for slot, index in enumerate(order):
+                mask |= chunks_by_suit[index][position] << (slot * _SUIT_SIZE)
+            masks.append(mask)
+
+        return cls(
+            key=tuple(extra) + tuple(masks),
+            suit_order=tuple(COLOR_TYPES[index] for index in order),
+            alive_mask=alive_mask,
+        )
+
+    @classmethod
+    def of_round(
+            cls,
+            round_data: RoundData,
+            mission_card_sets: Sequence[CardSet] = (),
+            compress_ranks: bool = True) -> "CanonicalPosition":
+        """
+        Canonicalizes the position of a round: the hands, the trick and the leader.
+
+        Args:
+            round_data (RoundData): The round being played.
+            mission_card_sets (Sequence[CardSet]): The cards referenced by each mission,
+                in a fixed order, so that they are permuted with the hands.
+            compress_ranks (bool): Whether to drop the cards that are no longer in play.
+
+        Returns:
+            CanonicalPosition: The canonical form of the position.
+        """
+        players = list(round_data.players)
+        hands = [player.card_hand.card_set for player in players]
+        trick = [
+            CardSet.of([round_data.card_by_player[player]])
+            if player in round_data.card_by_player else CardSet()
+            for player in players
+        ]
+        alive_mask = _ALL_CARDS_MASK
+        if compress_ranks:
+            alive_mask = round_data.played_card_set.mask
+            for hand in hands:
+                alive_mask |= hand.mask
+        missions = [CardSet(card_set.mask & alive_mask) for card_set in mission_card_sets]
+
+        leader = round_data.get_leader()
+        leader_index = players.index(leader) if leader is not None else -1
+        return cls.of(hands + trick + missions, (leader_index,), compress_ranks)
+
+    def to_canonical_card(self, card: Card) -> Card:
+        """
+        Maps a card of the original position to the canonical position.
+
+        Args:
+            card (Card): A card kept in the canonical position.
+
+        Returns:
+            Card: The same card in the canonical position.
+        """
+        if card.type == CardType.ROCKET:
+            shift, canonical_shift = _ROCKET_SHIFT, _ROCKET_SHIFT
+        else:
+            shift = COLOR_TYPES.index(card.type) * _SUIT_SIZE
+            canonical_shift = self.suit_order.index(card.type) * _SUIT_SIZE
+        alive_below = (self.alive_mask >> shift) & ((1 << (card.id - shift)) - 1)
+        return ALL_CARDS[canonical_shift + alive_below.bit_count()]
+
+    def from_canonical_card(self, card: Card) -> Card:
+        """
+        Maps a card of the canonical position back to the original position.
+
+        Args:
+            card (Card): A card of the canonical position.
+
+        Returns:
+            Card: The same card in the original position.
+        """
+        if card.type == CardType.ROCKET:
+            shift, bits, canonical_shift = _ROCKET_SHIFT, _ROCKET_BITS, _ROCKET_SHIFT
+        else:
+            canonical_shift = COLOR_TYPES.index(card.type) * _SUIT_SIZE
+            shift = COLOR_TYPES.index(self.suit_order[canonical_shift // _SUIT_SIZE]) * _SUIT_SIZE
+            bits = _SUIT_BITS
+        alive_chunk = (self.alive_mask >> shift) & bits
+        for _ in range(card.id - canonical_shift):
+            alive_chunk &= alive_chunk - 1
+        return ALL_CARDS[shift + (alive_chunk & -alive_chunk).bit_length() - 1]
+
+    @classmethod
+    def __get_suit_chunks__(
+            cls, card_sets: Sequence[CardSet], alive_mask: int, shift: int) -> Tuple[int, ...]:
+        alive_chunk = (alive_mask >> shift) & _SUIT_BITS
+        return tuple(
+            cls.__compress__((card_set.mask >> shift) & _SUIT_BITS, alive_chunk)
+            for card_set in card_sets
+        )
+
+    @classmethod
+    def __compress__(cls, value: int, alive: int) -> int:
+        # Packs the bits of value found at the alive positions, keeping their order.
+        compressed = 0
+        position = 0
+        while alive:
+            lowest = alive & -alive
+            if value & lowest:
+                compressed |= 1 << position
+            position += 1
+            alive ^= lowest
+        return compressed
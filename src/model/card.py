@@ -1,5 +1,6 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
 
 class CardType(Enum):
     """
@@ -12,7 +13,7 @@ class CardType(Enum):
     GREEN = "GREEN"
     ROCKET = "ROCKET"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     """
     Represents a card in the game with a specific type and number.
@@ -20,15 +21,27 @@ class Card:
     Attributes:
         type (str): The type of the card (e.g., BLUE, YELLOW).
         number (int): The number of the card (1-9 for most types, 1-4 for ROCKET).
+        id (int): The stable index of the card in ALL_CARDS (0-39).
+        bit (int): The bit that represents this card on a CardSet mask.
     """
     type: str
     number: int
+    id: int = field(default=-1, compare=False)
+    bit: int = field(init=False, repr=False, compare=False)
 
     _locked = False
 
     def __post_init__(self):
         if Card._locked:
             raise RuntimeError("Cannot create new Card instances")
+        object.__setattr__(self, "bit", 1 << self.id)
+
+    def __hash__(self):
+        return self.id
+
+    def __reduce__(self):
+        # Cards are singletons, so unpickling must return the existing instance
+        return CardsOperation.get_card_by_id, (self.id,)
 
     @classmethod
     def lock(cls):
@@ -37,30 +50,125 @@ class Card:
         """
         cls._locked = True
 
+@dataclass(frozen=True, slots=True)
+class CardSet:
+    """
+    An immutable set of cards backed by a single integer bitmask.
+
+    Each card of ALL_CARDS owns one bit, so set operations are plain
+    integer operations and no card hashing is involved.
+
+    Attributes:
+        mask (int): The bitmask with one bit set for each card in the set.
+    """
+    mask: int = 0
+
+    @classmethod
+    def of(cls, cards: Iterable[Card]) -> "CardSet":
+        """
+        Creates a CardSet containing the given cards.
+
+        Args:
+            cards (Iterable[Card]): The cards to put in the set.
+
+        Returns:
+            CardSet: A set with the given cards.
+        """
+        mask = 0
+        for card in cards:
+            mask |= card.bit
+        return cls(mask)
+
+    def with_card(self, card: Card) -> "CardSet":
+        """
+        Returns a new CardSet with the given card added.
+
+        Args:
+            card (Card): The card to add.
+
+        Returns:
+            CardSet: This set plus the given card.
+        """
+        return CardSet(self.mask | card.bit)
+
+    def without_card(self, card: Card) -> "CardSet":
+        """
+        Returns a new CardSet with the given card removed.
+
+        Args:
+            card (Card): The card to remove.
+
+        Returns:
+            CardSet: This set minus the given card.
+        """
+        return CardSet(self.mask & ~card.bit)
+
+    def issubset(self, other: "CardSet") -> bool:
+        """
+        Checks if every card in this set is also in the other set.
+
+        Args:
+            other (CardSet): The set to compare against.
+
+        Returns:
+            bool: True if this set is a subset of the other set.
+        """
+        return self.mask & ~other.mask == 0
+
+    def to_set(self) -> set[Card]:
+        """
+        Converts this CardSet to a regular Python set.
+
+        Returns:
+            set[Card]: The cards in this set.
+        """
+        return set(self)
+
+    def __contains__(self, card: Card) -> bool:
+        return self.mask & card.bit != 0
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self) -> Iterator[Card]:
+        mask = self.mask
+        while mask:
+            lowest_bit = mask & -mask
+            yield ALL_CARDS[lowest_bit.bit_length() - 1]
+            mask ^= lowest_bit
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask | other.mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & other.mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & ~other.mask)
+
 class CardsOperation:
     """
     A class that provides operations for retrieving cards based on their attributes.
     """
 
     @classmethod
-    def get_cards_by_number(cls, number: int) -> set[Card]:
+    def get_cards_by_number(cls, number: int) -> frozenset[Card]:
         """
-        Retrieves all cards of a specific number, excluding ROCKET cards.
+        Retrieves all cards of a specific number, including the ROCKET card of that number.
 
         Args:
             number (int): The number of the cards to retrieve.
 
         Returns:
-            set[Card]: A set of cards with the specified number (excluding ROCKET cards).
+            frozenset[Card]: The cards with the specified number.
         """
-        return {
-            card
-            for card in ALL_CARDS
-            if card.number == number and card.type != CardType.ROCKET.value
-        }
+        return _CARDS_BY_NUMBER.get(number, frozenset())
 
     @classmethod
-    def get_cards_by_type(cls, card_type: CardType) -> set[Card]:
+    def get_cards_by_type(cls, card_type: CardType) -> frozenset[Card]:
         """
         Retrieves all cards of a specific type.
 
@@ -68,19 +176,61 @@ class CardsOperation:
             card_type (CardType): The type of cards to retrieve.
 
         Returns:
-            set[Card]: A set of cards of the specified type.
+            frozenset[Card]: The cards of the specified type.
         """
-        return {card for card in ALL_CARDS if card.type == card_type}
+        return _CARDS_BY_TYPE[card_type]
+
+    @classmethod
+    def get_card_set_by_number(cls, number: int) -> CardSet:
+        """
+        Retrieves all cards of a specific number, including the ROCKET card of that number,
+        as a CardSet.
+
+        Args:
+            number (int): The number of the cards to retrieve.
+
+        Returns:
+            CardSet: The cards with the specified number.
+        """
+        return _CARD_SET_BY_NUMBER.get(number, CardSet())
+
+    @classmethod
+    def get_card_set_by_type(cls, card_type: CardType) -> CardSet:
+        """
+        Retrieves all cards of a specific type as a CardSet.
+
+        Args:
+            card_type (CardType): The type of cards to retrieve.
+
+        Returns:
+            CardSet: The cards of the specified type.
+        """
+        return _CARD_SET_BY_TYPE[card_type]
+
+    @classmethod
+    def get_card_by_id(cls, card_id: int) -> Card:
+        """
+        Retrieves a card by its id.
+
+        Args:
+            card_id (int): The id of the card (its index in ALL_CARDS).
+
+        Returns:
+            Card: The card with the given id.
+        """
+        return ALL_CARDS[card_id]
 
 ## Global Cards definitions
 
-ALL_CARDS = (
-    [Card(type, number)
-     for type in (CardType.BLUE, CardType.YELLOW, CardType.PINK, CardType.GREEN)
-     for number in range(1, 10)] +
-    [Card(CardType.ROCKET, number)
-     for number in range(1, 5)]
-)
+COLOR_TYPES = (CardType.BLUE, CardType.YELLOW, CardType.PINK, CardType.GREEN)
+
+ALL_CARDS = [
+    Card(card_type, number, card_id)
+    for card_id, (card_type, number) in enumerate(
+        [(card_type, number) for card_type in COLOR_TYPES for number in range(1, 10)] +
+        [(CardType.ROCKET, number) for number in range(1, 5)]
+    )
+]
 
 (BLUE_1, BLUE_2, BLUE_3, BLUE_4, BLUE_5, BLUE_6, BLUE_7, BLUE_8, BLUE_9,
  YELLOW_1, YELLOW_2, YELLOW_3, YELLOW_4, YELLOW_5, YELLOW_6, YELLOW_7, YELLOW_8, YELLOW_9,
@@ -88,6 +238,19 @@ ALL_CARDS = (
  GREEN_1, GREEN_2, GREEN_3, GREEN_4, GREEN_5, GREEN_6, GREEN_7, GREEN_8, GREEN_9,
  ROCKET_1, ROCKET_2, ROCKET_3, ROCKET_4) = ALL_CARDS
 
+## Lookup tables, built once so that card queries never allocate
+
+_CARDS_BY_NUMBER = {
+    number: frozenset(card for card in ALL_CARDS if card.number == number)
+    for number in range(1, 10)
+}
+_CARDS_BY_TYPE = {
+    card_type: frozenset(card for card in ALL_CARDS if card.type == card_type)
+    for card_type in CardType
+}
+_CARD_SET_BY_NUMBER = {number: CardSet.of(cards) for number, cards in _CARDS_BY_NUMBER.items()}
+_CARD_SET_BY_TYPE = {card_type: CardSet.of(cards) for card_type, cards in _CARDS_BY_TYPE.items()}
+
 ALL_ROCKETS = CardsOperation.get_cards_by_type(CardType.ROCKET)
 
 # Lock class to prevent further instances
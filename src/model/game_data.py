@@ -1,8 +1,78 @@
 from dataclasses import dataclass, field
 from src.model.round_data import RoundData
-from src.model.card import Card
+from src.model.player_hand import Player
+from src.model.card import Card, CardSet
+from src.model.zobrist import Zobrist, ZobristKind
 
-@dataclass(frozen=True)
+class GameStatistics:
+    """
+    Index of facts derived from the rounds of a game, updated once per finished round
+    so that mission rules can query them without rescanning every round.
+
+    Attributes:
+        round_winners (list[Player]): The winner of each round, in order.
+        winning_card_set (CardSet): The cards that won a round.
+        played_card_set (CardSet): The cards played across all rounds.
+        wins_by_number (dict[int, int]): How many rounds were won by a card of each number.
+        tricks_by_player_id (dict[int, int]): How many rounds each player (by id) won.
+        progress_hash (int): Zobrist hash of which player captured each card and with which
+            winning card, which is everything the mission rules depend on.
+    """
+    __slots__ = (
+        "round_winners", "winning_card_set", "played_card_set",
+        "wins_by_number", "tricks_by_player_id", "progress_hash"
+    )
+
+    def __init__(self):
+        self.round_winners: list[Player] = []
+        self.winning_card_set = CardSet()
+        self.played_card_set = CardSet()
+        self.wins_by_number: dict[int, int] = {}
+        self.tricks_by_player_id: dict[int, int] = {}
+        self.progress_hash = 0
+
+    def add_round(self, round_data: RoundData):
+        """
+        Updates the statistics with a finished round. Rounds without cards are ignored.
+
+        Args:
+            round_data (RoundData): The round that was just played.
+        """
+        if round_data.winning_card is None:
+            return
+        winner, winning_card = round_data.get_winner()
+        self.round_winners.append(winner)
+        self.winning_card_set = self.winning_card_set.with_card(winning_card)
+        self.played_card_set = self.played_card_set | round_data.played_card_set
+        self.wins_by_number[winning_card.number] = \
+            self.wins_by_number.get(winning_card.number, 0) + 1
+        self.tricks_by_player_id[winner.id] = self.tricks_by_player_id.get(winner.id, 0) + 1
+
+        self.progress_hash ^= Zobrist.player_card_key(ZobristKind.WON_WITH, winner.id, winning_card)
+        for card in round_data.played_card_set:
+            self.progress_hash ^= Zobrist.player_card_key(ZobristKind.CAPTURED, winner.id, card)
+
+    def remove_round(self, round_data: RoundData):
+        """
+        Reverts add_round for the last round added.
+
+        Args:
+            round_data (RoundData): The last round that was added.
+        """
+        if round_data.winning_card is None:
+            return
+        winner, winning_card = round_data.get_winner()
+        self.round_winners.pop()
+        self.winning_card_set = self.winning_card_set.without_card(winning_card)
+        self.played_card_set = self.played_card_set - round_data.played_card_set
+        self.wins_by_number[winning_card.number] -= 1
+        self.tricks_by_player_id[winner.id] -= 1
+
+        self.progress_hash ^= Zobrist.player_card_key(ZobristKind.WON_WITH, winner.id, winning_card)
+        for card in round_data.played_card_set:
+            self.progress_hash ^= Zobrist.player_card_key(ZobristKind.CAPTURED, winner.id, card)
+
+@dataclass(frozen=True, slots=True)
 class GameData:
     """
     Represents the data for the game, including the number of rounds and the rounds themselves.
@@ -10,19 +80,41 @@ class GameData:
     Attributes:
         number_of_rounds (int): The total number of rounds in the game.
         rounds (list[RoundData]): A list of RoundData objects representing the rounds played.
+        statistics (GameStatistics): Facts derived from the rounds played so far.
     """
     number_of_rounds: int
     rounds: list[RoundData] = field(default_factory=list)
+    statistics: GameStatistics = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "statistics", GameStatistics())
+        for round_data in self.rounds:
+            self.statistics.add_round(round_data)
 
     def add_round(self, round_data: RoundData):
         """
-        Adds a new round to the game.
+        Adds a new round to the game. The round must be finished (all cards played).
 
         Args:
             round_data (RoundData): The round data to be added.
         """
+        self.statistics.add_round(round_data)
         return self.rounds.append(round_data)
 
+    def remove_last_round(self) -> RoundData:
+        """
+        Removes the last round added to the game, undoing add_round.
+
+        Raises:
+            ValueError: If no rounds have been played yet.
+
+        Returns:
+            RoundData: The round that was removed.
+        """
+        round_data = self.get_last_round()
+        self.statistics.remove_round(round_data)
+        return self.rounds.pop()
+
     def is_finished(self) -> bool:
         """
         Checks if the game is finished.
@@ -54,4 +146,78 @@ class GameData:
         Returns:
             set[Card]: A set of all cards that have been played across all rounds.
         """
-        return set().union(*(round_data.get_played_cards() for round_data in self.rounds))
+        return self.get_played_card_set().to_set()
+
+    def get_played_card_set(self) -> CardSet:
+        """
+        Retrieves all cards played in the game as a CardSet.
+
+        Returns:
+            CardSet: The cards that have been played across all rounds.
+        """
+        return self.statistics.played_card_set
+
+    def get_round_winners(self) -> list[Player]:
+        """
+        Retrieves the winner of each round played, in order.
+
+        Returns:
+            list[Player]: The winners of the rounds played so far.
+        """
+        return self.statistics.round_winners
+
+    def get_winning_card_set(self) -> CardSet:
+        """
+        Retrieves the cards that won a round.
+
+        Returns:
+            CardSet: The winning cards of the rounds played so far.
+        """
+        return self.statistics.winning_card_set
+
+    def count_wins_with_number(self, number: int) -> int:
+        """
+        Counts how many rounds were won by a card with the given number.
+
+        Args:
+            number (int): The card number.
+
+        Returns:
+            int: The number of rounds won by a card with that number.
+        """
+        return self.statistics.wins_by_number.get(number, 0)
+
+    def count_tricks_won(self, player: Player) -> int:
+        """
+        Counts how many rounds were won by the given player.
+
+        Args:
+            player (Player): The player.
+
+        Returns:
+            int: The number of rounds won by the player.
+        """
+        return self.statistics.tricks_by_player_id.get(player.id, 0)
+
+    def get_progress_hash(self) -> int:
+        """
+        Retrieves the Zobrist hash of the finished rounds: who captured each card
+        and with which winning card. Mission progress is a function of these facts.
+
+        Returns:
+            int: The hash of the game progress.
+        """
+        return self.statistics.progress_hash
+
+    def get_state_hash(self, current_round: RoundData) -> int:
+        """
+        Retrieves the Zobrist hash of the whole position: the game progress plus the
+        hands, trick and leader of the current round.
+
+        Args:
+            current_round (RoundData): The round being played (not yet added to the game).
+
+        Returns:
+            int: The hash of the position.
+        """
+        return self.statistics.progress_hash ^ current_round.get_state_hash()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from src.game.mission_rules import MissionRule
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameMissionsData:
     """
     Represents the data for mission on the game
@@ -0,0 +1,146 @@
+from typing import List
+from src.model.card import Card, CardSet
+from src.model.game_data import GameData
+from src.model.player_hand import Player
+from src.model.round_data import RoundData
+
+class GameState:
+    """
+    A game position that can be advanced and rolled back in place, card by card.
+
+    play_card removes the card from the current player's hand, adds it to the current
+    round and, once every player has played, adds the round to the game data and
+    starts the next round led by the winner. undo_card reverts exactly one play_card.
+    The played rounds are the move stack, so exploring a line of play never copies
+    players, hands or game data, and round objects are recycled.
+
+    Attributes:
+        players (List[Player]): The players, in playing order.
+        game_data (GameData): The finished rounds of the game.
+        current_round (RoundData): The round being played.
+    """
+    __slots__ = ("players", "game_data", "current_round", "_leader_index", "_spare_rounds")
+
+    def __init__(self, players: List[Player], leader: Player, game_data: GameData | None = None):
+        """
+        Initializes the position with the current hands of the players.
+
+        Args:
+            players (List[Player]): The players, in playing order.
+            leader (Player): The player who starts the current round.
+            game_data (GameData | None): The rounds already played. If not given,
+                a new game is created with one round per card in the largest hand.
+        """
+        self.players = players
+        self.game_data = game_data if game_data is not None else \
+            GameData(max(len(player.card_hand.card_set) for player in players))
+        self._leader_index = players.index(leader)
+        self.current_round = RoundData(players, leader)
+        self._spare_rounds: List[RoundData] = []
+
+    def get_leader(self) -> Player:
+        """
+        Retrieves the player who starts the current round.
+
+        Returns:
+            Player: The leader of the current round.
+        """
+        return self.players[self._leader_index]
+
+    def get_current_player(self) -> Player:
+        """
+        Retrieves the player who must play the next card.
+
+        Returns:
+            Player: The player to act.
+        """
+        cards_played = len(self.current_round.card_by_player)
+        return self.players[(self._leader_index + cards_played) % len(self.players)]
+
+    def get_legal_card_set(self) -> CardSet:
+        """
+        Retrieves the cards the current player is allowed to play.
+
+        Returns:
+            CardSet: The playable cards of the current player.
+        """
+        hand = self.get_current_player().card_hand
+        return hand.get_playable_card_set(self.current_round.round_type)
+
+    def is_finished(self) -> bool:
+        """
+        Checks if every round of the game was played.
+
+        Returns:
+            bool: True if the game is finished.
+        """
+        return self.game_data.is_finished()
+
+    def play_card(self, card: Card) -> RoundData | None:
+        """
+        Plays a card for the current player.
+
+        Args:
+            card (Card): The card to play.
+
+        Returns:
+            RoundData | None: The round, if this card completed it.
+
+        Raises:
+            ValueError: If the game is finished or the card is not playable.
+        """
+        if self.is_finished():
+            raise ValueError("Game is finished")
+        if card not in self.get_legal_card_set():
+            raise ValueError("Card not playable")
+
+        player = self.get_current_player()
+        player.play_card(card)
+        self.current_round.add_played_card(player, card)
+
+        if len(self.current_round.card_by_player) < len(self.players):
+            return None
+
+        completed_round = self.current_round
+        self.game_data.add_round(completed_round)
+        winner, _ = completed_round.get_winner()
+        self._leader_index = self.players.index(winner)
+        self.current_round = self.__new_round__(winner)
+        return completed_round
+
+    def undo_card(self) -> Card:
+        """
+        Reverts the last play_card, including the completion of a round.
+
+        Returns:
+            Card: The card returned to its player's hand.
+
+        Raises:
+            ValueError: If no card was played.
+        """
+        if not self.current_round.card_by_player:
+            if not self.game_data.rounds:
+                raise ValueError("No cards played.")
+            self._spare_rounds.append(self.current_round)
+            self.current_round = self.game_data.remove_last_round()
+            self._leader_index = self.players.index(self.current_round.get_leader())
+
+        player, card = self.current_round.remove_last_played_card()
+        player.deal_card(card)
+        return card
+
+    def get_state_hash(self) -> int:
+        """
+        Retrieves the Zobrist hash of the position.
+
+        Returns:
+            int: The hash of hands, trick, leader and game progress.
+        """
+        return self.game_data.get_state_hash(self.current_round)
+
+    def __new_round__(self, leader: Player) -> RoundData:
+        if not self._spare_rounds:
+            return RoundData(self.players, leader)
+        round_data = self._spare_rounds.pop()
+        round_data.leader = leader
+        return round_data
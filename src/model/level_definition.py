@@ -33,7 +33,7 @@ class CommunicationType(Enum):
     BLOCKED_FOR_NUMBER_OF_PLAYER = auto()
     BLOCKED_UNTIL_ROUND = auto()
 
-@dataclass
+@dataclass(slots=True)
 class LevelDefinition:
     """Level Definition - used by Level Builder to create a Level Data."""
 
@@ -1,36 +1,80 @@
 from dataclasses import dataclass, field
+from typing import Collection
 from src.game.mission_rules import MissionRule
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissionsOrderData:
     """
-    Represents the ordering rules for mission completion
+    Represents the ordering rules for mission completion.
+
+    The constraints are compiled when the instance is created: prerequisites are
+    indexed per mission, ranked topologically and checked for cycles and
+    conflicting fixed positions, so impossible orderings fail before a game starts.
 
     Attributes:
         must_come_before (dict[MissionRule, set[MissionRule]]): 
             Maps a mission to the set of missions that must come after it.
         fixed_positions (dict[MissionRule, int]):
-            Maps a mission to its fixed position (0-based index).
+            Maps a mission to its fixed position (1-based index).
+        mission_count (int | None):
+            How many missions the game has, to reject positions past the last one.
+            None if unknown.
+        prerequisites (dict[MissionRule, frozenset[MissionRule]]):
+            Maps a mission to the missions that must come directly before it.
+        ranks (dict[MissionRule, int]):
+            Topological rank of each constrained mission (0 for missions without prerequisites).
+        mission_bits (dict[MissionRule, int]):
+            Maps each constrained mission to its bit on a mission mask.
+        prerequisite_masks (dict[MissionRule, int]):
+            Maps a mission to the mask of all its direct prerequisites.
     """
     must_come_before: dict[MissionRule, set[MissionRule]] = field(default_factory=dict)
     fixed_positions: dict[MissionRule, int] = field(default_factory=dict)
+    mission_count: int | None = None
+    prerequisites: dict[MissionRule, frozenset[MissionRule]] = field(
+        init=False, repr=False, compare=False
+    )
+    ranks: dict[MissionRule, int] = field(init=False, repr=False, compare=False)
+    mission_bits: dict[MissionRule, int] = field(init=False, repr=False, compare=False)
+    prerequisite_masks: dict[MissionRule, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        prerequisites: dict[MissionRule, set[MissionRule]] = {}
+        for before, blocked in self.must_come_before.items():
+            prerequisites.setdefault(before, set())
+            for after in blocked:
+                prerequisites.setdefault(after, set()).add(before)
+        for mission in self.fixed_positions:
+            prerequisites.setdefault(mission, set())
+
+        mission_bits = {mission: 1 << index for index, mission in enumerate(prerequisites)}
+        object.__setattr__(self, "prerequisites", {
+            mission: frozenset(before) for mission, before in prerequisites.items()
+        })
+        object.__setattr__(self, "mission_bits", mission_bits)
+        object.__setattr__(self, "prerequisite_masks", {
+            mission: sum(mission_bits[before] for before in befores)
+            for mission, befores in prerequisites.items()
+        })
+        object.__setattr__(self, "ranks", self.__rank_missions__())
+        self.__check_fixed_positions__()
 
-    def is_order_respected(self, satisfied: list[MissionRule], new: MissionRule) -> bool:
+    def is_order_respected(self, satisfied: Collection[MissionRule], new: MissionRule) -> bool:
         """
         Check if the order constraints are respected when satisfying a new mission
 
         Args:
-            satisfied (list[MissionRule]): The list of missions already satisfied, in order.
+            satisfied (Collection[MissionRule]): The missions already satisfied, in order.
             new (MissionRule): The mission that was just satisfied.
 
         Returns:
             bool: True if order constraints are respected for this mission.
         """
-        satisfied_set = set(satisfied)
-
         # Check prerequisites (missions that must come before 'new')
-        for prerequisite, blocked in self.must_come_before.items():
-            if new in blocked and prerequisite not in satisfied_set:
+        prerequisites = self.prerequisites.get(new)
+        if prerequisites:
+            satisfied_set = satisfied if isinstance(satisfied, (set, frozenset)) else set(satisfied)
+            if not prerequisites.issubset(satisfied_set):
                 return False
 
         # Check fixed position (if it exists)
@@ -44,6 +88,130 @@ class MissionsOrderData:
 
         return True
 
+    def is_order_respected_by_mask(
+            self,
+            satisfied_mask: int,
+            satisfied_count: int,
+            new: MissionRule) -> bool:
+        """
+        Same as is_order_respected, but with the satisfied missions given as a mask
+        of mission_bits, so the check does not depend on how many missions exist.
+
+        Args:
+            satisfied_mask (int): The mask of constrained missions already satisfied.
+            satisfied_count (int): How many missions were already satisfied.
+            new (MissionRule): The mission that was just satisfied.
+
+        Returns:
+            bool: True if order constraints are respected for this mission.
+        """
+        prerequisite_mask = self.prerequisite_masks.get(new, 0)
+        if prerequisite_mask & satisfied_mask != prerequisite_mask:
+            return False
+        expected_position = self.fixed_positions.get(new)
+        return expected_position is None or expected_position == satisfied_count + 1
+
+    def get_mask(self, missions: Collection[MissionRule]) -> int:
+        """
+        Builds the mask of mission_bits for the given missions.
+        Missions without order constraints are ignored.
+
+        Args:
+            missions (Collection[MissionRule]): The missions to put on the mask.
+
+        Returns:
+            int: The mask of the constrained missions.
+        """
+        return sum(self.mission_bits.get(mission, 0) for mission in missions)
+
+    def sort_simultaneous_missions(
+            self,
+            satisfied_mask: int,
+            satisfied_count: int,
+            missions: Collection[MissionRule]) -> list[MissionRule]:
+        """
+        Sorts missions satisfied on the same trick so that the order constraints are
+        respected whenever possible. Position by position, a mission fixed to that
+        position is preferred, then any mission whose prerequisites are met, by rank.
+
+        Args:
+            satisfied_mask (int): The mask of constrained missions already satisfied.
+            satisfied_count (int): How many missions were already satisfied.
+            missions (Collection[MissionRule]): The missions satisfied on the trick.
+
+        Returns:
+            list[MissionRule]: The missions in the order they should be validated.
+        """
+        pending = list(missions)
+        ordered: list[MissionRule] = []
+        while pending:
+            count = satisfied_count + len(ordered)
+            candidates = [
+                mission for mission in pending
+                if self.is_order_respected_by_mask(satisfied_mask, count, mission)
+            ] or pending
+            mission = min(candidates, key=lambda mission: (
+                self.fixed_positions.get(mission) != count + 1,
+                self.ranks.get(mission, 0)
+            ))
+            pending.remove(mission)
+            ordered.append(mission)
+            satisfied_mask |= self.mission_bits.get(mission, 0)
+        return ordered
+
+    def __rank_missions__(self) -> dict[MissionRule, int]:
+        # Kahn's algorithm: a mission is ranked once all its prerequisites are ranked
+        missing_prerequisites = {
+            mission: len(before) for mission, before in self.prerequisites.items()
+        }
+        ready = [mission for mission, count in missing_prerequisites.items() if count == 0]
+        ranks = {mission: 0 for mission in ready}
+        while ready:
+            mission = ready.pop()
+            for after in self.must_come_before.get(mission, ()):
+                ranks[after] = max(ranks.get(after, 0), ranks[mission] + 1)
+                missing_prerequisites[after] -= 1
+                if missing_prerequisites[after] == 0:
+                    ready.append(after)
+
+        if len(ranks) != len(self.prerequisites) or \
+                any(count > 0 for count in missing_prerequisites.values()):
+            raise ValueError("Mission order constraints contain a cycle")
+        return ranks
+
+    def __check_fixed_positions__(self):
+        missions_by_position: dict[int, MissionRule] = {}
+        for mission, position in self.fixed_positions.items():
+            if position < 1:
+                raise ValueError(f"Invalid fixed position: {position}")
+            if self.mission_count is not None and position > self.mission_count:
+                raise ValueError(
+                    f"Mission fixed to position {position} of {self.mission_count} missions"
+                )
+            if position in missions_by_position:
+                raise ValueError(f"Two missions fixed to position {position}")
+            missions_by_position[position] = mission
+
+        for mission, position in self.fixed_positions.items():
+            ancestors = self.__get_ancestors__(mission)
+            if len(ancestors) >= position:
+                raise ValueError(
+                    f"Mission fixed to position {position} has {len(ancestors)} prerequisites"
+                )
+            for ancestor in ancestors:
+                if self.fixed_positions.get(ancestor, 0) > position:
+                    raise ValueError("Fixed positions conflict with order constraints")
+
+    def __get_ancestors__(self, mission: MissionRule) -> set[MissionRule]:
+        ancestors: set[MissionRule] = set()
+        pending = list(self.prerequisites[mission])
+        while pending:
+            before = pending.pop()
+            if before not in ancestors:
+                ancestors.add(before)
+                pending.extend(self.prerequisites[before])
+        return ancestors
+
     @classmethod
     def builder(cls):
         """
@@ -69,6 +237,7 @@ class _MissionsOrderDataBuilder:
     def __init__(self):
         self._must_come_before: dict[MissionRule, set[MissionRule]] = {}
         self._fixed_positions: dict[MissionRule, int] = {}
+        self._mission_count: int | None = None
 
     def add_order_constraint(self, before: MissionRule, after: MissionRule):
         """
@@ -79,16 +248,28 @@ class _MissionsOrderDataBuilder:
 
     def set_fixed_position(self, mission: MissionRule, position: int):
         """
-        Fix the mission to a specific position in the list (0-based index).
+        Fix the mission to a specific position in the list (1-based index).
         """
         self._fixed_positions[mission] = position
         return self
 
+    def set_mission_count(self, mission_count: int):
+        """
+        Set how many missions the game has, so that fixed positions past the last one are rejected.
+        """
+        self._mission_count = mission_count
+        return self
+
     def build(self) -> MissionsOrderData:
         """
-        Returns the built MissionsOrderData.
+        Returns the built and compiled MissionsOrderData.
+
+        Raises:
+            ValueError: If the constraints contain a cycle, conflicting fixed positions
+                or a fixed position past the last mission.
         """
         return MissionsOrderData(
             must_come_before=self._must_come_before,
-            fixed_positions=self._fixed_positions
+            fixed_positions=self._fixed_positions,
+            mission_count=self._mission_count
         )
@@ -1,26 +1,70 @@
 from dataclasses import dataclass, field
-from typing import List
-from src.model.card import Card, CardType
+from typing import Dict, List
+from src.model.card import Card, CardType, CardSet, CardsOperation
 from src.model.card import ROCKET_4
+from src.model.zobrist import Zobrist
 
-@dataclass(frozen=True)
 class CardHand:
     """
     Represents a player's hand of cards.
 
+    The hand is stored as a CardSet bitmask, so membership, removal, hashing and
+    per-suit queries are constant-time mask operations. The insertion order of
+    the cards is kept separately for display.
+
     Attributes:
-        cards (List[Card]): A list of cards held by the player.
+        cards (List[Card]): A copy of the cards held by the player, in the order they were
+            added. Changing it does not change the hand: use add_card and remove_card.
+        card_set (CardSet): The same cards as a bitmask.
+        zobrist_hash (int): The XOR of the Zobrist keys of the cards in hand.
     """
-    cards: List[Card] = field(default_factory=list)
+    __slots__ = ("_ordered_cards", "card_set", "zobrist_hash")
+
+    def __init__(self, cards: List[Card] | None = None):
+        """
+        Initializes the hand with the given cards.
+
+        Args:
+            cards (List[Card] | None): The cards initially held by the player.
+
+        Raises:
+            ValueError: If a card is given more than once.
+        """
+        cards = list(cards or [])
+        self._ordered_cards: Dict[Card, None] = dict.fromkeys(cards)
+        if len(self._ordered_cards) != len(cards):
+            raise ValueError("Card already in hand")
+        self.card_set = CardSet.of(self._ordered_cards)
+        self.zobrist_hash = 0
+        for card in self._ordered_cards:
+            self.zobrist_hash ^= Zobrist.card_key(card)
+
+    @property
+    def cards(self) -> List[Card]:
+        """
+        The cards held by the player, in the order they were added.
+        The hand lives in its bitmask, so this is a copy: changing it does not change the hand.
+
+        Returns:
+            List[Card]: A new list with the cards in hand.
+        """
+        return list(self._ordered_cards)
 
     def add_card(self, card: Card):
         """
-        Adds a card to the hand.
+        Adds a card to the hand. Raises an error if the card is already present.
 
         Args:
             card (Card): The card to be added to the hand.
+
+        Raises:
+            ValueError: If the card is already in the hand.
         """
-        self.cards.append(card)
+        if self.card_set.mask & card.bit:
+            raise ValueError("Card already in hand")
+        self._ordered_cards[card] = None
+        self.card_set = CardSet(self.card_set.mask | card.bit)
+        self.zobrist_hash ^= Zobrist.card_key(card)
 
     def remove_card(self, card: Card):
         """
@@ -32,10 +76,11 @@ class CardHand:
         Raises:
             ValueError: If the card is not found in the hand.
         """
-        if card in self.cards:
-            self.cards.remove(card)
-        else:
+        if not self.card_set.mask & card.bit:
             raise ValueError("Card not in hand")
+        del self._ordered_cards[card]
+        self.card_set = CardSet(self.card_set.mask & ~card.bit)
+        self.zobrist_hash ^= Zobrist.card_key(card)
 
     def has_card(self, card: Card) -> bool:
         """
@@ -47,23 +92,61 @@ class CardHand:
         Returns:
             bool: True if the card is in the hand, False otherwise.
         """
-        return card in self.cards
+        return self.card_set.mask & card.bit != 0
+
+    def has_card_type(self, card_type: CardType) -> bool:
+        """
+        Checks if the hand contains any card of a specific type.
+
+        Args:
+            card_type (CardType): The type of card to check for.
+
+        Returns:
+            bool: True if the hand has a card of the type, False otherwise.
+        """
+        return self.card_set.mask & CardsOperation.get_card_set_by_type(card_type).mask != 0
+
+    def get_playable_card_set(self, card_type: CardType | None) -> CardSet:
+        """
+        Returns the playable cards based on the given card type, as a CardSet.
 
-    def get_playable_cards(self, card_type: CardType) -> List[Card]:
+        If the hand contains cards of the specified type, only those are returned.
+        Otherwise (or if no type is given), all cards in the hand are returned.
+
+        Args:
+            card_type (CardType | None): The type of card to filter by.
+
+        Returns:
+            CardSet: The playable cards.
+        """
+        if card_type is None:
+            return self.card_set
+        same_type_mask = self.card_set.mask & CardsOperation.get_card_set_by_type(card_type).mask
+        return CardSet(same_type_mask) if same_type_mask else self.card_set
+
+    def get_playable_cards(self, card_type: CardType | None) -> List[Card]:
         """
         Returns the playable cards based on the given card type.
 
         If the hand contains cards of the specified type, only those are returned.
-        Otherwise, all cards in the hand are returned.
+        Otherwise (or if no type is given), all cards in the hand are returned.
+        Either way, the cards keep the order they were added to the hand.
 
         Args:
-            card_type (CardType): The type of card to filter by.
+            card_type (CardType | None): The type of card to filter by.
 
         Returns:
             List[Card]: A list of playable cards.
         """
-        filtered = [card for card in self.cards if card.type == card_type]
-        return filtered if filtered else self.cards
+        playable_mask = self.get_playable_card_set(card_type).mask
+        if playable_mask == self.card_set.mask:
+            return self.cards
+        return [card for card in self._ordered_cards if playable_mask & card.bit]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CardHand):
+            return NotImplemented
+        return self.card_set == other.card_set
 
     def __hash__(self):
         """
@@ -72,13 +155,18 @@ class CardHand:
         Returns:
             int: The hash value for the CardHand.
         """
-        return hash(tuple(set(self.cards)))
+        return hash(self.card_set)
 
+    def __repr__(self) -> str:
+        return f"CardHand(cards={self.cards!r})"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Player:
     """
     Represents a player in the game, including their id, name and card hand.
+    A player is identified by id and name only, so its hash does not change
+    as cards are dealt and played.
 
     Attributes:
         id (int): The id for the player
@@ -87,7 +175,7 @@ class Player:
     """
     id: int
     name: str
-    card_hand: CardHand
+    card_hand: CardHand = field(compare=False)
 
     def deal_card(self, card: Card):
         """
@@ -115,3 +203,12 @@ class Player:
             bool: True if the player has the ROCKET 4 card, False otherwise.
         """
         return self.card_hand.has_card(ROCKET_4)
+
+    def get_state_hash(self) -> int:
+        """
+        Returns the 64-bit Zobrist hash of this player's hand, bound to the player.
+
+        Returns:
+            int: The hash of the player's hand.
+        """
+        return Zobrist.hand_key(self.id, self.card_hand.zobrist_hash)
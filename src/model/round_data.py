@@ -1,8 +1,9 @@
 from typing import Dict, Tuple, Set
 from src.model.player_hand import Player
-from src.model.card import Card, CardType
+from src.model.card import Card, CardType, CardSet
+from src.model.zobrist import Zobrist, ZobristKind
 
-class RoundData:
+class RoundData: # pylint: disable=too-many-instance-attributes
     """
     Represents a round of the game, tracking which cards are
       played by which players and determining the winner.
@@ -13,17 +14,34 @@ class RoundData:
             A dictionary that maps each player to the card they played.
         round_type (CardType | None):
             The type of card played in the round (None if no card has been played yet).
+        played_card_set (CardSet): The cards played in the round, as a bitmask.
+        winner (Player | None): The player currently winning the round.
+        winning_card (Card | None): The card currently winning the round.
+        leader (Player | None): The player who starts the round, if known before the first card.
+        trick_hash (int): The XOR of the Zobrist keys of the cards played, by player.
     """
-    def __init__(self, players: list[Player]):
+    __slots__ = (
+        "players", "card_by_player", "round_type", "played_card_set", "winner", "winning_card",
+        "leader", "trick_hash"
+    )
+
+    def __init__(self, players: list[Player], leader: Player | None = None):
         """
         Initializes the round data for a given list of players.
 
         Args:
             players (list[Player]): The players participating in the round.
+            leader (Player | None): The player who starts the round.
+                If not given, it is the player of the first card.
         """
         self.players = players
+        self.leader = leader
+        self.trick_hash = 0
         self.card_by_player: Dict[Player, Card] = {}
         self.round_type: CardType | None = None
+        self.played_card_set = CardSet()
+        self.winner: Player | None = None
+        self.winning_card: Card | None = None
 
     def add_played_card(self, player: Player, card: Card):
         """
@@ -37,13 +55,50 @@ class RoundData:
         Raises:
             ValueError: If the card has already been played in the round.
         """
-        if card in set(self.card_by_player.values()):
+        if card in self.played_card_set:
             raise ValueError("Card already played")
 
         self.card_by_player[player] = card
+        self.played_card_set = self.played_card_set.with_card(card)
+        self.trick_hash ^= Zobrist.player_card_key(ZobristKind.TRICK, player.id, card)
+        self.__update_winner__(player, card)
 
-        if self.round_type is None:
-            self.round_type = card.type
+    def remove_last_played_card(self) -> Tuple[Player, Card]:
+        """
+        Removes the last card played in the round, undoing add_played_card.
+
+        Returns:
+            Tuple[Player, Card]: The player and the card that were removed.
+
+        Raises:
+            ValueError: If no cards have been played in the round.
+        """
+        if not self.card_by_player:
+            raise ValueError("No cards played.")
+
+        player, card = self.card_by_player.popitem()
+        self.played_card_set = self.played_card_set.without_card(card)
+        self.trick_hash ^= Zobrist.player_card_key(ZobristKind.TRICK, player.id, card)
+
+        # At most three cards remain, so the winner is replayed from scratch
+        self.round_type = None
+        self.winner = None
+        self.winning_card = None
+        for remaining_player, remaining_card in self.card_by_player.items():
+            self.__update_winner__(remaining_player, remaining_card)
+        return player, card
+
+    def get_leader(self) -> Player | None:
+        """
+        Retrieves the player who starts the round: the given leader,
+        or the player of the first card.
+
+        Returns:
+            Player | None: The leader, or None if unknown.
+        """
+        if self.leader is not None:
+            return self.leader
+        return next(iter(self.card_by_player), None)
 
     def get_played_cards(self) -> Set[Card]:
         """
@@ -52,7 +107,19 @@ class RoundData:
         Returns:
             Set[Card]: A set of cards that have been played in the round.
         """
-        return set(self.card_by_player.values())
+        return self.played_card_set.to_set()
+
+    def has_played_card(self, card: Card) -> bool:
+        """
+        Checks if a card has been played during the round.
+
+        Args:
+            card (Card): The card to check for.
+
+        Returns:
+            bool: True if the card was played in the round, False otherwise.
+        """
+        return card in self.played_card_set
 
     def get_winner(self) -> Tuple[Player, Card]:
         """
@@ -60,21 +127,44 @@ class RoundData:
         The winner is the player with the highest 
         number of the winning card type, or the round's type if no rocket cards were played.
 
+        The winner is kept up to date as cards are played, so this is a constant-time read.
+
         Returns:
             Tuple[Player, Card]: The winner player and their winning card.
 
         Raises:
             ValueError: If no cards have been played in the round.
         """
-        played_types: Set[CardType] = {card.type for card in self.get_played_cards()}
-        winning_type = CardType.ROCKET if CardType.ROCKET in played_types else self.round_type
+        if self.winning_card is None:
+            raise ValueError("No cards played.")
+        return self.winner, self.winning_card
+
+    def get_state_hash(self) -> int:
+        """
+        Returns the 64-bit Zobrist hash of the position in this round: every
+        player's hand, the cards played on the trick and the leader.
+        The trick part is maintained as cards are played; each hand keeps its own hash.
+
+        Returns:
+            int: The hash of the position.
+        """
+        state_hash = self.trick_hash
+        leader = self.get_leader()
+        if leader is not None:
+            state_hash ^= Zobrist.player_key(ZobristKind.LEADER, leader.id)
+        for player in self.players:
+            state_hash ^= player.get_state_hash()
+        return state_hash
+
+    def __update_winner__(self, player: Player, card: Card):
+        if self.round_type is None:
+            self.round_type = card.type
 
-        right_type_card_by_player = {
-            player: card
-            for player, card in self.card_by_player.items() if card.type == winning_type
-        }
+        if self.winning_card is None or self.__beats_winning_card__(card):
+            self.winner = player
+            self.winning_card = card
 
-        winner = max(right_type_card_by_player,
-                     key=lambda player: right_type_card_by_player[player].number)
-        winning_card = right_type_card_by_player[winner]
-        return winner, winning_card
+    def __beats_winning_card__(self, card: Card) -> bool:
+        if card.type == self.winning_card.type:
+            return card.number > self.winning_card.number
+        return card.type == CardType.ROCKET
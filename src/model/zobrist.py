@@ -0,0 +1,95 @@
+from enum import IntEnum
+from src.model.card import ALL_CARDS, Card
+
+_MASK_64 = (1 << 64) - 1
+
+class ZobristKind(IntEnum):
+    """Kinds of facts that take part in a position hash, each one with its own keys."""
+    HAND = 1
+    TRICK = 2
+    CAPTURED = 3
+    WON_WITH = 4
+    LEADER = 5
+
+class Zobrist:
+    """
+    Provides the 64-bit keys used to hash game positions incrementally.
+
+    A position hash is the XOR of the keys of every fact in the position,
+    so adding or removing a fact is a single XOR with its key.
+    Keys are derived with splitmix64, so they are stable across processes.
+    """
+
+    @classmethod
+    def mix(cls, value: int) -> int:
+        """
+        Scrambles a value into a well distributed 64-bit integer (splitmix64 finalizer).
+
+        Args:
+            value (int): The value to scramble.
+
+        Returns:
+            int: A 64-bit integer.
+        """
+        value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        return value ^ (value >> 31)
+
+    @classmethod
+    def card_key(cls, card: Card) -> int:
+        """
+        Key of a card held in a hand, independent of who holds it.
+
+        Args:
+            card (Card): The card.
+
+        Returns:
+            int: The 64-bit key.
+        """
+        return _HAND_CARD_KEYS[card.id]
+
+    @classmethod
+    def player_card_key(cls, kind: ZobristKind, player_id: int, card: Card) -> int:
+        """
+        Key of a fact that involves a player and a card (e.g. the card they played on a trick).
+
+        Args:
+            kind (ZobristKind): The kind of fact.
+            player_id (int): The id of the player.
+            card (Card): The card.
+
+        Returns:
+            int: The 64-bit key.
+        """
+        return cls.mix((((player_id << 6) | card.id) << 3) | kind)
+
+    @classmethod
+    def player_key(cls, kind: ZobristKind, player_id: int) -> int:
+        """
+        Key of a fact that involves only a player (e.g. who leads the trick).
+
+        Args:
+            kind (ZobristKind): The kind of fact.
+            player_id (int): The id of the player.
+
+        Returns:
+            int: The 64-bit key.
+        """
+        return cls.mix(((player_id << 6 | 63) << 3) | kind)
+
+    @classmethod
+    def hand_key(cls, player_id: int, hand_hash: int) -> int:
+        """
+        Binds the seat-independent hash of a hand to the player holding it.
+
+        Args:
+            player_id (int): The id of the player.
+            hand_hash (int): The XOR of the card keys of the hand.
+
+        Returns:
+            int: The 64-bit key for the player's hand.
+        """
+        return cls.mix(hand_hash ^ cls.player_key(ZobristKind.HAND, player_id))
+
+_HAND_CARD_KEYS = [Zobrist.mix((card.id << 3) | ZobristKind.HAND) for card in ALL_CARDS]
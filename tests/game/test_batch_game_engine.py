@@ -0,0 +1,179 @@
+import random
+from typing import Iterator, List
+
+import numpy as np
+import pytest
+
+from src.game.batch_game_engine import (
+    BROKEN,
+    SATISFIED,
+    BatchGameEngine,
+    BatchMissions,
+    LowestCardBatchPolicy,
+    RandomBatchPolicy,
+)
+from src.game.bulk_card_dealer import BulkCardDealer, BulkDeal
+from src.game.card_dealer import CardDealer
+from src.game.game_engine import GameEngine
+from src.game.interface.bot_player_interface import LowestCardBotPlayerInterface
+from src.game.mission_rules import (
+    MissionRule,
+    NeverWinWithNumberRule,
+    PlayerHasToWinCardRule,
+    PlayerShouldNeverWinRule,
+    WinOnceWithNumberRule,
+    WinWithAllTheseCardsRule,
+)
+from src.game.round_engine import RoundEngine
+from src.model.card import ALL_CARDS, BLUE_1, BLUE_9, PINK_1, ROCKET_4, CardType
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import CardHand, Player
+from src.model.round_data import RoundData
+from tests.helpers.test_data_creation_helper import create_player
+
+class BulkDealCardDealer(CardDealer):
+    def __init__(self, deal: BulkDeal, game_index: int):
+        super().__init__()
+        self.deal = deal
+        self.game_index = game_index
+
+    def deal_cards(self, players: list[Player]):
+        return self.deal.deal_to(self.game_index, players)
+
+class ReplayPlayerInterface(LowestCardBotPlayerInterface):
+    def __init__(self, moves: np.ndarray):
+        super().__init__()
+        self.moves: Iterator[int] = iter(int(card_id) for card_id in moves)
+
+    def select_card(self, player: Player, round_data: RoundData):
+        return ALL_CARDS[next(self.moves)]
+
+def create_players(count: int) -> List[Player]:
+    return [Player(index + 1, f"Player {index + 1}", CardHand()) for index in range(count)]
+
+def create_random_missions(players: List[Player], rng: random.Random):
+    colour_cards = [card for card in ALL_CARDS if card.type != CardType.ROCKET]
+    mission_cards = rng.sample(colour_cards, 3)
+    missions: List[MissionRule] = [
+        PlayerHasToWinCardRule(rng.choice(players), card) for card in mission_cards
+    ]
+    extra = rng.randrange(5)
+    if extra == 1:
+        missions.append(NeverWinWithNumberRule(rng.randint(1, 9)))
+    elif extra == 2:
+        missions.append(WinOnceWithNumberRule(rng.randint(1, 9)))
+    elif extra == 3:
+        missions.append(WinWithAllTheseCardsRule(set(rng.sample(colour_cards, 2))))
+    elif extra == 4:
+        missions.append(PlayerShouldNeverWinRule(rng.choice(players)))
+
+    order = MissionsOrderData.empty()
+    if rng.random() < 0.5:
+        order = MissionsOrderData.builder() \
+            .add_order_constraint(missions[0], missions[1]) \
+            .set_fixed_position(missions[2], 1) \
+            .build()
+    return missions, order
+
+def play_with_game_engine(player_interface, deal, game_index, *, missions, order):
+    round_engine = RoundEngine(player_interface)
+    players = create_players(deal.player_count)
+    engine = GameEngine(round_engine, BulkDealCardDealer(deal, game_index))
+    return engine.play_game(players, missions, order)
+
+@pytest.mark.parametrize("player_count", [3, 4, 5])
+def test_batch_engine_agrees_with_game_engine_on_the_same_moves(player_count):
+    games = 150
+    rng = random.Random(player_count)
+    players = create_players(player_count)
+    deal = BulkCardDealer(player_count, np.random.default_rng(player_count)).deal(games)
+    missions_by_game, orders = zip(*(create_random_missions(players, rng) for _ in range(games)))
+
+    engine = BatchGameEngine(RandomBatchPolicy(np.random.default_rng(0)))
+    result = engine.play(deal, BatchMissions.of(players, missions_by_game, orders))
+
+    for game_index in range(games):
+        missions = missions_by_game[game_index]
+        game_data, missions_data = play_with_game_engine(
+            ReplayPlayerInterface(result.moves[game_index]), deal, game_index,
+            missions=missions, order=orders[game_index]
+        )
+        statuses = result.statuses[game_index]
+        assert result.success[game_index] == missions_data.are_missions_complete()
+        assert result.rounds_played[game_index] == len(game_data.rounds)
+        assert {
+            mission for slot, mission in enumerate(missions) if statuses[slot] == SATISFIED
+        } == missions_data.successful_missions
+        assert (result.failed_slots[game_index] >= 0) == missions_data.has_any_failed_mission()
+        assert (result.moves[game_index] >= 0).sum() == len(game_data.rounds) * player_count
+
+def test_lowest_card_policy_plays_like_the_lowest_card_bot():
+    games = 50
+    rng = random.Random(1)
+    players = create_players(4)
+    deal = BulkCardDealer(4, np.random.default_rng(1)).deal(games)
+    missions_by_game, orders = zip(*(create_random_missions(players, rng) for _ in range(games)))
+
+    result = BatchGameEngine(LowestCardBatchPolicy()).play(
+        deal, BatchMissions.of(players, missions_by_game, orders)
+    )
+
+    for game_index in range(games):
+        game_data, _ = play_with_game_engine(
+            LowestCardBotPlayerInterface(), deal, game_index,
+            missions=missions_by_game[game_index], order=orders[game_index]
+        )
+        played = [
+            card.id for round_data in game_data.rounds
+            for card in round_data.card_by_player.values()
+        ]
+        assert list(result.moves[game_index][:len(played)]) == played
+
+def test_missing_mission_slots_are_padded():
+    players = create_players(4)
+    missions = BatchMissions.of(players, [
+        [PlayerHasToWinCardRule(players[0], BLUE_1)],
+        [PlayerHasToWinCardRule(players[1], BLUE_9), PlayerShouldNeverWinRule(players[2])],
+    ])
+
+    assert missions.slot_count == 2
+    assert list(missions.kinds[0]) == [missions.kinds[1][0], 0]
+    assert list(missions.players[1]) == [1, 2]
+
+def test_captain_leads_and_a_broken_mission_ends_the_game():
+    players = create_players(4)
+    deal = BulkCardDealer(4, np.random.default_rng(5)).deal(1)
+    captain_index = int(deal.captain_indexes[0])
+    missions = BatchMissions.of(players, [[PlayerShouldNeverWinRule(players[captain_index])]])
+
+    def play_rocket_4_first(turn):
+        lowest = LowestCardBatchPolicy()(turn)
+        has_rocket = turn.legal_masks & np.uint64(ROCKET_4.bit) != 0
+        return np.where(has_rocket, ROCKET_4.id, lowest)
+
+    result = BatchGameEngine(play_rocket_4_first).play(deal, missions)
+
+    assert result.moves[0][0] == ROCKET_4.id
+    assert result.rounds_played[0] == 1
+    assert result.failed_slots[0] == 0
+    assert result.statuses[0][0] == BROKEN
+    assert not result.success[0]
+
+def test_illegal_cards_are_rejected():
+    players = create_players(4)
+    deal = BulkCardDealer(4, np.random.default_rng(5)).deal(2)
+    missions = BatchMissions.of(players, [[], []])
+
+    def play_anything(turn):
+        return np.full(turn.game_indexes.size, PINK_1.id)
+
+    with pytest.raises(ValueError):
+        BatchGameEngine(play_anything).play(deal, missions)
+
+def test_unknown_missions_are_rejected():
+    class CustomRule(PlayerShouldNeverWinRule):
+        pass
+
+    players = [create_player("Alice")]
+    with pytest.raises(ValueError):
+        BatchMissions.of(players, [[CustomRule(players[0])]])
@@ -0,0 +1,40 @@
+import random
+
+from src.game.interface.bot_player_interface import (
+    LowestCardBotPlayerInterface,
+    RandomBotPlayerInterface,
+)
+from src.game.round_engine import RoundEngine
+from src.model.card import BLUE_2, BLUE_5, PINK_1, PINK_4, ROCKET_1, YELLOW_3
+from src.model.round_data import RoundData
+from tests.helpers.test_data_creation_helper import create_player
+
+def test_bot_follows_the_round_type_of_the_round_being_played():
+    bot = RandomBotPlayerInterface(random.Random(0))
+    round_engine = RoundEngine(bot)
+    leader = create_player("Alice", [PINK_1])
+    follower = create_player("Bob", [BLUE_2, PINK_4, YELLOW_3, ROCKET_1])
+
+    round_data = round_engine.play_round([leader, follower], leader)
+
+    assert round_data.card_by_player[follower] == PINK_4
+
+def test_bot_can_play_any_card_when_it_cannot_follow():
+    bot = RandomBotPlayerInterface(random.Random(0))
+    leader = create_player("Alice", [PINK_1])
+    player = create_player("Bob", [BLUE_2, YELLOW_3])
+    round_data = RoundData([leader, player], leader)
+    round_data.add_played_card(leader, PINK_1)
+
+    assert set(bot.get_legal_cards(player, round_data)) == {BLUE_2, YELLOW_3}
+
+def test_lowest_card_bot_keeps_rockets_for_last():
+    bot = LowestCardBotPlayerInterface()
+    player = create_player("Alice", [ROCKET_1, BLUE_5, YELLOW_3])
+
+    assert bot.select_card(player, RoundData([player], player)) == YELLOW_3
+
+def test_bot_always_takes_a_mission():
+    bot = RandomBotPlayerInterface(random.Random(0))
+
+    assert bot.select_mission(1, [BLUE_2, PINK_1], can_skip=True) in (BLUE_2, PINK_1)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from src.game.bulk_card_dealer import BulkCardDealer
+from src.model.card import ALL_CARDS, ROCKET_4, CardSet
+from tests.helpers.test_data_creation_helper import create_player
+
+ALL_CARDS_MASK = CardSet.of(ALL_CARDS).mask
+
+def test_every_deal_gives_each_card_to_exactly_one_player():
+    deal = BulkCardDealer(4, np.random.default_rng(0)).deal(1000)
+
+    combined = np.bitwise_or.reduce(deal.hand_masks, axis=1)
+    assert (combined == ALL_CARDS_MASK).all()
+    for game_index in range(10):
+        hands = deal.get_hands(game_index)
+        assert sum(len(hand) for hand in hands) == len(ALL_CARDS)
+        assert [len(hand) for hand in hands] == [10, 10, 10, 10]
+
+def test_uneven_player_counts_get_the_extra_cards_first():
+    deal = BulkCardDealer(3, np.random.default_rng(0)).deal(5)
+
+    assert [len(hand) for hand in deal.get_hands(0)] == [14, 13, 13]
+
+def test_captain_index_is_the_player_holding_rocket_4():
+    deal = BulkCardDealer(5, np.random.default_rng(1)).deal(200)
+
+    for game_index in range(deal.game_count):
+        captain_index = deal.captain_indexes[game_index]
+        assert ROCKET_4 in deal.get_hands(game_index)[captain_index]
+
+def test_deal_to_builds_the_same_hands_on_players():
+    deal = BulkCardDealer(4, np.random.default_rng(2)).deal(3)
+    players = [create_player(f"Player {index}") for index in range(4)]
+
+    players, captain = deal.deal_to(1, players)
+
+    assert [player.card_hand.card_set for player in players] == deal.get_hands(1)
+    assert captain.is_captain()
+
+def test_deal_to_rejects_a_different_number_of_players():
+    deal = BulkCardDealer(4, np.random.default_rng(2)).deal(1)
+
+    with pytest.raises(ValueError):
+        deal.deal_to(0, [create_player("Alice")])
+
+def test_seeded_dealers_are_reproducible_and_batches_cover_every_game():
+    first = BulkCardDealer(4, np.random.default_rng(7)).deal(10)
+    second = BulkCardDealer(4, np.random.default_rng(7)).deal(10)
+
+    assert (first.decks == second.decks).all()
+    batches = list(BulkCardDealer(4).iterate(10, batch_size=4))
+    assert [batch.game_count for batch in batches] == [4, 4, 2]
+
+def test_every_card_is_equally_likely_in_every_hand():
+    deal = BulkCardDealer(4, np.random.default_rng(3)).deal(20000)
+
+    first_card_counts = np.bincount(deal.decks[:, 0], minlength=len(ALL_CARDS))
+    assert first_card_counts.min() > 400
+    assert first_card_counts.max() < 600
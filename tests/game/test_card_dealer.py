@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from src.game.card_dealer import CardDealer
 from src.model.card import ALL_CARDS
@@ -29,3 +31,14 @@ def test_deal_cards(dealer_and_players):
     # Assert the captain is correctly identified
     assert captain is not None
     assert captain.is_captain()
+
+def test_deal_cards_is_reproducible_with_a_seeded_rng():
+    """Tests that two dealers seeded the same way deal the same hands."""
+    first_players = [create_player(f"Player {i+1}") for i in range(4)]
+    second_players = [create_player(f"Player {i+1}") for i in range(4)]
+
+    CardDealer(random.Random(42)).deal_cards(first_players)
+    CardDealer(random.Random(42)).deal_cards(second_players)
+
+    assert [player.card_hand.cards for player in first_players] == \
+        [player.card_hand.cards for player in second_players]
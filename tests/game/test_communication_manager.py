@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 from src.game.communication_manager import (
     CommunicationResult,
@@ -6,10 +7,12 @@ from src.game.communication_manager import (
     LimitedCommunicationManager,
     BlockedForNumberOfPlayerManager,
     BlockedUntilRoundManager,
+    AsyncCommunicationManagerFactory,
     CommunicationManagerFactory
 )
 
 from src.model.level_definition import LevelDefinition, CommunicationType
+from src.game.interface.async_player_interface import AsyncPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
 from tests.helpers.test_data_creation_helper import create_player
 
@@ -94,6 +97,37 @@ def test_factory_blocked_until_round():
     assert manager.can_communicate(player_1, round_number=2) == CommunicationResult.DISABLED
     assert manager.can_communicate(player_1, round_number=3) == CommunicationResult.ENABLED
 
+def test_async_factory_blocked_for_number_of_players():
+    player_1, player_2, player_3 = create_player("1"), create_player("2"), create_player("3")
+    level_def = make_level_definition(
+        CommunicationType.BLOCKED_FOR_NUMBER_OF_PLAYER,
+        { "number_of_player": 1}
+    )
+
+    player_interface = AsyncMock(spec=AsyncPlayerInterface)
+    player_interface.select_blocked_players.return_value = [player_2]
+
+    factory = AsyncCommunicationManagerFactory(player_interface)
+    manager = asyncio.run(factory.create([player_1, player_2, player_3], level_def))
+
+    assert isinstance(manager, BlockedForNumberOfPlayerManager)
+    player_interface.select_blocked_players.assert_awaited_once_with(
+        [player_1, player_2, player_3], 1
+    )
+    assert manager.can_communicate(player_1, 1) == CommunicationResult.ENABLED
+    assert manager.can_communicate(player_2, 1) == CommunicationResult.DISABLED
+
+
+def test_async_factory_does_not_ask_players_for_other_types():
+    level_def = make_level_definition(CommunicationType.DEAD_ZONE, {})
+    player_interface = AsyncMock(spec=AsyncPlayerInterface)
+    factory = AsyncCommunicationManagerFactory(player_interface)
+
+    manager = asyncio.run(factory.create([create_player("1")], level_def))
+
+    assert isinstance(manager, LimitedCommunicationManager)
+    player_interface.select_blocked_players.assert_not_awaited()
+
 def make_level_definition(comm_type: CommunicationType, metadata: dict) -> LevelDefinition:
     return LevelDefinition(
         order_tokens=[],
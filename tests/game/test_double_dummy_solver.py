@@ -0,0 +1,108 @@
+import pytest
+from src.game.double_dummy_solver import DoubleDummySolver
+from src.game.mission_rules import (
+    NeverWinWithNumberRule, PlayerHasToWinCardRule, PlayerShouldNeverWinRule
+)
+from src.model.card import (
+    BLUE_1, BLUE_2, BLUE_3, BLUE_5, BLUE_6, BLUE_9, PINK_1, PINK_2, PINK_4, PINK_5,
+    YELLOW_1, YELLOW_3, YELLOW_5, YELLOW_8, GREEN_1, GREEN_5,
+    ROCKET_1, ROCKET_2, ROCKET_4, CardSet
+)
+from src.model.game_state import GameState
+from tests.helpers.test_data_creation_helper import create_player
+
+def create_players():
+    return [
+        create_player("P1", [BLUE_1, BLUE_9, PINK_4]),
+        create_player("P2", [BLUE_2, YELLOW_8, ROCKET_1]),
+        create_player("P3", [BLUE_3, PINK_2, YELLOW_3]),
+    ]
+
+def test_finds_line_that_completes_the_missions():
+    players = create_players()
+    player_1, player_2, _ = players
+    missions = [
+        PlayerHasToWinCardRule(player_2, PINK_2),
+        PlayerHasToWinCardRule(player_1, BLUE_3),
+    ]
+    hands_before = [player.card_hand.card_set for player in players]
+
+    line = DoubleDummySolver(missions).find_line(players, player_1)
+
+    assert line is not None
+    assert [player.card_hand.card_set for player in players] == hands_before
+    state = GameState(players, player_1)
+    satisfied = set()
+    for card in line:
+        if state.play_card(card) is not None:
+            satisfied.update(
+                index for index, mission in enumerate(missions)
+                if mission.is_rule_satisfied(state.game_data)
+            )
+    assert satisfied == {0, 1}
+
+def test_detects_missions_that_cannot_be_completed():
+    players = create_players()
+    player_1, _, player_3 = players
+
+    assert not DoubleDummySolver(
+        [PlayerHasToWinCardRule(player_3, BLUE_9)]
+    ).is_achievable(players, player_1)
+
+def test_player_holding_the_highest_rocket_cannot_avoid_winning():
+    players = [
+        create_player("P1", [ROCKET_4, BLUE_1]),
+        create_player("P2", [ROCKET_2, BLUE_5]),
+    ]
+    player_1, player_2 = players
+
+    solver = DoubleDummySolver([PlayerShouldNeverWinRule(player_1)])
+
+    assert not solver.is_achievable(players, player_2)
+    assert solver.nodes == 1
+
+class SolverWithoutCut(DoubleDummySolver):
+    """Searches every line, without the static cut at the start of each trick."""
+
+    def __is_doomed__(self, state, satisfied_mask):
+        del state, satisfied_mask
+        return False
+
+def create_players_with_the_rocket_of_the_number():
+    return [
+        create_player("P1", [BLUE_1, YELLOW_1, PINK_1, GREEN_1, ROCKET_1]),
+        create_player("P2", [BLUE_5, YELLOW_5, PINK_5, GREEN_5, BLUE_6]),
+    ]
+
+def test_rocket_of_the_number_cut_agrees_with_the_full_search():
+    players = create_players_with_the_rocket_of_the_number()
+    missions = [NeverWinWithNumberRule(1)]
+
+    # ROCKET_1 counts for the mission and nobody can beat it, so it breaks the mission
+    assert not DoubleDummySolver(missions).is_achievable(players, players[0])
+    assert not SolverWithoutCut(missions).is_achievable(players, players[0])
+
+def test_empty_mission_list_is_always_achievable():
+    players = create_players()
+    assert DoubleDummySolver([]).find_line(players, players[0]) == []
+
+def test_number_missions_are_solved_to_the_end_of_the_game():
+    players = create_players()
+    player_1, player_2, _ = players
+
+    assert DoubleDummySolver([NeverWinWithNumberRule(3)]).is_achievable(players, player_1)
+    assert not DoubleDummySolver(
+        [NeverWinWithNumberRule(1), PlayerShouldNeverWinRule(player_2)]
+    ).is_achievable(players, player_1)
+
+def test_node_limit_stops_the_search_and_restores_the_hands():
+    players = create_players()
+    hands_before = [player.card_hand.card_set for player in players]
+
+    with pytest.raises(ValueError):
+        DoubleDummySolver(
+            [PlayerShouldNeverWinRule(players[0])], max_nodes=2
+        ).is_achievable(players, players[0])
+
+    assert [player.card_hand.card_set for player in players] == hands_before
+    assert players[0].card_hand.card_set == CardSet.of([BLUE_1, BLUE_9, PINK_4])
@@ -0,0 +1,154 @@
+import random
+from unittest.mock import MagicMock
+import pytest
+from src.game.card_dealer import CardDealer
+from src.game.double_dummy_solver import DoubleDummySolver
+from src.game.endgame_tablebase import EndgameTablebase, EndgameTablebaseGenerator
+from src.game.game_engine import GameEngine
+from src.game.mission_rules import (
+    MissionStatus, NeverWinWithNumberRule, PlayerHasToWinCardRule, PlayerShouldNeverWinRule,
+    WinWithAllTheseCardsRule
+)
+from src.game.round_engine import RoundEngine
+from src.model.card import (
+    BLUE_1, BLUE_2, BLUE_3, BLUE_9, PINK_2, PINK_4, YELLOW_3, YELLOW_8, ROCKET_1, CardsOperation
+)
+from src.model.game_state import GameState
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import CardHand, Player
+from tests.helpers.test_data_creation_helper import create_player
+
+def create_players():
+    return [
+        create_player("P1", [BLUE_1, BLUE_9, PINK_4]),
+        create_player("P2", [BLUE_2, YELLOW_8, ROCKET_1]),
+        create_player("P3", [BLUE_3, PINK_2, YELLOW_3]),
+    ]
+
+def with_hands(players, hands):
+    return [Player(player.id, player.name, CardHand(hand)) for player, hand in zip(players, hands)]
+
+@pytest.fixture
+def players():
+    return create_players()
+
+@pytest.fixture
+def missions(players):
+    player_1, _, player_3 = players
+    return [
+        PlayerHasToWinCardRule(player_1, BLUE_3),
+        PlayerShouldNeverWinRule(player_3),
+        WinWithAllTheseCardsRule({ROCKET_1}),
+    ]
+
+@pytest.fixture
+def tablebase_path(players, missions, tmp_path):
+    path = str(tmp_path / "endgame.bin")
+    positions = EndgameTablebaseGenerator(missions, tricks_left=2).generate(players, path)
+    assert positions == 3 ** 3 * 3
+    return path
+
+def test_lookup_agrees_with_the_solver(players, missions, tablebase_path):
+    with EndgameTablebase(tablebase_path) as tablebase:
+        for hands in [
+            [[BLUE_1, BLUE_9], [BLUE_2, ROCKET_1], [BLUE_3, PINK_2]],
+            [[BLUE_9, PINK_4], [YELLOW_8, ROCKET_1], [BLUE_3, YELLOW_3]],
+            [[BLUE_1, PINK_4], [BLUE_2, YELLOW_8], [PINK_2, YELLOW_3]],
+        ]:
+            endgame_players = with_hands(players, hands)
+            # ROCKET_1 being gone while its mission is pending means it was already won.
+            cards_left = {card for hand in hands for card in hand}
+            restricted = missions[:2] + [WinWithAllTheseCardsRule({ROCKET_1} & cards_left)]
+            for leader in endgame_players:
+                for pending_mask in range(1 << len(missions)):
+                    pending = [
+                        mission for index, mission in enumerate(restricted)
+                        if pending_mask & (1 << index)
+                    ]
+                    expected = DoubleDummySolver(pending).is_achievable(endgame_players, leader)
+                    assert tablebase.can_meet(endgame_players, leader, pending_mask) == expected
+
+def create_game_players():
+    return [Player(index + 1, f"Player {index + 1}", CardHand()) for index in range(4)]
+
+def play_prefix(seed, tricks):
+    players, captain = CardDealer(random.Random(seed)).deal_cards(create_game_players())
+    state = GameState(players, captain)
+    moves = []
+    while len(state.game_data.rounds) < tricks:
+        card = min(state.get_legal_card_set(), key=lambda card: card.id)
+        state.play_card(card)
+        moves.append(card)
+    return state, moves
+
+def get_lines(state):
+    if state.is_finished():
+        yield []
+        return
+    for card in list(state.get_legal_card_set()):
+        state.play_card(card)
+        for line in get_lines(state):
+            yield [card] + line
+        state.undo_card()
+
+def play_with_game_engine(seed, mission, moves):
+    player_interface = MagicMock()
+    cards = iter(moves)
+    player_interface.select_card.side_effect = lambda *_: next(cards)
+    engine = GameEngine(RoundEngine(player_interface), CardDealer(random.Random(seed)))
+    _, missions_data = engine.play_game(
+        create_game_players(), [mission], MissionsOrderData.empty()
+    )
+    return mission in missions_data.successful_missions
+
+def test_never_win_with_number_endgames_agree_with_the_game_engine(tmp_path):
+    outcomes = []
+    for seed in range(6):
+        state, prefix_moves = play_prefix(seed, tricks=8)
+        endgame_cards = {card for player in state.players for card in player.card_hand.cards}
+        for number in range(1, 10):
+            mission = NeverWinWithNumberRule(number)
+            tracker = mission.create_tracker()
+            if not CardsOperation.get_cards_by_number(number) & endgame_cards or any(
+                    tracker.on_trick_completed(round_data, False) != MissionStatus.PENDING
+                    for round_data in state.game_data.rounds):
+                continue
+
+            endgame_players = with_hands(
+                state.players, [player.card_hand.cards for player in state.players]
+            )
+            leader = endgame_players[state.players.index(state.get_leader())]
+            path = str(tmp_path / f"endgame_{seed}_{number}.bin")
+            EndgameTablebaseGenerator([mission], tricks_left=2).generate(endgame_players, path)
+
+            lines = list(get_lines(GameState(endgame_players, leader)))
+            expected = any(play_with_game_engine(seed, mission, prefix_moves + line)
+                           for line in lines)
+            with EndgameTablebase(path) as tablebase:
+                assert tablebase.can_meet(endgame_players, leader, 1) == expected
+            outcomes.append(expected)
+
+    assert True in outcomes and False in outcomes
+
+def test_no_pending_missions_can_always_be_met(players, tablebase_path):
+    endgame_players = with_hands(players, [[BLUE_1, BLUE_9], [BLUE_2, YELLOW_8], [PINK_2, BLUE_3]])
+    with EndgameTablebase(tablebase_path) as tablebase:
+        assert tablebase.lookup(endgame_players, endgame_players[0]) & 1
+        assert tablebase.mission_count == 3
+        assert tablebase.tricks_left == 2
+
+def test_unknown_positions_are_reported(players, tablebase_path):
+    with EndgameTablebase(tablebase_path) as tablebase:
+        assert tablebase.lookup(players, players[0]) is None
+        with pytest.raises(ValueError):
+            tablebase.can_meet(players, players[0], 0)
+
+def test_rejects_files_that_are_not_tablebases(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        EndgameTablebase(str(path))
+
+def test_rejects_too_many_missions(players):
+    with pytest.raises(ValueError):
+        EndgameTablebaseGenerator([PlayerShouldNeverWinRule(players[0])] * 6, tricks_left=2)
@@ -1,3 +1,5 @@
+import asyncio
+import random
 from typing import Dict, List
 import pytest
 import punq
@@ -8,9 +10,16 @@ from src.model.card import  (
     YELLOW_1, YELLOW_2, YELLOW_3, YELLOW_4, YELLOW_5, YELLOW_6, YELLOW_7, YELLOW_8, YELLOW_9,
     ROCKET_1,ROCKET_2, ROCKET_3, ROCKET_4
 )
+from src.game.interface.async_player_interface import SyncPlayerInterfaceAdapter
+from src.game.interface.bot_player_interface import BOTS, LowestCardBotPlayerInterface
 from src.game.interface.player_interface import PlayerInterface
-from src.game.round_engine import RoundEngine
-from src.game.game_engine import GameEngine
+from src.game.mission_rule_builder import AsyncMissionRuleListBuilder
+from src.game.round_engine import AsyncRoundEngine, RoundEngine
+from src.game.game_engine import AsyncGameEngine, GameEngine
+from src.game.simulation_runner import MISSION_CARDS, run_game
+from src.model.level_definition import LEVEL_3, LEVEL_5, LevelDefinition, MissionType
+from src.model.player_hand import CardHand
+from src.model.zobrist import Zobrist
 from src.game.card_dealer import CardDealer
 from src.model.round_data import RoundData
 from src.model.player_hand import Player
@@ -406,6 +415,239 @@ def test_play_game_should_play_all_rounds_but_without_completing_mission(contain
     assert missions_data.has_any_failed_mission() is True
 
 
+def test_play_game_should_accept_missions_with_fixed_positions_completed_on_the_same_round(container: punq.Container): # pylint: disable=line-too-long
+    engine: GameEngine = container.resolve(GameEngine)
+    round_engine: RoundEngine = container.resolve(RoundEngine)
+    card_dealer: CardDealer = container.resolve(CardDealer)
+
+    players = given_players_are_dealt_cards(
+        card_dealer,
+        captain_name="player_1",
+        cards_dealt_by_player={
+            "player_1": [YELLOW_2, GREEN_5, PINK_1, BLUE_1, ROCKET_4,
+                         PINK_4, GREEN_4, YELLOW_9, BLUE_4, PINK_9],
+            "player_2": [BLUE_7, YELLOW_4, ROCKET_1, GREEN_3, PINK_8,
+                         GREEN_2, PINK_6, YELLOW_5, BLUE_3, GREEN_8],
+            "player_3": [GREEN_9, BLUE_2, BLUE_5, YELLOW_1, ROCKET_3,
+                         GREEN_6, PINK_3, YELLOW_6, BLUE_6, YELLOW_7],
+            "player_4": [ROCKET_2, GREEN_7, YELLOW_3, BLUE_8, PINK_2,
+                         YELLOW_8, PINK_5, PINK_7, GREEN_1, BLUE_9],
+        }
+    )
+
+    player_1, player_2, player_3, player_4 = players[0], players[1], players[2], players[3]
+
+    given_played_round(
+        round_engine,
+        rounds_data = [
+            make_round_data({
+                player_1: PINK_9,
+                player_2: PINK_6,
+                player_3: PINK_3,
+                player_4: PINK_5
+            }),
+            make_round_data({
+                player_1: YELLOW_2,
+                player_2: YELLOW_4,
+                player_3: YELLOW_6,
+                player_4: YELLOW_8
+            })]
+    )
+
+    first_mission = PlayerHasToWinCardRule(player_1, PINK_9)
+    second_mission = PlayerHasToWinCardRule(player_1, PINK_6)
+    third_mission = PlayerHasToWinCardRule(player_4, YELLOW_8)
+    mission_order_data = (
+        MissionsOrderData.builder()
+        .set_fixed_position(second_mission, 1)
+        .set_fixed_position(first_mission, 2)
+        .set_fixed_position(third_mission, 3)
+        .build()
+    )
+
+    game_data, missions_data = engine.play_game(
+        players = players,
+        missions = [first_mission, second_mission, third_mission],
+        mission_order_data = mission_order_data
+    )
+
+    assert len(game_data.rounds) == 2
+    assert missions_data.successful_missions == {first_mission, second_mission, third_mission}
+    assert missions_data.failed_missions == set()
+    assert missions_data.are_missions_complete() is True
+
+def test_play_game_should_fail_mission_completed_before_its_fixed_position(container: punq.Container): # pylint: disable=line-too-long
+    engine: GameEngine = container.resolve(GameEngine)
+    round_engine: RoundEngine = container.resolve(RoundEngine)
+    card_dealer: CardDealer = container.resolve(CardDealer)
+
+    players = given_players_are_dealt_cards(
+        card_dealer,
+        captain_name="player_1",
+        cards_dealt_by_player={
+            "player_1": [YELLOW_2, PINK_9],
+            "player_2": [YELLOW_4, PINK_6],
+            "player_3": [YELLOW_6, PINK_3],
+            "player_4": [YELLOW_8, PINK_5],
+        }
+    )
+
+    player_1, player_2, player_3, player_4 = players[0], players[1], players[2], players[3]
+
+    given_played_round(
+        round_engine,
+        rounds_data = [
+            make_round_data({
+                player_1: PINK_9,
+                player_2: PINK_6,
+                player_3: PINK_3,
+                player_4: PINK_5
+            })]
+    )
+
+    first_mission = PlayerHasToWinCardRule(player_1, PINK_9)
+    second_mission = PlayerHasToWinCardRule(player_4, YELLOW_8)
+    mission_order_data = (
+        MissionsOrderData.builder()
+        .set_fixed_position(second_mission, 1)
+        .set_fixed_position(first_mission, 2)
+        .build()
+    )
+
+    _, missions_data = engine.play_game(
+        players = players,
+        missions = [first_mission, second_mission],
+        mission_order_data = mission_order_data
+    )
+
+    assert missions_data.failed_missions == {first_mission}
+    assert missions_data.has_any_failed_mission() is True
+
+
+def test_play_game_should_let_the_round_winner_start_the_next_round(container: punq.Container):
+    engine: GameEngine = container.resolve(GameEngine)
+    round_engine: RoundEngine = container.resolve(RoundEngine)
+    card_dealer: CardDealer = container.resolve(CardDealer)
+
+    players = given_players_are_dealt_cards(
+        card_dealer,
+        captain_name="player_1",
+        cards_dealt_by_player={
+            "player_1": [YELLOW_2, GREEN_5, PINK_1, BLUE_1, ROCKET_4,
+                         PINK_4, GREEN_4, YELLOW_9, BLUE_4, PINK_9],
+            "player_2": [BLUE_7, YELLOW_4, ROCKET_1, GREEN_3, PINK_8,
+                         GREEN_2, PINK_6, YELLOW_5, BLUE_3, GREEN_8],
+            "player_3": [GREEN_9, BLUE_2, BLUE_5, YELLOW_1, ROCKET_3,
+                         GREEN_6, PINK_3, YELLOW_6, BLUE_6, YELLOW_7],
+            "player_4": [ROCKET_2, GREEN_7, YELLOW_3, BLUE_8, PINK_2,
+                         YELLOW_8, PINK_5, PINK_7, GREEN_1, BLUE_9],
+        }
+    )
+
+    player_1, player_2, player_3, player_4 = players[0], players[1], players[2], players[3]
+
+    given_played_round(
+        round_engine,
+        rounds_data = [
+            make_round_data({
+                player_1: PINK_4,
+                player_2: PINK_8,
+                player_3: PINK_3,
+                player_4: PINK_5
+            }),
+            make_round_data({
+                player_2: YELLOW_4,
+                player_3: YELLOW_6,
+                player_4: YELLOW_8,
+                player_1: YELLOW_9
+            })]
+    )
+
+    mission = PlayerHasToWinCardRule(player_1, YELLOW_9)
+
+    engine.play_game(
+        players = players,
+        missions = [mission],
+        mission_order_data = MissionsOrderData.empty()
+    )
+
+    starters = [call.args[1] for call in round_engine.play_round.call_args_list]
+    assert starters == [player_1, player_2]
+
+def test_async_play_game_should_return_result_as_soon_as_missions_are_complete(mocker):
+    round_engine = mocker.AsyncMock()
+    card_dealer = mocker.MagicMock()
+    engine = AsyncGameEngine(round_engine, card_dealer)
+
+    players = given_players_are_dealt_cards(
+        card_dealer,
+        captain_name="player_1",
+        cards_dealt_by_player={
+            "player_1": [YELLOW_9, BLUE_1],
+            "player_2": [YELLOW_4, BLUE_2],
+        }
+    )
+    player_1, player_2 = players[0], players[1]
+    given_played_round(
+        round_engine,
+        rounds_data = [make_round_data({player_1: YELLOW_9, player_2: YELLOW_4})]
+    )
+    mission = PlayerHasToWinCardRule(player_1, YELLOW_9)
+
+    game_data, missions_data = asyncio.run(
+        engine.play_game(players, [mission], MissionsOrderData.empty())
+    )
+
+    assert len(game_data.rounds) == 1
+    assert missions_data.successful_missions == {mission}
+    round_engine.play_round.assert_awaited_once_with(players, player_1)
+
+class YieldingPlayerInterface(SyncPlayerInterfaceAdapter):
+    """Gives the event loop to the other tables before each card, like a remote player."""
+
+    async def select_card(self, player: Player, round_data: RoundData) -> Card:
+        await asyncio.sleep(0)
+        return await super().select_card(player, round_data)
+
+async def play_async_table(
+        level_definition: LevelDefinition,
+        seed: int,
+        *,
+        bot_name: str = "random",
+        round_engine: AsyncRoundEngine | None = None):
+    rng = random.Random(seed)
+    player_interface = YieldingPlayerInterface(BOTS[bot_name](rng))
+    if round_engine is None:
+        round_engine = AsyncRoundEngine(player_interface)
+    players = [Player(index + 1, f"Bot {index + 1}", CardHand()) for index in range(4)]
+
+    mission_count = level_definition.mission_types.get(MissionType.PLAYER_HAS_TO_WIN_CARD, 0)
+    mission_cards = rng.sample(MISSION_CARDS, mission_count)
+    builder = AsyncMissionRuleListBuilder(player_interface)
+    missions = await builder.build(players, level_definition, mission_cards)
+    order_data = builder.build_missions_order_data(missions, level_definition, mission_cards)
+
+    engine = AsyncGameEngine(round_engine, CardDealer(random.Random(Zobrist.mix(seed))))
+    game_data, missions_data = await engine.play_game(players, missions, order_data)
+    return missions_data.are_missions_complete(), len(game_data.rounds)
+
+@pytest.mark.parametrize("level_definition", [LEVEL_3, LEVEL_5])
+def test_async_tables_on_one_event_loop_play_like_the_sync_engine(level_definition):
+    seeds = range(300)
+
+    async def play_all_tables():
+        return await asyncio.gather(
+            *(play_async_table(level_definition, seed) for seed in seeds)
+        )
+
+    async_results = asyncio.run(play_all_tables())
+
+    sync_results = [
+        (result.success, result.rounds_played)
+        for result in (run_game(level_definition, "random", 4, seed) for seed in seeds)
+    ]
+    assert async_results == sync_results
+
 def given_players_are_dealt_cards(
     card_dealer: CardDealer,
     captain_name: str,
@@ -434,3 +676,21 @@ def given_played_round(
     rounds_data: List[RoundData]
 ):
     round_engine.play_round.side_effect = rounds_data
+
+def test_async_tables_can_share_one_round_engine():
+    seeds = range(100)
+    round_engine = AsyncRoundEngine(YieldingPlayerInterface(LowestCardBotPlayerInterface()))
+
+    async def play_all_tables():
+        return await asyncio.gather(*(
+            play_async_table(LEVEL_5, seed, bot_name="lowest", round_engine=round_engine)
+            for seed in seeds
+        ))
+
+    async_results = asyncio.run(play_all_tables())
+
+    sync_results = [
+        (result.success, result.rounds_played)
+        for result in (run_game(LEVEL_5, "lowest", 4, seed) for seed in seeds)
+    ]
+    assert async_results == sync_results
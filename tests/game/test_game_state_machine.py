@@ -0,0 +1,135 @@
+import random
+import pytest
+from src.game.card_dealer import CardDealer
+from src.game.game_state_machine import (
+    CardPlayed,
+    GameOver,
+    GameStateMachine,
+    MissionCompleted,
+    MissionFailed,
+    Move,
+    RoundCompleted,
+)
+from src.game.interface.bot_player_interface import RandomBotPlayerInterface
+from src.game.mission_rule_builder import MissionRuleListBuilder
+from src.game.mission_rules import PlayerHasToWinCardRule
+from src.game.simulation_runner import MISSION_CARDS, run_game
+from src.model.card import BLUE_1, BLUE_2, PINK_2, YELLOW_4, YELLOW_9
+from src.model.level_definition import LEVEL_3, LEVEL_5, LevelDefinition, MissionType
+from src.model.missions_order_data import MissionsOrderData
+from src.model.player_hand import CardHand, Player
+from src.model.zobrist import Zobrist
+from tests.helpers.test_data_creation_helper import create_player
+
+def test_apply_should_return_events_until_missions_are_complete():
+    player_1 = create_player("player_1", [YELLOW_9, BLUE_1])
+    player_2 = create_player("player_2", [YELLOW_4, BLUE_2])
+    mission = PlayerHasToWinCardRule(player_1, YELLOW_9)
+    game = GameStateMachine(
+        [player_1, player_2], player_1, [mission], MissionsOrderData.empty()
+    )
+
+    decision = game.get_pending_decision()
+    assert decision.player == player_1
+    assert decision.legal_cards == [YELLOW_9, BLUE_1]
+    assert decision.round_number == 1
+
+    assert game.apply(Move(player_1.id, YELLOW_9)) == [CardPlayed(player_1, YELLOW_9)]
+
+    decision = game.get_pending_decision()
+    assert decision.player == player_2
+    assert decision.legal_cards == [YELLOW_4]
+
+    events = game.apply(Move(player_2.id, YELLOW_4))
+
+    assert events == [
+        CardPlayed(player_2, YELLOW_4),
+        RoundCompleted(1, player_1, YELLOW_9),
+        MissionCompleted(mission),
+        GameOver(success=True),
+    ]
+    assert game.is_over
+    assert game.get_pending_decision() is None
+    assert len(game.game_data.rounds) == 1
+    assert game.missions_data.successful_missions == {mission}
+
+def test_apply_should_report_failed_missions():
+    player_1 = create_player("player_1", [BLUE_1, YELLOW_9])
+    player_2 = create_player("player_2", [PINK_2, YELLOW_4])
+    mission = PlayerHasToWinCardRule(player_2, BLUE_1)
+    game = GameStateMachine(
+        [player_1, player_2], player_1, [mission], MissionsOrderData.empty()
+    )
+
+    game.apply(Move(player_1.id, BLUE_1))
+    assert game.get_pending_decision().legal_cards == [PINK_2, YELLOW_4]
+    events = game.apply(Move(player_2.id, PINK_2))
+
+    assert events[1:] == [
+        RoundCompleted(1, player_1, BLUE_1),
+        MissionFailed(mission),
+        GameOver(success=False),
+    ]
+
+def test_winner_should_start_the_next_round():
+    player_1 = create_player("player_1", [BLUE_1, YELLOW_9])
+    player_2 = create_player("player_2", [BLUE_2, YELLOW_4])
+    mission = PlayerHasToWinCardRule(player_1, YELLOW_4)
+    game = GameStateMachine(
+        [player_1, player_2], player_1, [mission], MissionsOrderData.empty()
+    )
+
+    game.apply(Move(player_1.id, BLUE_1))
+    assert game.apply(Move(player_2.id, BLUE_2))[-1] == RoundCompleted(1, player_2, BLUE_2)
+
+    decision = game.get_pending_decision()
+    assert decision.player == player_2
+    assert decision.round_number == 2
+    assert not game.is_over
+
+def test_apply_should_reject_invalid_moves():
+    player_1 = create_player("player_1", [YELLOW_9, BLUE_1])
+    player_2 = create_player("player_2", [YELLOW_4, BLUE_2])
+    mission = PlayerHasToWinCardRule(player_1, YELLOW_9)
+    game = GameStateMachine(
+        [player_1, player_2], player_1, [mission], MissionsOrderData.empty()
+    )
+
+    with pytest.raises(ValueError, match="turn"):
+        game.apply(Move(player_2.id, YELLOW_4))
+
+    game.apply(Move(player_1.id, YELLOW_9))
+    with pytest.raises(ValueError, match="cannot be played"):
+        game.apply(Move(player_2.id, BLUE_2))
+    assert player_2.card_hand.cards == [YELLOW_4, BLUE_2]
+
+    game.apply(Move(player_2.id, YELLOW_4))
+    with pytest.raises(ValueError, match="over"):
+        game.apply(Move(player_1.id, BLUE_1))
+
+@pytest.mark.parametrize("level_definition", [LEVEL_3, LEVEL_5])
+def test_games_pushed_move_by_move_should_play_like_the_game_engine(level_definition):
+    for seed in range(100):
+        game, rng = start_game_like_run_game(level_definition, seed)
+        events = []
+        while not game.is_over:
+            decision = game.get_pending_decision()
+            events += game.apply(Move(decision.player.id, rng.choice(decision.legal_cards)))
+
+        result = run_game(level_definition, "random", 4, seed)
+        assert events[-1] == GameOver(result.success)
+        assert len(game.game_data.rounds) == result.rounds_played
+
+def start_game_like_run_game(level_definition: LevelDefinition, seed: int):
+    rng = random.Random(seed)
+    bot = RandomBotPlayerInterface(rng)
+    players = [Player(index + 1, f"Bot {index + 1}", CardHand()) for index in range(4)]
+
+    mission_count = level_definition.mission_types.get(MissionType.PLAYER_HAS_TO_WIN_CARD, 0)
+    mission_cards = rng.sample(MISSION_CARDS, mission_count)
+    builder = MissionRuleListBuilder(bot)
+    missions = builder.build(players, level_definition, mission_cards)
+    order_data = builder.build_missions_order_data(missions, level_definition, mission_cards)
+
+    card_dealer = CardDealer(random.Random(Zobrist.mix(seed)))
+    return GameStateMachine.start(card_dealer, players, missions, order_data), rng
@@ -0,0 +1,68 @@
+import random
+import pytest
+from src.game.hand_sampler import HandSampler, ObservedGame
+from src.model.card import (
+    ALL_CARDS, BLUE_1, GREEN_1, PINK_1, YELLOW_9, ROCKET_4, CardSet, CardType, CardsOperation
+)
+from src.model.game_state import GameState
+from tests.helpers.test_data_creation_helper import (
+    create_finished_round, create_player, create_test_game
+)
+
+@pytest.fixture
+def state():
+    player_1 = create_player("P1", ALL_CARDS[0:14])
+    player_2 = create_player("P2", ALL_CARDS[14:27])
+    player_3 = create_player("P3", ALL_CARDS[27:40])
+    game_state = GameState([player_1, player_2, player_3], leader=player_2)
+    game_state.play_card(PINK_1)
+    game_state.play_card(GREEN_1)
+    game_state.play_card(BLUE_1)
+    return game_state
+
+def create_sampler(state, seed=1):
+    player_1, _, player_3 = state.players
+    return HandSampler(
+        player_1, ObservedGame(state.players, player_3, state.game_data, state.current_round),
+        rng=random.Random(seed)
+    )
+
+def test_samples_respect_sizes_voids_and_captain(state):
+    player_1, player_2, player_3 = state.players
+    seen = player_1.card_hand.card_set | state.game_data.get_played_card_set()
+    pink_cards = CardsOperation.get_card_set_by_type(CardType.PINK)
+
+    for deal in create_sampler(state).sample_batch(200):
+        assert len(deal[player_2.id]) == 12
+        assert len(deal[player_3.id]) == 12
+        assert not deal[player_2.id] & deal[player_3.id]
+        assert not (deal[player_2.id] | deal[player_3.id]) & seen
+        assert ROCKET_4 in deal[player_3.id]
+        assert not deal[player_3.id] & pink_cards
+
+def test_counts_consistent_deals(state):
+    # The 8 unseen pink cards go to P2 and ROCKET_4 to P3, leaving 4 of 15 cards for P2.
+    assert create_sampler(state).count_deals() == 1365
+
+def test_free_cards_are_spread_uniformly(state):
+    _, player_2, _ = state.players
+    deals = create_sampler(state, seed=7).sample_batch(3000)
+
+    share_with_player_2 = sum(YELLOW_9 in deal[player_2.id] for deal in deals) / len(deals)
+
+    assert share_with_player_2 == pytest.approx(4 / 15, abs=0.03)
+
+def test_inconsistent_observations_are_rejected(state):
+    player_1, player_2, player_3 = state.players
+    both_void_in_pink = create_test_game(13, [
+        create_finished_round({player_1: PINK_1, player_2: YELLOW_9, player_3: GREEN_1}),
+    ])
+
+    with pytest.raises(ValueError):
+        HandSampler(player_1, ObservedGame(state.players, player_3, both_void_in_pink))
+
+def test_samples_do_not_change_the_hands(state):
+    hands_before = [player.card_hand.card_set for player in state.players]
+    create_sampler(state).sample()
+    assert [player.card_hand.card_set for player in state.players] == hands_before
+    assert state.players[0].card_hand.card_set == CardSet.of(ALL_CARDS[1:14])
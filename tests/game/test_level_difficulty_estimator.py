@@ -0,0 +1,69 @@
+import pytest
+
+from src.game.level_difficulty_estimator import (
+    UNFINISHED,
+    LevelDifficultyEstimator,
+    main,
+)
+from src.game.simulation_runner import SimulationRunner
+from src.model.level_definition import LEVEL_1, LEVEL_4, LEVEL_5
+
+def test_estimate_stops_once_the_interval_is_narrow_enough():
+    estimator = LevelDifficultyEstimator(target_width=0.5, batch_size=20, max_games=1000)
+
+    difficulty = estimator.estimate(LEVEL_1, seed=1)
+
+    low, high = difficulty.confidence_interval
+    assert difficulty.games == 20
+    assert high - low <= 0.5
+    assert low <= difficulty.success_rate <= high
+
+def test_estimate_stops_at_the_maximum_number_of_games():
+    estimator = LevelDifficultyEstimator(target_width=0.0, batch_size=15, max_games=40)
+
+    difficulty = estimator.estimate(LEVEL_4, seed=2)
+
+    assert difficulty.games == 40
+
+def test_failures_are_broken_down_by_mission_type():
+    estimator = LevelDifficultyEstimator("lowest", target_width=0.0, batch_size=30, max_games=30)
+
+    difficulty = estimator.estimate(LEVEL_5, seed=3)
+
+    failures = difficulty.games - difficulty.successes
+    assert sum(difficulty.failures_by_mission.values()) == failures
+    assert set(difficulty.failures_by_mission) <= {"PlayerShouldNeverWinRule", UNFINISHED}
+    assert 1 <= difficulty.average_tricks_until_failure <= 10
+
+def test_estimate_matches_a_single_batch_of_the_same_games():
+    estimator = LevelDifficultyEstimator(target_width=0.0, batch_size=7, max_games=21)
+
+    difficulty = estimator.estimate(LEVEL_1, seed=4)
+
+    results = list(SimulationRunner(LEVEL_1).iterate(21, seed=4))
+    assert difficulty.successes == sum(result.success for result in results)
+
+def test_wilson_interval():
+    estimator = LevelDifficultyEstimator(confidence=0.95)
+
+    assert estimator.get_interval(0, 0) == (0.0, 1.0)
+    low, high = estimator.get_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-4)
+    assert high == pytest.approx(0.5962, abs=1e-4)
+    assert estimator.get_interval(0, 10)[0] == pytest.approx(0.0)
+
+def test_invalid_parameters_are_rejected():
+    with pytest.raises(ValueError):
+        LevelDifficultyEstimator(confidence=1.0)
+    with pytest.raises(ValueError):
+        LevelDifficultyEstimator(batch_size=0)
+
+def test_main_prints_every_level(capsys):
+    difficulties = main([
+        "--levels", "LEVEL_1", "LEVEL_5", "--max-games", "10", "--batch-size", "10",
+        "--processes", "2",
+    ])
+
+    output = capsys.readouterr().out
+    assert set(difficulties) == {"LEVEL_1", "LEVEL_5"}
+    assert "LEVEL_1:" in output and "LEVEL_5:" in output
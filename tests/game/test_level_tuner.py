@@ -0,0 +1,65 @@
+import pytest
+
+from src.game.level_tuner import LevelParameterSpace, LevelTuner, main
+from src.game.simulation_runner import SimulationRunner
+from src.model.level_definition import (
+    LEVEL_1, LEVEL_4, LEVEL_5, CommunicationType, MissionType, OrderToken
+)
+
+def test_space_skips_order_tokens_without_enough_mission_cards():
+    space = LevelParameterSpace(
+        mission_card_counts=(0, 1, 2),
+        extra_mission_types=((), (MissionType.PLAYER_SHOULD_NEVER_WIN,)),
+        order_token_options=((), (OrderToken.FIRST_ABSOLUTE, OrderToken.SECOND_ABSOLUTE)),
+    )
+
+    candidates = space.get_candidates()
+
+    assert len(candidates) == 7
+    for candidate in candidates:
+        mission_cards = candidate.mission_types.get(MissionType.PLAYER_HAS_TO_WIN_CARD, 0)
+        assert len(candidate.order_tokens) <= mission_cards
+        assert candidate.mission_types
+        assert candidate.communication_type == CommunicationType.REGULAR
+
+def test_tune_keeps_the_candidate_closest_to_the_band():
+    tuner = LevelTuner((0.2, 0.3), initial_games=20, max_games=80, chunk_size=15)
+
+    tuned = tuner.tune([LEVEL_4, LEVEL_1, LEVEL_5], seed=1)
+
+    assert tuned[0].level_definition is LEVEL_1
+    assert tuned[0].games == 80
+    assert sorted(level.games for level in tuned) == [20, 40, 80]
+
+def test_candidates_are_measured_on_the_same_games():
+    tuner = LevelTuner((0.0, 1.0), initial_games=30, max_games=30, chunk_size=7)
+
+    tuned = tuner.tune([LEVEL_1, LEVEL_5], seed=2)
+
+    for level in tuned:
+        results = SimulationRunner(level.level_definition).iterate(30, seed=2)
+        assert level.successes == sum(result.success for result in results)
+
+def test_score_is_zero_inside_the_band():
+    tuner = LevelTuner((0.2, 0.4))
+
+    assert tuner.score(30, 100)[0] == 0.0
+    assert tuner.score(10, 100)[0] == pytest.approx(0.1)
+    assert tuner.score(50, 100) < tuner.score(60, 100)
+
+def test_invalid_parameters_are_rejected():
+    with pytest.raises(ValueError):
+        LevelTuner((0.5, 0.4))
+    with pytest.raises(ValueError):
+        LevelTuner((0.1, 0.2), reduction_factor=1)
+    with pytest.raises(ValueError):
+        LevelTuner((0.1, 0.2), bot_name="human")
+
+def test_main_prints_the_best_levels(capsys):
+    tuned = main([
+        "--target-low", "0.2", "--target-high", "0.3", "--initial-games", "5",
+        "--max-games", "10", "--processes", "2", "--top", "3",
+    ])
+
+    assert len(capsys.readouterr().out.splitlines()) == 3
+    assert tuned[0].games == 10
@@ -1,8 +1,11 @@
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 from src.model.card import BLUE_1, BLUE_2
-from src.model.level_definition import MissionType, LevelDefinition, CommunicationType
-from src.game.mission_rule_builder import MissionRuleListBuilder
+from src.model.level_definition import (
+    MissionType, LevelDefinition, CommunicationType, OrderToken
+)
+from src.game.mission_rule_builder import AsyncMissionRuleListBuilder, MissionRuleListBuilder
 from src.game.mission_rules import (
     PlayerHasToWinCardRule,
     PlayerShouldNeverWinRule,
@@ -93,3 +96,56 @@ class TestMissionRuleListBuilder:
 
         rules = self.builder.build(self.players, definition, [])
         assert not rules
+
+    def test_missions_order_data_from_order_tokens(self):
+        self.mock_interface.select_mission.side_effect = [BLUE_1, BLUE_2]
+
+        definition = LevelDefinition(
+            order_tokens=[OrderToken.FIRST_ABSOLUTE, OrderToken.SECOND_ABSOLUTE],
+            mission_types={MissionType.PLAYER_HAS_TO_WIN_CARD: 2},
+            communication_type=CommunicationType.REGULAR,
+        )
+        mission_cards = [BLUE_2, BLUE_1]
+
+        rules = self.builder.build(self.players, definition, mission_cards)
+        order_data = self.builder.build_missions_order_data(rules, definition, mission_cards)
+
+        positions = {rule.card: position for rule, position in order_data.fixed_positions.items()}
+        assert positions == {BLUE_2: 1, BLUE_1: 2}
+
+class TestAsyncMissionRuleListBuilder:
+    def setup_method(self):
+        self.mock_interface = AsyncMock()
+        self.builder = AsyncMissionRuleListBuilder(self.mock_interface)
+        self.players = [create_player("Alice"), create_player("Bob")]
+
+    def test_builds_the_same_missions_as_the_sync_builder(self):
+        self.mock_interface.select_mission.side_effect = [BLUE_1, BLUE_2]
+        self.mock_interface.select_player_that_should_not_win.return_value = self.players[0]
+
+        definition = LevelDefinition(
+            order_tokens=[OrderToken.FIRST_ABSOLUTE],
+            mission_types={
+                MissionType.PLAYER_HAS_TO_WIN_CARD: 2,
+                MissionType.PLAYER_SHOULD_NEVER_WIN: 1,
+                MissionType.WIN_ONCE_WITH_NUMBER: 1,
+            },
+            communication_type=CommunicationType.REGULAR,
+            missions_metadata={MissionType.WIN_ONCE_WITH_NUMBER: {"mission_number": 5}},
+        )
+        mission_cards = [BLUE_1, BLUE_2]
+
+        rules = asyncio.run(self.builder.build(self.players, definition, mission_cards))
+        order_data = self.builder.build_missions_order_data(rules, definition, mission_cards)
+
+        assert rules == [
+            PlayerHasToWinCardRule(player=self.players[0], card=BLUE_1),
+            PlayerHasToWinCardRule(player=self.players[1], card=BLUE_2),
+            PlayerShouldNeverWinRule(player_that_should_never_win=self.players[0]),
+            WinOnceWithNumberRule(5),
+        ]
+        awaited = self.mock_interface.select_mission.await_args_list
+        assert [(call.args[0], call.kwargs["can_skip"]) for call in awaited] == [
+            (self.players[0].id, False), (self.players[1].id, False)
+        ]
+        assert order_data.fixed_positions == {rules[0]: 1}
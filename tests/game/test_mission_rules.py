@@ -1,17 +1,19 @@
 from src.model.card import (
     BLUE_2, BLUE_6, BLUE_8, BLUE_9,
     PINK_1, PINK_2, PINK_9,
-    GREEN_4, GREEN_9,
+    GREEN_2, GREEN_4, GREEN_9,
     YELLOW_2, YELLOW_5, YELLOW_9,
     ROCKET_1,ROCKET_2, ROCKET_3, ROCKET_4
 )
-from src.model.card import ALL_ROCKETS
+from src.model.card import ALL_ROCKETS, CardSet
 from src.game.mission_rules import (
     PlayerHasToWinCardRule,
     NeverWinWithNumberRule,
     WinOnceWithNumberRule,
     WinWithAllTheseCardsRule,
     PlayerShouldNeverWinRule,
+    MissionStatus,
+    NeverWinWithNumberTracker,
 )
 from tests.helpers.test_data_creation_helper import (
     create_finished_round, create_test_game, create_player
@@ -213,3 +215,119 @@ def test_player_should_never_win__game_not_finished_and_player_won():
     rule = PlayerShouldNeverWinRule(player_that_should_never_win=PLAYER_2)
     assert rule.is_rule_satisfied(game) is False
     assert rule.is_rule_broken(game) is True
+
+def track_rounds(rule, num_of_rounds, rounds):
+    tracker = rule.create_tracker()
+    return [
+        tracker.on_trick_completed(round_data, index == num_of_rounds - 1)
+        for index, round_data in enumerate(rounds)
+    ]
+
+def test_player_has_to_win_card_tracker():
+    rounds = [
+        create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: BLUE_2}),
+        create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_9}),
+    ]
+    statuses = track_rounds(PlayerHasToWinCardRule(PLAYER_1, BLUE_8), 8, rounds)
+    assert statuses == [MissionStatus.PENDING, MissionStatus.BROKEN]
+
+    statuses = track_rounds(PlayerHasToWinCardRule(PLAYER_1, BLUE_6), 8, rounds)
+    assert statuses == [MissionStatus.SATISFIED, MissionStatus.PENDING]
+
+def test_never_win_with_number_tracker__all_numbers_played_and_didnt_win():
+    rounds = [
+        create_finished_round({PLAYER_1: ROCKET_1, PLAYER_2: GREEN_9}),
+        create_finished_round({PLAYER_1: ROCKET_2, PLAYER_2: PINK_9}),
+        create_finished_round({PLAYER_1: ROCKET_3, PLAYER_2: BLUE_9}),
+        create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: YELLOW_9})
+    ]
+    statuses = track_rounds(NeverWinWithNumberRule(number=9), 8, rounds[:3])
+    assert statuses == [MissionStatus.PENDING] * 3
+
+    statuses = track_rounds(NeverWinWithNumberRule(number=9), 8, rounds)
+    assert statuses[-1] == MissionStatus.SATISFIED
+
+def test_never_win_with_number_tracker__resumed_with_the_cards_not_played():
+    rule = NeverWinWithNumberRule(number=9)
+    tracker = NeverWinWithNumberTracker(rule, CardSet.of([BLUE_9, YELLOW_9]))
+    round_data = create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: YELLOW_9})
+    assert tracker.on_trick_completed(round_data, False) == MissionStatus.PENDING
+
+    round_data = create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_9})
+    assert tracker.on_trick_completed(round_data, False) == MissionStatus.BROKEN
+
+    tracker = NeverWinWithNumberTracker(rule, CardSet.of([YELLOW_9]))
+    round_data = create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: YELLOW_9})
+    assert tracker.on_trick_completed(round_data, False) == MissionStatus.SATISFIED
+
+def test_never_win_with_number_tracker__number_won():
+    rounds = [create_finished_round({PLAYER_1: YELLOW_9, PLAYER_2: YELLOW_5})]
+    statuses = track_rounds(NeverWinWithNumberRule(number=9), 4, rounds)
+    assert statuses == [MissionStatus.BROKEN]
+
+def test_never_win_with_number_tracker__game_finished():
+    rounds = [
+        create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: BLUE_8}),
+        create_finished_round({PLAYER_1: GREEN_4, PLAYER_2: ROCKET_2}),
+    ]
+    statuses = track_rounds(NeverWinWithNumberRule(number=9), 2, rounds)
+    assert statuses == [MissionStatus.PENDING, MissionStatus.SATISFIED]
+
+def test_never_win_with_number__rocket_of_the_number_counts():
+    rounds = [
+        create_finished_round({PLAYER_1: BLUE_2, PLAYER_2: BLUE_6}),
+        create_finished_round({PLAYER_1: YELLOW_2, PLAYER_2: YELLOW_5}),
+        create_finished_round({PLAYER_1: PINK_2, PLAYER_2: PINK_9}),
+        create_finished_round({PLAYER_1: GREEN_2, PLAYER_2: GREEN_4}),
+        create_finished_round({PLAYER_1: ROCKET_2, PLAYER_2: BLUE_8}),
+    ]
+    rule = NeverWinWithNumberRule(number=2)
+
+    game = create_test_game(num_of_rounds=8, rounds_already_played=rounds[:4])
+    assert rule.is_rule_satisfied(game) is False
+    game = create_test_game(num_of_rounds=8, rounds_already_played=rounds)
+    assert rule.is_rule_broken(game) is True
+
+    statuses = track_rounds(rule, 8, rounds)
+    assert statuses == [MissionStatus.PENDING] * 4 + [MissionStatus.BROKEN]
+
+def test_win_once_with_number_tracker():
+    rounds = [
+        create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: BLUE_8}),
+        create_finished_round({PLAYER_1: PINK_1, PLAYER_2: YELLOW_5})
+    ]
+    assert track_rounds(WinOnceWithNumberRule(number=1), 2, rounds) == [
+        MissionStatus.PENDING, MissionStatus.SATISFIED
+    ]
+    assert track_rounds(WinOnceWithNumberRule(number=9), 2, rounds) == [
+        MissionStatus.PENDING, MissionStatus.BROKEN
+    ]
+
+def test_win_with_all_these_cards_tracker():
+    rounds = [
+        create_finished_round({PLAYER_1: ROCKET_1, PLAYER_2: BLUE_8}),
+        create_finished_round({PLAYER_1: ROCKET_2, PLAYER_2: BLUE_2})
+    ]
+    rule = WinWithAllTheseCardsRule(cards_that_need_to_win={ROCKET_1, ROCKET_2})
+    assert track_rounds(rule, 8, rounds) == [MissionStatus.PENDING, MissionStatus.SATISFIED]
+
+    rule = WinWithAllTheseCardsRule(cards_that_need_to_win=ALL_ROCKETS)
+    assert track_rounds(rule, 2, rounds) == [MissionStatus.PENDING, MissionStatus.BROKEN]
+
+def test_player_should_never_win_tracker():
+    rounds = [
+        create_finished_round({PLAYER_1: ROCKET_1, PLAYER_2: BLUE_8}),
+        create_finished_round({PLAYER_1: ROCKET_2, PLAYER_2: PINK_1})
+    ]
+    rule = PlayerShouldNeverWinRule(player_that_should_never_win=PLAYER_2)
+    assert track_rounds(rule, 2, rounds) == [MissionStatus.PENDING, MissionStatus.SATISFIED]
+
+    rule = PlayerShouldNeverWinRule(player_that_should_never_win=PLAYER_1)
+    assert track_rounds(rule, 2, rounds[:1]) == [MissionStatus.BROKEN]
+
+def test_win_with_all_these_cards_rule_is_hashable():
+    first = WinWithAllTheseCardsRule(cards_that_need_to_win={ROCKET_1, ROCKET_2})
+    second = WinWithAllTheseCardsRule(cards_that_need_to_win={ROCKET_2, ROCKET_1})
+
+    assert first == second
+    assert len({first, second}) == 1
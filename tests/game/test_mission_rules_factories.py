@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 import pytest
 
-from src.model.level_definition import MissionType
+from src.model.level_definition import MissionType, OrderToken
 from src.game.mission_rules import (
     NeverWinWithNumberRule,
     WinOnceWithNumberRule,
@@ -18,6 +18,7 @@ from src.game.mission_rule_factories import (
     StaticMissionRuleFactory,
     PlayerShouldNeverWinMissionRuleFactory,
     PlayerHasToWinMissionRuleListFactory,
+    OrderTokenMissionsOrderDataFactory,
 )
 
 from tests.helpers.test_data_creation_helper import create_player
@@ -255,3 +256,72 @@ class TestPlayerHasToWinMissionRuleListFactory:
             assert player_id == exp_player_id
             assert available_cards == exp_available_cards
             assert can_skip == exp_can_skip
+
+
+class TestOrderTokenMissionsOrderDataFactory:
+    def setup_method(self):
+        self.player_1 = create_player("P1")
+        self.player_2 = create_player("P2")
+        self.blue_8 = PlayerHasToWinCardRule(self.player_1, BLUE_8)
+        self.pink_2 = PlayerHasToWinCardRule(self.player_2, PINK_2)
+        self.green_3 = PlayerHasToWinCardRule(self.player_1, GREEN_3)
+        self.rules = [self.blue_8, self.pink_2, self.green_3]
+        self.mission_cards = [BLUE_8, PINK_2, GREEN_3]
+
+    def test_without_tokens(self):
+        order_data = OrderTokenMissionsOrderDataFactory.create(self.rules, self.mission_cards, [])
+        assert not order_data.fixed_positions
+        assert not order_data.must_come_before
+
+    def test_absolute_tokens_fix_positions(self):
+        order_data = OrderTokenMissionsOrderDataFactory.create(
+            self.rules,
+            self.mission_cards,
+            [OrderToken.SECOND_ABSOLUTE, OrderToken.FIRST_ABSOLUTE]
+        )
+        assert order_data.fixed_positions == {self.blue_8: 2, self.pink_2: 1}
+
+    def test_relative_tokens_are_chained(self):
+        order_data = OrderTokenMissionsOrderDataFactory.create(
+            self.rules,
+            self.mission_cards,
+            [OrderToken.THIRD_RELATIVE, OrderToken.FIRST_RELATIVE, OrderToken.SECOND_RELATIVE]
+        )
+        assert order_data.must_come_before == {
+            self.pink_2: {self.green_3},
+            self.green_3: {self.blue_8}
+        }
+
+    def test_last_token_comes_after_every_other_mission(self):
+        order_data = OrderTokenMissionsOrderDataFactory.create(
+            self.rules,
+            self.mission_cards,
+            [OrderToken.LAST_ABSOLUTE]
+        )
+        assert order_data.prerequisites[self.blue_8] == {self.pink_2, self.green_3}
+        assert not order_data.is_order_respected([self.pink_2], self.blue_8)
+        assert order_data.is_order_respected([self.pink_2, self.green_3], self.blue_8)
+
+    def test_token_on_card_without_mission_is_rejected(self):
+        with pytest.raises(ValueError):
+            OrderTokenMissionsOrderDataFactory.create(
+                [self.blue_8],
+                [PINK_2],
+                [OrderToken.FIRST_ABSOLUTE]
+            )
+
+    def test_more_tokens_than_cards_are_rejected(self):
+        with pytest.raises(ValueError):
+            OrderTokenMissionsOrderDataFactory.create(
+                self.rules,
+                [BLUE_8],
+                [OrderToken.FIRST_ABSOLUTE, OrderToken.SECOND_ABSOLUTE]
+            )
+
+    def test_absolute_token_past_the_last_mission_is_rejected(self):
+        with pytest.raises(ValueError):
+            OrderTokenMissionsOrderDataFactory.create(
+                [self.blue_8],
+                [BLUE_8],
+                [OrderToken.SECOND_ABSOLUTE]
+            )
@@ -0,0 +1,53 @@
+from src.model.card import BLUE_2, BLUE_6, BLUE_8, PINK_9, ROCKET_1, ROCKET_2
+from src.game.mission_rules import (
+    PlayerHasToWinCardRule,
+    NeverWinWithNumberRule,
+    WinOnceWithNumberRule,
+    PlayerShouldNeverWinRule,
+)
+from src.game.mission_trigger_index import MissionTriggerIndex
+from tests.helpers.test_data_creation_helper import create_finished_round, create_player
+
+PLAYER_1 = create_player("P1")
+PLAYER_2 = create_player("P2")
+
+def test_card_rules_are_only_triggered_by_their_cards():
+    win_blue_8 = PlayerHasToWinCardRule(PLAYER_1, BLUE_8)
+    win_pink_9 = PlayerHasToWinCardRule(PLAYER_2, PINK_9)
+    index = MissionTriggerIndex([win_blue_8, win_pink_9])
+
+    round_data = create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_6})
+
+    assert index.get_triggered_missions(round_data, is_last_round=False) == [win_blue_8]
+
+def test_number_rules_are_triggered_by_rockets_with_the_number():
+    never_win_with_1 = NeverWinWithNumberRule(number=1)
+    index = MissionTriggerIndex([never_win_with_1])
+
+    with_rocket = create_finished_round({PLAYER_1: BLUE_2, PLAYER_2: ROCKET_1})
+    without_number = create_finished_round({PLAYER_1: BLUE_6, PLAYER_2: ROCKET_2})
+
+    assert index.get_triggered_missions(with_rocket, is_last_round=False) == [never_win_with_1]
+    assert not index.get_triggered_missions(without_number, is_last_round=False)
+
+def test_player_rules_are_triggered_by_the_winner():
+    never_win = PlayerShouldNeverWinRule(player_that_should_never_win=PLAYER_2)
+    index = MissionTriggerIndex([never_win])
+
+    player_1_wins = create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_6})
+    player_2_wins = create_finished_round({PLAYER_1: BLUE_2, PLAYER_2: BLUE_6})
+
+    assert not index.get_triggered_missions(player_1_wins, is_last_round=False)
+    assert index.get_triggered_missions(player_2_wins, is_last_round=False) == [never_win]
+
+def test_end_of_game_rules_are_triggered_on_last_round():
+    win_once_with_9 = WinOnceWithNumberRule(number=9)
+    never_win = PlayerShouldNeverWinRule(player_that_should_never_win=PLAYER_2)
+    index = MissionTriggerIndex([win_once_with_9, never_win])
+
+    round_data = create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_6})
+
+    assert not index.get_triggered_missions(round_data, is_last_round=False)
+    assert index.get_triggered_missions(round_data, is_last_round=True) == [
+        win_once_with_9, never_win
+    ]
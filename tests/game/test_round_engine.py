@@ -1,8 +1,9 @@
+import asyncio
 import pytest
 import punq
 from src.model.card import BLUE_1, BLUE_3, BLUE_5, BLUE_9
 from src.game.interface.player_interface import PlayerInterface
-from src.game.round_engine import RoundEngine
+from src.game.round_engine import AsyncRoundEngine, RoundEngine
 from tests.helpers.test_data_creation_helper import create_player
 
 pytest_plugins = ["pytest_mock"]
@@ -38,10 +39,38 @@ def test_play_round(container):
     assert round_data.get_played_cards() == {BLUE_9, BLUE_3, BLUE_1, BLUE_5}
 
     for player in players:
-        player_interface.select_card.assert_any_call(player)
+        player_interface.select_card.assert_any_call(player, round_data)
+        assert len(player.card_hand.cards) == 0
+
+def test_async_play_round(mocker):
+    player_interface = mocker.AsyncMock()
+    engine = AsyncRoundEngine(player_interface)
+
+    player_1 = create_player("player1", [BLUE_9])
+    player_2 = create_player("player2", [BLUE_3])
+    player_3 = create_player("player3", [BLUE_1])
+    player_4 = create_player("player4", [BLUE_5])
+
+    players = [player_1, player_2, player_3, player_4]
+
+    given_players_play(player_interface, {
+        player_1: BLUE_9,
+        player_2: BLUE_3,
+        player_3: BLUE_1,
+        player_4: BLUE_5
+    })
+
+    round_data = asyncio.run(engine.play_round(players, starter_player = player_3))
+
+    assert round_data.get_played_cards() == {BLUE_9, BLUE_3, BLUE_1, BLUE_5}
+    assert [call.args[0] for call in player_interface.select_card.await_args_list] == [
+        player_3, player_4, player_1, player_2
+    ]
+    for player in players:
         assert len(player.card_hand.cards) == 0
 
 def given_players_play(mock_interface, mapping):
-    def select_card_side_effect(player):
+    def select_card_side_effect(player, round_data):
+        assert player not in round_data.card_by_player
         return mapping.get(player)
     mock_interface.select_card.side_effect = select_card_side_effect
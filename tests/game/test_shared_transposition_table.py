@@ -0,0 +1,71 @@
+import multiprocessing
+import pytest
+from src.game.double_dummy_solver import DoubleDummySolver
+from src.game.mission_rules import PlayerShouldNeverWinRule
+from src.game.shared_transposition_table import SharedTranspositionTable
+from src.model.card import BLUE_1, BLUE_5, ROCKET_2, ROCKET_4
+from tests.helpers.test_data_creation_helper import create_player
+
+@pytest.fixture
+def table():
+    with SharedTranspositionTable.create(bucket_count=1) as shared_table:
+        yield shared_table
+
+def store_from_other_process(name: str, key: int):
+    shared_table = SharedTranspositionTable.attach(name)
+    shared_table.store(key, value=7, depth=3)
+    shared_table.close()
+
+def test_stores_and_probes_positions(table):
+    assert table.probe(42) is None
+
+    assert table.store(42, value=1, depth=10)
+
+    assert table.probe(42) == (1, 10)
+    assert table.probe(43) is None
+
+def test_replaces_the_shallowest_entry_of_a_full_bucket(table):
+    for key, depth in [(1, 5), (2, 8), (3, 6), (4, 7)]:
+        table.store(key, value=0, depth=depth)
+
+    assert not table.store(5, value=0, depth=4)
+    assert table.store(6, value=0, depth=5)
+
+    assert table.probe(1) is None
+    assert table.probe(5) is None
+    assert table.probe(6) == (0, 5)
+    assert table.probe(2) == (0, 8)
+
+def test_same_position_is_always_overwritten(table):
+    table.store(9, value=0, depth=8)
+    table.store(9, value=1, depth=2)
+    assert table.probe(9) == (1, 2)
+
+def test_torn_entries_are_read_as_misses(table):
+    table.store(42, value=1, depth=10)
+    table._memory.buf[16] ^= 0xFF # pylint: disable=protected-access
+    assert table.probe(42) is None
+
+def test_entries_are_shared_between_processes(table):
+    process = multiprocessing.get_context("fork").Process(
+        target=store_from_other_process, args=(table.name, 2**64 - 1)
+    )
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert table.probe(2**64 - 1) == (7, 3)
+
+def test_solvers_reuse_failures_found_by_each_other(table):
+    players = [
+        create_player("P1", [ROCKET_4, BLUE_1]),
+        create_player("P2", [ROCKET_2, BLUE_5]),
+    ]
+    missions = [PlayerShouldNeverWinRule(players[0])]
+
+    first_solver = DoubleDummySolver(missions, transposition_table=table)
+    second_solver = DoubleDummySolver(missions, transposition_table=table)
+
+    assert not first_solver.is_achievable(players, players[1])
+    assert not second_solver.is_achievable(players, players[1])
+    assert second_solver.nodes == 1
@@ -0,0 +1,82 @@
+import io
+import json
+import random
+
+import pytest
+
+from src.game.simulation_runner import SimulationRunner, derive_game_seed, main, run_game
+from src.model.level_definition import LEVEL_1, LEVEL_3, LEVEL_5
+
+def test_run_game_is_reproducible_from_its_seed():
+    first = run_game(LEVEL_3, "random", 4, seed=7)
+    second = run_game(LEVEL_3, "random", 4, seed=7)
+
+    assert first == second
+    assert 1 <= first.rounds_played <= 10
+
+def test_run_game_reports_the_failed_mission():
+    results = [run_game(LEVEL_5, "lowest", 4, seed) for seed in range(20)]
+
+    assert any(not result.success for result in results)
+    for result in results:
+        if result.success:
+            assert result.failed_mission is None
+        else:
+            assert result.failed_mission == "PlayerShouldNeverWinRule"
+
+def test_run_streams_one_json_line_per_game():
+    output = io.StringIO()
+
+    summary = SimulationRunner(LEVEL_1, "random").run(games=5, seed=3, output=output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["seed"] for line in lines] == [derive_game_seed(3, index) for index in range(5)]
+    assert summary.games == 5
+    assert summary.successes == sum(line["success"] for line in lines)
+    assert summary.games_per_second > 0
+
+def test_process_pool_plays_the_same_games():
+    runner = SimulationRunner(LEVEL_3, "random", processes=2)
+
+    results = sorted(runner.iterate(games=6, seed=11), key=lambda result: result.game_index)
+
+    assert results == [
+        run_game(LEVEL_3, "random", 4, derive_game_seed(11, index), index) for index in range(6)
+    ]
+
+def test_game_seeds_are_independent_of_neighbouring_batches():
+    seeds = {
+        derive_game_seed(master_seed, index) for master_seed in range(10) for index in range(10)
+    }
+
+    assert len(seeds) == 100
+
+def test_run_game_leaves_the_module_random_generator_alone():
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+
+    run_game(LEVEL_1, "random", 4, seed=1)
+
+    assert random.random() == expected
+
+def test_unknown_bot_is_rejected():
+    with pytest.raises(ValueError):
+        SimulationRunner(LEVEL_1, "human")
+
+def test_main_writes_the_results_file(tmp_path, capsys):
+    path = tmp_path / "results.jsonl"
+
+    summary = main(["--games", "3", "--level", "LEVEL_2", "--output", str(path)])
+
+    assert summary.games == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    assert "games/second" in capsys.readouterr().out
+
+def test_runner_keeps_its_pool_between_parts_of_a_batch():
+    with SimulationRunner(LEVEL_1, "random", processes=2) as runner:
+        first = list(runner.iterate(games=3, seed=9))
+        second = list(runner.iterate(games=3, seed=9, first_game=3))
+
+    results = sorted(first + second, key=lambda result: result.game_index)
+    assert results == list(SimulationRunner(LEVEL_1).iterate(games=6, seed=9))
@@ -22,4 +22,4 @@ def create_test_game(num_of_rounds, rounds_already_played: list[RoundData]) -> G
     return game
 
 def create_random_id():
-    return random.randint(1, 1000)
\ No newline at end of file
+    return random.randint(1, 1_000_000_000)
\ No newline at end of file
@@ -0,0 +1,77 @@
+from src.model.canonical_position import CanonicalPosition
+from src.model.card import (
+    ALL_CARDS, BLUE_1, BLUE_2, BLUE_3, BLUE_5, BLUE_9, GREEN_4, PINK_1, PINK_2, PINK_3,
+    PINK_5, PINK_9, YELLOW_7, ROCKET_1, ROCKET_3, CardSet, CardType
+)
+from src.model.round_data import RoundData
+from tests.helpers.test_data_creation_helper import create_player
+
+def test_permuted_suits_share_the_same_key():
+    blue_position = CanonicalPosition.of(
+        [CardSet.of([BLUE_1, BLUE_9]), CardSet.of([BLUE_5, GREEN_4])]
+    )
+    pink_position = CanonicalPosition.of(
+        [CardSet.of([PINK_1, PINK_9]), CardSet.of([PINK_5, GREEN_4])]
+    )
+    assert blue_position.key == pink_position.key
+
+def test_mission_cards_are_part_of_the_position():
+    hands = [CardSet.of([BLUE_1, PINK_1]), CardSet.of([BLUE_2, PINK_2])]
+
+    mission_on_blue = CanonicalPosition.of(hands + [CardSet.of([BLUE_1])])
+    mission_on_pink = CanonicalPosition.of(hands + [CardSet.of([PINK_1])])
+    mission_on_other_card = CanonicalPosition.of(hands + [CardSet.of([PINK_2])])
+
+    assert mission_on_blue.key == mission_on_pink.key
+    assert mission_on_blue.key != mission_on_other_card.key
+
+def test_rank_compression_only_keeps_the_order_of_cards_in_play():
+    low = [CardSet.of([BLUE_1, ROCKET_1]), CardSet.of([BLUE_3])]
+    high = [CardSet.of([BLUE_5, ROCKET_3]), CardSet.of([BLUE_9])]
+
+    assert CanonicalPosition.of(low).key == CanonicalPosition.of(high).key
+    assert (
+        CanonicalPosition.of(low, compress_ranks=False).key
+        != CanonicalPosition.of(high, compress_ranks=False).key
+    )
+
+def test_rockets_are_never_swapped_with_colours():
+    assert (
+        CanonicalPosition.of([CardSet.of([ROCKET_1])]).key
+        != CanonicalPosition.of([CardSet.of([BLUE_1])]).key
+    )
+
+def test_cards_map_to_the_canonical_position_and_back():
+    card_sets = [CardSet.of([BLUE_2, PINK_3, YELLOW_7]), CardSet.of([PINK_9, ROCKET_3, GREEN_4])]
+    for compress_ranks in (True, False):
+        position = CanonicalPosition.of(card_sets, compress_ranks=compress_ranks)
+        canonical_hands = [CardSet(mask) for mask in position.key]
+        for card_set, canonical_hand in zip(card_sets, canonical_hands):
+            mapped = CardSet.of(position.to_canonical_card(card) for card in card_set)
+            assert mapped == canonical_hand
+            assert CardSet.of(
+                position.from_canonical_card(card) for card in canonical_hand
+            ) == card_set
+
+def test_uncompressed_identity_keeps_every_card():
+    position = CanonicalPosition.of([CardSet.of(ALL_CARDS)], compress_ranks=False)
+    assert position.key == (CardSet.of(ALL_CARDS).mask,)
+    assert position.suit_order == (CardType.BLUE, CardType.YELLOW, CardType.PINK, CardType.GREEN)
+
+def test_round_positions_include_trick_and_leader():
+    player_1 = create_player("P1", [BLUE_2, PINK_5])
+    player_2 = create_player("P2", [PINK_2, BLUE_5])
+    round_data = RoundData([player_1, player_2], leader=player_1)
+    swapped_round = RoundData([player_1, player_2], leader=player_2)
+
+    assert CanonicalPosition.of_round(round_data).key != CanonicalPosition.of_round(
+        swapped_round
+    ).key
+
+    player_1.play_card(BLUE_2)
+    round_data.add_played_card(player_1, BLUE_2)
+    position = CanonicalPosition.of_round(round_data, [CardSet.of([BLUE_5])])
+
+    assert position.key[0] == 0
+    assert position.from_canonical_card(position.to_canonical_card(BLUE_5)) == BLUE_5
+    assert CardSet(position.key[3]) == CardSet.of([position.to_canonical_card(BLUE_2)])
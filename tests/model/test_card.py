@@ -1,6 +1,60 @@
+import pickle
 import pytest
-from src.model.card import Card, CardType
+from src.model.card import (
+    Card, CardType, CardSet, CardsOperation, ALL_CARDS, ALL_ROCKETS,
+    BLUE_1, BLUE_2, YELLOW_1, PINK_1, GREEN_1, BLUE_9, YELLOW_9, PINK_9, GREEN_9,
+    ROCKET_1, ROCKET_2, ROCKET_3, ROCKET_4
+)
 
 def test_card_is_locked():
     with pytest.raises(RuntimeError):
         Card(CardType.BLUE, 1)
+
+def test_card_set_membership_and_size():
+    card_set = CardSet.of([BLUE_1, YELLOW_9, ROCKET_4])
+
+    assert BLUE_1 in card_set
+    assert ROCKET_4 in card_set
+    assert BLUE_2 not in card_set
+    assert len(card_set) == 3
+    assert len(CardSet()) == 0
+
+def test_card_set_iterates_in_deck_order():
+    card_set = CardSet.of([ROCKET_4, BLUE_1, YELLOW_9])
+    assert list(card_set) == [BLUE_1, YELLOW_9, ROCKET_4]
+    assert card_set.to_set() == {BLUE_1, YELLOW_9, ROCKET_4}
+
+def test_card_set_operations():
+    first = CardSet.of([BLUE_1, BLUE_2])
+    second = CardSet.of([BLUE_2, ROCKET_4])
+
+    assert first | second == CardSet.of([BLUE_1, BLUE_2, ROCKET_4])
+    assert first & second == CardSet.of([BLUE_2])
+    assert first - second == CardSet.of([BLUE_1])
+    assert first.with_card(ROCKET_4).without_card(BLUE_1) == second
+    assert CardSet.of([BLUE_2]).issubset(first)
+    assert not second.issubset(first)
+
+def test_card_set_of_all_cards():
+    assert len(CardSet.of(ALL_CARDS)) == len(ALL_CARDS)
+    assert list(CardSet.of(ALL_CARDS)) == ALL_CARDS
+
+def test_card_ids_match_deck_position():
+    assert [card.id for card in ALL_CARDS] == list(range(len(ALL_CARDS)))
+    assert CardsOperation.get_card_by_id(ROCKET_4.id) is ROCKET_4
+
+def test_get_cards_by_number_includes_the_rocket_of_that_number():
+    assert CardsOperation.get_cards_by_number(1) == {BLUE_1, YELLOW_1, PINK_1, GREEN_1, ROCKET_1}
+    assert CardsOperation.get_card_set_by_number(1) == CardSet.of(
+        [BLUE_1, YELLOW_1, PINK_1, GREEN_1, ROCKET_1]
+    )
+    assert CardsOperation.get_cards_by_number(9) == {BLUE_9, YELLOW_9, PINK_9, GREEN_9}
+    assert CardsOperation.get_cards_by_number(10) == frozenset()
+
+def test_get_cards_by_type():
+    assert ALL_ROCKETS == {ROCKET_1, ROCKET_2, ROCKET_3, ROCKET_4}
+    assert CardsOperation.get_card_set_by_type(CardType.ROCKET) == CardSet.of(ALL_ROCKETS)
+    assert len(CardsOperation.get_cards_by_type(CardType.BLUE)) == 9
+
+def test_card_unpickles_to_same_instance():
+    assert pickle.loads(pickle.dumps(YELLOW_9)) is YELLOW_9
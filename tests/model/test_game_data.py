@@ -1,6 +1,6 @@
 import pytest
 
-from src.model.card import BLUE_6, BLUE_8
+from src.model.card import BLUE_6, BLUE_8, BLUE_9, PINK_9, ROCKET_1, CardSet
 from tests.helpers.test_data_creation_helper import (
     create_finished_round,
     create_test_game,
@@ -8,6 +8,7 @@ from tests.helpers.test_data_creation_helper import (
 )
 
 PLAYER_1 = create_player("Player 1")
+PLAYER_2 = create_player("Player 2")
 
 def test_game_finished():
     game_round = create_finished_round({})
@@ -29,3 +30,42 @@ def test_get_last_round_raises_error_when_there_are_no_rounds():
     game = create_test_game(num_of_rounds=8, rounds_already_played=[])
     with pytest.raises(ValueError):
         game.get_last_round()
+
+def test_get_all_cards_played():
+    round_1 = create_finished_round({PLAYER_1: BLUE_8})
+    round_2 = create_finished_round({PLAYER_1: BLUE_6})
+    game = create_test_game(num_of_rounds=8, rounds_already_played=[round_1, round_2])
+    assert game.get_all_cards_played() == {BLUE_8, BLUE_6}
+    assert game.get_played_card_set() == CardSet.of([BLUE_8, BLUE_6])
+
+def test_statistics_are_updated_when_rounds_are_added():
+    rounds = [
+        create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_9}),
+        create_finished_round({PLAYER_1: ROCKET_1, PLAYER_2: PINK_9}),
+    ]
+    game = create_test_game(num_of_rounds=8, rounds_already_played=rounds)
+
+    assert game.get_round_winners() == [PLAYER_2, PLAYER_1]
+    assert game.get_winning_card_set() == CardSet.of([BLUE_9, ROCKET_1])
+    assert game.count_wins_with_number(9) == 1
+    assert game.count_wins_with_number(1) == 1
+    assert game.count_wins_with_number(8) == 0
+    assert game.count_tricks_won(PLAYER_1) == 1
+    assert game.count_tricks_won(PLAYER_2) == 1
+    assert game.get_played_card_set() == CardSet.of([BLUE_8, BLUE_9, ROCKET_1, PINK_9])
+
+def test_remove_last_round_reverts_statistics():
+    round_1 = create_finished_round({PLAYER_1: BLUE_8, PLAYER_2: BLUE_9})
+    round_2 = create_finished_round({PLAYER_1: ROCKET_1, PLAYER_2: PINK_9})
+    game = create_test_game(num_of_rounds=8, rounds_already_played=[round_1])
+    progress_hash = game.get_progress_hash()
+    game.add_round(round_2)
+
+    assert game.remove_last_round() == round_2
+    assert game.rounds == [round_1]
+    assert game.get_round_winners() == [PLAYER_2]
+    assert game.get_winning_card_set() == CardSet.of([BLUE_9])
+    assert game.count_wins_with_number(1) == 0
+    assert game.count_tricks_won(PLAYER_1) == 0
+    assert game.get_played_card_set() == CardSet.of([BLUE_8, BLUE_9])
+    assert game.get_progress_hash() == progress_hash
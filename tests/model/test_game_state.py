@@ -0,0 +1,79 @@
+import pytest
+from src.model.card import (
+    BLUE_1, BLUE_3, BLUE_7, BLUE_9, PINK_2, YELLOW_5, ROCKET_1, ROCKET_4, CardSet
+)
+from src.model.game_state import GameState
+from tests.helpers.test_data_creation_helper import create_player
+
+@pytest.fixture
+def state():
+    players = [
+        create_player("P1", [BLUE_1, ROCKET_4]),
+        create_player("P2", [BLUE_9, PINK_2]),
+        create_player("P3", [YELLOW_5, ROCKET_1]),
+    ]
+    return GameState(players, leader=players[0])
+
+def test_current_player_and_legal_cards(state):
+    player_1, player_2, _ = state.players
+    assert state.get_current_player() == player_1
+    assert state.get_legal_card_set() == CardSet.of([BLUE_1, ROCKET_4])
+
+    state.play_card(BLUE_1)
+
+    assert state.get_current_player() == player_2
+    assert state.get_legal_card_set() == CardSet.of([BLUE_9])
+
+def test_illegal_card_is_rejected(state):
+    state.play_card(BLUE_1)
+    with pytest.raises(ValueError):
+        state.play_card(PINK_2)
+
+def test_completing_a_round_starts_next_round_with_winner(state):
+    _, player_2, _ = state.players
+    state.play_card(BLUE_1)
+    state.play_card(BLUE_9)
+    completed_round = state.play_card(YELLOW_5)
+
+    assert completed_round.get_winner() == (player_2, BLUE_9)
+    assert state.game_data.rounds == [completed_round]
+    assert state.get_leader() == player_2
+    assert state.get_current_player() == player_2
+
+def test_undo_restores_the_position(state):
+    initial_hash = state.get_state_hash()
+    hashes = []
+    for card in [BLUE_1, BLUE_9, YELLOW_5, PINK_2, ROCKET_1]:
+        hashes.append(state.get_state_hash())
+        state.play_card(card)
+
+    for expected_hash in reversed(hashes):
+        state.undo_card()
+        assert state.get_state_hash() == expected_hash
+
+    player_1, player_2, player_3 = state.players
+    assert state.get_state_hash() == initial_hash
+    assert state.game_data.rounds == []
+    assert state.game_data.get_played_card_set() == CardSet()
+    assert state.get_current_player() == player_1
+    assert player_1.card_hand.card_set == CardSet.of([BLUE_1, ROCKET_4])
+    assert player_2.card_hand.card_set == CardSet.of([BLUE_9, PINK_2])
+    assert player_3.card_hand.card_set == CardSet.of([YELLOW_5, ROCKET_1])
+
+def test_undo_without_cards_played_raises_error(state):
+    with pytest.raises(ValueError):
+        state.undo_card()
+
+def test_play_full_game(state):
+    for card in [BLUE_1, BLUE_9, YELLOW_5, PINK_2, ROCKET_1, ROCKET_4]:
+        state.play_card(card)
+
+    assert state.is_finished()
+    assert state.game_data.get_winning_card_set() == CardSet.of([BLUE_9, ROCKET_4])
+    with pytest.raises(ValueError):
+        state.play_card(BLUE_7)
+    state.undo_card()
+    assert not state.is_finished()
+    assert state.game_data.count_tricks_won(state.players[0]) == 0
+    assert state.get_legal_card_set() == CardSet.of([ROCKET_4])
+    assert BLUE_3 not in state.get_legal_card_set()
@@ -0,0 +1,59 @@
+import gc
+import sys
+from enum import Enum
+from types import FunctionType, ModuleType
+
+from src.game.card_dealer import CardDealer
+from src.game.mission_rules import PlayerHasToWinCardRule
+from src.model.card import ALL_CARDS, Card, BLUE_9
+from src.model.game_data import GameData
+from src.model.game_missions_data import GameMissionsData
+from src.model.round_data import RoundData
+from tests.helpers.test_data_creation_helper import create_player
+
+# Budget for everything owned by one table after a full 40-card, 4-player game
+BYTES_PER_TABLE_BUDGET = 12_000
+
+def test_model_objects_have_no_instance_dict():
+    player = create_player("P1", [BLUE_9])
+    objects = [BLUE_9, player, player.card_hand, RoundData([player]), GameData(10)]
+    for obj in objects:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+def test_memory_per_table_is_within_budget():
+    table = play_full_game()
+    assert deep_size_of(table) <= BYTES_PER_TABLE_BUDGET
+
+def play_full_game():
+    players = [create_player(f"P{index}") for index in range(4)]
+    players, captain = CardDealer().deal_cards(players)
+    game_data = GameData(len(ALL_CARDS) // len(players))
+    missions_data = GameMissionsData.make({PlayerHasToWinCardRule(players[0], BLUE_9)})
+
+    leader = captain
+    while not game_data.is_finished():
+        round_data = RoundData(players)
+        start = players.index(leader)
+        for offset in range(len(players)):
+            player = players[(start + offset) % len(players)]
+            card = player.card_hand.get_playable_cards(round_data.round_type)[0]
+            player.play_card(card)
+            round_data.add_played_card(player, card)
+        game_data.add_round(round_data)
+        leader, _ = round_data.get_winner()
+
+    return players, game_data, missions_data
+
+def deep_size_of(root) -> int:
+    """Size of every object reachable from root, except shared cards, enums and code."""
+    seen = {id(card) for card in ALL_CARDS}
+    pending = [root]
+    total = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType, Enum, Card)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return total
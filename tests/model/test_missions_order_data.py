@@ -84,3 +84,100 @@ def test_both_constraints_violated(sample_missions):
     assert not order_data.is_order_respected([], second)
     # no dependency, but wrong position, should fail
     assert not order_data.is_order_respected([], third)
+
+
+def test_prerequisites_and_ranks_are_compiled(sample_missions):
+    first, second, third = sample_missions
+    order_data = (
+        MissionsOrderData.builder()
+        .add_order_constraint(first, second)
+        .add_order_constraint(second, third)
+        .add_order_constraint(first, third)
+        .build()
+    )
+
+    assert order_data.prerequisites[third] == {first, second}
+    assert order_data.prerequisites[first] == frozenset()
+    assert order_data.ranks == {first: 0, second: 1, third: 2}
+
+
+def test_order_respected_by_mask(sample_missions):
+    first, second, third = sample_missions
+    order_data = (
+        MissionsOrderData.builder()
+        .add_order_constraint(first, second)
+        .set_fixed_position(third, 3)
+        .build()
+    )
+    first_bit = order_data.mission_bits[first]
+
+    assert not order_data.is_order_respected_by_mask(0, 0, second)
+    assert order_data.is_order_respected_by_mask(first_bit, 1, second)
+    assert not order_data.is_order_respected_by_mask(first_bit, 1, third)
+    assert order_data.is_order_respected_by_mask(first_bit, 2, third)
+
+
+def test_cycle_is_rejected(sample_missions):
+    first, second, third = sample_missions
+    builder = (
+        MissionsOrderData.builder()
+        .add_order_constraint(first, second)
+        .add_order_constraint(second, third)
+        .add_order_constraint(third, first)
+    )
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+
+def test_duplicated_fixed_position_is_rejected(sample_missions):
+    first, second, _ = sample_missions
+    builder = (
+        MissionsOrderData.builder()
+        .set_fixed_position(first, 1)
+        .set_fixed_position(second, 1)
+    )
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+
+def test_fixed_position_before_prerequisites_is_rejected(sample_missions):
+    first, second, third = sample_missions
+    builder = (
+        MissionsOrderData.builder()
+        .add_order_constraint(first, second)
+        .add_order_constraint(second, third)
+        .set_fixed_position(third, 2)
+    )
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+
+def test_fixed_position_after_dependent_is_rejected(sample_missions):
+    first, second, _ = sample_missions
+    builder = (
+        MissionsOrderData.builder()
+        .add_order_constraint(first, second)
+        .set_fixed_position(first, 3)
+        .set_fixed_position(second, 2)
+    )
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+
+def test_fixed_position_past_the_last_mission_is_rejected(sample_missions):
+    first, second, _ = sample_missions
+    builder = (
+        MissionsOrderData.builder()
+        .set_fixed_position(first, 1)
+        .set_fixed_position(second, 4)
+        .set_mission_count(3)
+    )
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+    assert builder.set_mission_count(4).build().fixed_positions == {first: 1, second: 4}
@@ -1,6 +1,8 @@
 import pytest
 from src.model.player_hand import CardHand
-from src.model.card import CardType, BLUE_3, BLUE_4, BLUE_5, ROCKET_4, YELLOW_4, ROCKET_1
+from src.model.card import (
+    CardType, CardSet, BLUE_3, BLUE_4, BLUE_5, ROCKET_4, YELLOW_4, ROCKET_1
+)
 from tests.helpers.test_data_creation_helper import create_player
 
 def test_not_captain():
@@ -37,7 +39,64 @@ def test_get_playable_cards_returns_only_matching_type():
     result = CardHand(cards).get_playable_cards(CardType.BLUE)
     assert result == [BLUE_3, BLUE_4, BLUE_5]
 
+def test_get_playable_cards_keeps_the_order_the_cards_were_added():
+    cards = [BLUE_5, ROCKET_4, BLUE_3, YELLOW_4, BLUE_4]
+    hand = CardHand(cards)
+    assert hand.get_playable_cards(CardType.BLUE) == [BLUE_5, BLUE_3, BLUE_4]
+    assert hand.get_playable_cards(CardType.ROCKET) == [ROCKET_4]
+    assert hand.get_playable_cards(None) == cards
+
+def test_add_card_already_in_hand():
+    hand = CardHand([BLUE_3])
+
+    with pytest.raises(ValueError):
+        hand.add_card(BLUE_3)
+    assert hand.cards == [BLUE_3]
+
+def test_hand_created_with_a_card_twice():
+    with pytest.raises(ValueError):
+        CardHand([BLUE_3, BLUE_4, BLUE_3])
+
+def test_changing_the_cards_copy_does_not_change_the_hand():
+    hand = CardHand([BLUE_3])
+
+    hand.cards.append(BLUE_4)
+    assert hand.cards == [BLUE_3]
+    assert not hand.has_card(BLUE_4)
+
 def test_get_playable_cards_returns_all_if_no_matching_type():
     cards = [BLUE_3, BLUE_4, BLUE_5, ROCKET_4, YELLOW_4, ROCKET_1]
     result = CardHand(cards).get_playable_cards(CardType.GREEN)
     assert result == cards
+
+def test_player_hash_does_not_change_when_cards_are_played():
+    player = create_player("John", [BLUE_3, BLUE_4])
+    players = {player}
+
+    player.play_card(BLUE_3)
+    assert player in players
+
+def test_get_playable_card_set():
+    hand = CardHand([BLUE_5, ROCKET_4, BLUE_3, YELLOW_4])
+    assert hand.get_playable_card_set(CardType.BLUE) == CardSet.of([BLUE_3, BLUE_5])
+    assert hand.get_playable_card_set(CardType.GREEN) == hand.card_set
+    assert hand.get_playable_card_set(None) == hand.card_set
+
+def test_has_card_type():
+    hand = CardHand([BLUE_5, ROCKET_4])
+    assert hand.has_card_type(CardType.ROCKET)
+    assert not hand.has_card_type(CardType.YELLOW)
+
+    hand.remove_card(ROCKET_4)
+    assert not hand.has_card_type(CardType.ROCKET)
+
+def test_hands_with_same_cards_are_equal_regardless_of_order():
+    first = CardHand([BLUE_3, ROCKET_4, YELLOW_4])
+    second = CardHand([YELLOW_4, BLUE_3, ROCKET_4])
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.cards == [BLUE_3, ROCKET_4, YELLOW_4]
+
+def test_get_playable_cards_returns_all_if_no_type():
+    cards = [BLUE_3, ROCKET_4, YELLOW_4]
+    assert CardHand(cards).get_playable_cards(None) == cards
@@ -104,3 +104,54 @@ def test_get_winner_rocket_highest():
     winner, winning_card = round_data.get_winner()
     assert winner == john
     assert winning_card == ROCKET_4
+
+def test_has_played_card():
+    john = create_player("John", [BLUE_3])
+    julie = create_player("Julie", [BLUE_7])
+
+    round_data = RoundData(players = [john, julie])
+    round_data.add_played_card(john, BLUE_3)
+
+    assert round_data.has_played_card(BLUE_3)
+    assert not round_data.has_played_card(BLUE_7)
+    assert round_data.get_played_cards() == {BLUE_3}
+
+def test_get_winner_is_updated_as_cards_are_played():
+    """Test that the winner is tracked while the round is in progress."""
+    john = create_player("John", [BLUE_3])
+    julie = create_player("Julie", [ROCKET_1])
+    matthew = create_player("Matthew", [BLUE_7])
+
+    round_data = RoundData(players = [john, julie, matthew])
+
+    round_data.add_played_card(john, BLUE_3)
+    assert round_data.get_winner() == (john, BLUE_3)
+
+    round_data.add_played_card(julie, ROCKET_1)
+    assert round_data.get_winner() == (julie, ROCKET_1)
+
+    # A higher card of the round type does not beat a rocket
+    round_data.add_played_card(matthew, BLUE_7)
+    assert round_data.get_winner() == (julie, ROCKET_1)
+
+def test_remove_last_played_card_restores_the_winner():
+    john = create_player("John", [BLUE_3])
+    julie = create_player("Julie", [BLUE_7])
+    matthew = create_player("Matthew", [ROCKET_1])
+
+    round_data = RoundData(players = [john, julie, matthew])
+    round_data.add_played_card(john, BLUE_3)
+    round_data.add_played_card(julie, BLUE_7)
+    state_hash = round_data.get_state_hash()
+    round_data.add_played_card(matthew, ROCKET_1)
+
+    assert round_data.remove_last_played_card() == (matthew, ROCKET_1)
+    assert round_data.get_winner() == (julie, BLUE_7)
+    assert round_data.get_state_hash() == state_hash
+
+    round_data.remove_last_played_card()
+    round_data.remove_last_played_card()
+    assert round_data.round_type is None
+    assert round_data.get_leader() is None
+    with pytest.raises(ValueError):
+        round_data.remove_last_played_card()
@@ -0,0 +1,69 @@
+from src.model.card import BLUE_1, BLUE_3, BLUE_7, PINK_2, ROCKET_4, YELLOW_5
+from src.model.game_data import GameData
+from src.model.player_hand import CardHand, Player
+from src.model.round_data import RoundData
+from src.model.zobrist import Zobrist, ZobristKind
+
+def make_players(first_cards, second_cards):
+    return [
+        Player(1, "P1", CardHand(list(first_cards))),
+        Player(2, "P2", CardHand(list(second_cards)))
+    ]
+
+def test_keys_are_64_bit_and_distinct():
+    keys = {
+        Zobrist.card_key(BLUE_1),
+        Zobrist.card_key(BLUE_3),
+        Zobrist.player_card_key(ZobristKind.TRICK, 1, BLUE_1),
+        Zobrist.player_card_key(ZobristKind.TRICK, 2, BLUE_1),
+        Zobrist.player_card_key(ZobristKind.CAPTURED, 1, BLUE_1),
+        Zobrist.player_key(ZobristKind.LEADER, 1),
+    }
+    assert len(keys) == 6
+    assert all(0 <= key < 1 << 64 for key in keys)
+
+def test_hand_hash_is_updated_incrementally():
+    hand = CardHand([BLUE_1, BLUE_3])
+    hand.add_card(ROCKET_4)
+    hand.remove_card(BLUE_1)
+    assert hand.zobrist_hash == CardHand([ROCKET_4, BLUE_3]).zobrist_hash
+
+def test_swapping_cards_between_players_changes_the_hash():
+    first = RoundData(make_players([BLUE_1], [BLUE_3]))
+    second = RoundData(make_players([BLUE_3], [BLUE_1]))
+    assert first.get_state_hash() != second.get_state_hash()
+
+def test_same_position_has_same_hash():
+    players = make_players([BLUE_1, PINK_2], [BLUE_3, YELLOW_5])
+    round_data = RoundData(players, leader=players[0])
+    players[0].play_card(BLUE_1)
+    round_data.add_played_card(players[0], BLUE_1)
+
+    other_players = make_players([PINK_2], [YELLOW_5, BLUE_3])
+    other_round = RoundData(other_players, leader=other_players[0])
+    other_round.add_played_card(other_players[0], BLUE_1)
+
+    assert round_data.get_state_hash() == other_round.get_state_hash()
+
+def test_leader_is_part_of_the_hash():
+    players = make_players([BLUE_1], [BLUE_3])
+    assert RoundData(players, players[0]).get_state_hash() != \
+        RoundData(players, players[1]).get_state_hash()
+
+def test_game_state_hash_covers_who_captured_the_cards():
+    players = make_players([BLUE_7], [BLUE_3])
+    won_by_first = RoundData(players)
+    won_by_first.add_played_card(players[0], BLUE_7)
+    won_by_first.add_played_card(players[1], BLUE_3)
+
+    won_by_second = RoundData(players)
+    won_by_second.add_played_card(players[0], BLUE_3)
+    won_by_second.add_played_card(players[1], BLUE_7)
+
+    first_game = GameData(2, [won_by_first])
+    second_game = GameData(2, [won_by_second])
+    current_round = RoundData(players, players[0])
+
+    assert first_game.get_progress_hash() != second_game.get_progress_hash()
+    assert first_game.get_state_hash(current_round) != second_game.get_state_hash(current_round)
+    assert GameData(2).get_state_hash(current_round) == current_round.get_state_hash()